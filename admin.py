@@ -0,0 +1,160 @@
+import hmac
+from datetime import datetime, time as day_time, timedelta
+
+import streamlit as st
+
+from admin_queries import (
+    COMPLETENESS_ALL, COMPLETENESS_COMPLETE, COMPLETENESS_INCOMPLETE, REQUIRED_DOCUMENTS,
+    ApplicationFilter, ApplicationQueries,
+)
+from bulk_export import LINK_TTL_SECONDS, export_secret, signed_url
+from content_store import CONTENT_STORE
+from events import KST
+from intake_store import PARTICIPATION_TYPES
+from upload_spool import DOCUMENT_KINDS
+
+# --- 운영사무국 대시보드 ---
+# 공개 페이지(app.py)와 별도로 실행하는 운영자용 페이지입니다.
+#   streamlit run admin.py --server.port 8503
+# 비밀번호는 .streamlit/secrets.toml 의 admin_password 로 설정합니다 (저장소에 올리지 마세요).
+# 심사용 내려받기(CSV/XLSX/ZIP)는 bulk_export.py 서버가 스트리밍으로 보내며, 여기서는 현재 조건의 서명된 링크만 만듭니다.
+# 목록은 한 페이지씩만 조회해 세션에 그 페이지만 보관하며, 회차·유형별 집계와 조건별 건수는 COUNT_TTL 초 동안 캐시합니다.
+PAGE_TITLE = "교류회 신청 관리"
+PAGE_SIZES = (25, 50, 100)
+COUNT_TTL_SECONDS = 30
+COMPLETENESS_LABELS = {COMPLETENESS_ALL: "전체", COMPLETENESS_COMPLETE: "서류 완비", COMPLETENESS_INCOMPLETE: "서류 미비"}
+
+st.set_page_config(page_title=PAGE_TITLE, page_icon="🗂️", layout="wide")
+
+
+@st.cache_resource
+def get_queries():
+    return ApplicationQueries()
+
+
+@st.cache_data(ttl=COUNT_TTL_SECONDS, show_spinner=False)
+def cached_summary():
+    return get_queries().summary()
+
+
+@st.cache_data(ttl=COUNT_TTL_SECONDS, show_spinner=False)
+def cached_count(application_filter):
+    return get_queries().count(application_filter)
+
+
+def require_password():
+    """비밀번호를 확인한 세션이면 True. 설정이 없거나 틀리면 로그인 폼을 그리고 False."""
+    if st.session_state.get("admin_authenticated"):
+        return True
+    try:
+        expected = st.secrets.get("admin_password")
+    except FileNotFoundError:  # secrets.toml 이 없음
+        expected = None
+    if not expected:
+        st.error("관리자 비밀번호가 설정되지 않았습니다. .streamlit/secrets.toml 에 admin_password 를 지정하세요.")
+        return False
+    with st.form("admin_login"):
+        password = st.text_input("관리자 비밀번호", type="password")
+        submitted = st.form_submit_button("로그인")
+    if submitted:
+        if hmac.compare_digest(password.encode(), str(expected).encode()):
+            st.session_state.admin_authenticated = True
+            st.rerun()
+        st.error("비밀번호가 올바르지 않습니다.")
+    return False
+
+
+def display_summary():
+    rows = cached_summary()
+    total = sum(count for _, _, count, _ in rows)
+    complete = sum(complete or 0 for _, _, _, complete in rows)
+    columns = st.columns(3)
+    columns[0].metric("전체 신청", f"{total:,}건")
+    columns[1].metric("서류 완비", f"{complete:,}건")
+    columns[2].metric("서류 미비", f"{total - complete:,}건")
+    if rows:
+        st.dataframe(
+            [{"회차": f"제{round_number}회", "참가 유형": participation_type, "신청": count, "서류 완비": complete or 0}
+             for round_number, participation_type, count, complete in rows],
+            hide_index=True, width="stretch",
+        )
+
+
+def filter_controls():
+    rounds = [event.round for event in CONTENT_STORE.get("events").events]
+    columns = st.columns([1, 1, 2, 1, 1])
+    round_number = columns[0].selectbox("회차", [None, *rounds], format_func=lambda value: "전체" if value is None else f"제{value}회")
+    participation_type = columns[1].selectbox("참가 유형", [None, *PARTICIPATION_TYPES], format_func=lambda value: value or "전체")
+    period = columns[2].date_input("제출일", value=(), format="YYYY-MM-DD")
+    completeness = columns[3].selectbox("서류", list(COMPLETENESS_LABELS), format_func=COMPLETENESS_LABELS.get)
+    page_size = columns[4].selectbox("페이지당", PAGE_SIZES, index=1)
+    submitted_from = submitted_to = None
+    if len(period) >= 1:
+        submitted_from = datetime.combine(period[0], day_time.min, KST).isoformat(timespec="milliseconds")
+    if len(period) == 2:
+        submitted_to = datetime.combine(period[1] + timedelta(days=1), day_time.min, KST).isoformat(timespec="milliseconds")
+    return ApplicationFilter(round_number, participation_type, submitted_from, submitted_to, completeness), page_size
+
+
+def display_applications(application_filter, page_size):
+    # 페이지 이동은 커서 스택으로 합니다. 조건이 바뀌면 첫 페이지로 돌아갑니다.
+    state_key = (application_filter, page_size)
+    if st.session_state.get("admin_page_key") != state_key:
+        st.session_state.admin_page_key = state_key
+        st.session_state.admin_cursors = [None]
+    cursors = st.session_state.admin_cursors
+    page = get_queries().page(application_filter, cursors[-1], page_size)
+    total = cached_count(application_filter)
+
+    st.caption(f"조건에 맞는 신청 {total:,}건 · {len(cursors)}쪽")
+    st.dataframe(
+        [{
+            "접수 번호": row["submission_id"][:12].upper(),
+            "회차": row["round"],
+            "참가 유형": row["participation_type"],
+            "기업명": row["company_name"],
+            "사업자등록번호": row["business_number"],
+            "대표자": row["representative"],
+            "담당자": row["contact_name"],
+            "이메일": row["email"],
+            "연락처": row["phone"],
+            "제출 시각": row["submitted_at"][:19].replace("T", " "),
+            "서류": f"{len(row['documents'])}/{REQUIRED_DOCUMENTS}",
+            "누락 서류": ", ".join(label for kind, (label, _) in DOCUMENT_KINDS.items() if kind not in row["documents"]),
+        } for row in page.rows],
+        hide_index=True, width="stretch",
+    )
+    previous_column, next_column, _ = st.columns([1, 1, 6])
+    if previous_column.button("이전", disabled=len(cursors) == 1):
+        cursors.pop()
+        st.rerun()
+    if next_column.button("다음", disabled=page.next_cursor is None):
+        cursors.append(page.next_cursor)
+        st.rerun()
+
+
+def display_exports(application_filter):
+    secret = export_secret()
+    if not secret:
+        st.caption("내려받기 서버의 export_secret 이 설정되지 않아 내보내기 링크를 만들 수 없습니다.")
+        return
+    st.caption(f"현재 조건의 신청자 목록과 제출 서류를 내려받습니다. 링크는 {LINK_TTL_SECONDS // 60}분 동안 유효합니다.")
+    columns = st.columns([1, 1, 1, 5])
+    columns[0].link_button("CSV", signed_url("csv", application_filter, secret))
+    columns[1].link_button("Excel", signed_url("xlsx", application_filter, secret))
+    columns[2].link_button("서류 ZIP", signed_url("zip", application_filter, secret))
+
+
+def main():
+    st.title(PAGE_TITLE)
+    if not require_password():
+        return
+    display_summary()
+    st.divider()
+    application_filter, page_size = filter_controls()
+    display_applications(application_filter, page_size)
+    display_exports(application_filter)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from intake_store import DEFAULT_DB_PATH, connect
+from upload_spool import DOCUMENT_KINDS
+
+# --- 운영 대시보드 조회 ---
+# 접수 DB 를 읽기 전용으로 열어 필터·페이지 단위로만 조회합니다. 테이블 전체를 메모리에 올리지 않습니다.
+# - 정렬은 (제출 시각, id) 내림차순이고, 다음 페이지는 마지막 행의 (제출 시각, id) 보다 앞선 행을 읽는 keyset 방식입니다.
+#   OFFSET 을 쓰지 않으므로 뒤쪽 페이지도 첫 페이지와 같은 비용입니다.
+# - 회차·참가 유형·제출 시각 조건은 applications 의 (round, participation_type, submitted_at, id) 색인을 탑니다.
+# - 서류 완비 여부는 attachments 기본 키(submission_id, kind)로 신청별 서류 수를 세어 판단합니다.
+COMPLETENESS_ALL, COMPLETENESS_COMPLETE, COMPLETENESS_INCOMPLETE = "all", "complete", "incomplete"
+REQUIRED_DOCUMENTS = len(DOCUMENT_KINDS)
+DOCUMENT_COUNT_SQL = "(SELECT COUNT(*) FROM attachments WHERE attachments.submission_id = applications.submission_id)"
+ROW_FIELDS = (
+    "id", "submission_id", "round", "participation_type", "company_name", "business_number",
+    "representative", "contact_name", "email", "phone", "submitted_at",
+)
+
+
+@dataclass(frozen=True)
+class ApplicationFilter:
+    round: int | None = None
+    participation_type: str | None = None
+    submitted_from: str | None = None  # ISO 8601 (KST), 이상
+    submitted_to: str | None = None    # ISO 8601 (KST), 미만
+    completeness: str = COMPLETENESS_ALL
+
+    def where(self):
+        """WHERE 절과 인자. 지정된 조건만 AND 로 묶습니다."""
+        clauses, params = [], []
+        if self.round is not None:
+            clauses.append("round = ?")
+            params.append(self.round)
+        if self.participation_type:
+            clauses.append("participation_type = ?")
+            params.append(self.participation_type)
+        if self.submitted_from:
+            clauses.append("submitted_at >= ?")
+            params.append(self.submitted_from)
+        if self.submitted_to:
+            clauses.append("submitted_at < ?")
+            params.append(self.submitted_to)
+        if self.completeness == COMPLETENESS_COMPLETE:
+            clauses.append(f"{DOCUMENT_COUNT_SQL} >= {REQUIRED_DOCUMENTS}")
+        elif self.completeness == COMPLETENESS_INCOMPLETE:
+            clauses.append(f"{DOCUMENT_COUNT_SQL} < {REQUIRED_DOCUMENTS}")
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+
+@dataclass(frozen=True)
+class ApplicationPage:
+    rows: tuple          # dict 행 (ROW_FIELDS + documents: 제출된 서류 종류 튜플)
+    next_cursor: tuple | None  # 다음 페이지를 읽을 (submitted_at, id), 마지막 페이지면 None
+
+
+class ApplicationQueries:
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        self.db_path = Path(db_path)
+        self._local = threading.local()
+        connect(self.db_path).close()  # 스키마·색인이 없으면 만들어 둡니다
+
+    def _connection(self):
+        # sqlite3 연결은 스레드 사이에 공유하지 않습니다. 대시보드는 읽기만 하므로 읽기 전용으로 엽니다.
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True, timeout=30)
+            self._local.connection = connection
+        return connection
+
+    def page(self, application_filter, cursor=None, limit=50):
+        """cursor(이전 페이지의 next_cursor) 다음부터 limit 개 행."""
+        where, params = application_filter.where()
+        if cursor is not None:
+            where += (" AND " if where else " WHERE ") + "(submitted_at, id) < (?, ?)"
+            params = [*params, *cursor]
+        rows = self._connection().execute(
+            f"SELECT {', '.join(ROW_FIELDS)} FROM applications{where} ORDER BY submitted_at DESC, id DESC LIMIT ?",
+            (*params, limit + 1),
+        ).fetchall()
+        has_more = len(rows) > limit
+        records = [dict(zip(ROW_FIELDS, row)) for row in rows[:limit]]
+        documents = self.documents([record["submission_id"] for record in records])
+        for record in records:
+            record["documents"] = documents.get(record["submission_id"], ())
+        last = records[-1] if records else None
+        return ApplicationPage(tuple(records), (last["submitted_at"], last["id"]) if has_more and last else None)
+
+    def documents(self, submission_ids):
+        """{submission_id: (서류 종류, ...)} — 한 페이지 분량만 조회합니다."""
+        if not submission_ids:
+            return {}
+        found = {}
+        rows = self._connection().execute(
+            f"SELECT submission_id, kind FROM attachments WHERE submission_id IN ({', '.join('?' * len(submission_ids))}) ORDER BY kind",
+            submission_ids,
+        )
+        for submission_id, kind in rows:
+            found.setdefault(submission_id, []).append(kind)
+        return {submission_id: tuple(kinds) for submission_id, kinds in found.items()}
+
+    def count(self, application_filter):
+        where, params = application_filter.where()
+        return self._connection().execute(f"SELECT COUNT(*) FROM applications{where}", params).fetchone()[0]
+
+    def summary(self):
+        """(회차, 참가 유형, 신청 수, 서류 완비 수) 목록."""
+        return self._connection().execute(
+            f"SELECT round, participation_type, COUNT(*), SUM({DOCUMENT_COUNT_SQL} >= {REQUIRED_DOCUMENTS}) "
+            "FROM applications GROUP BY round, participation_type ORDER BY round, participation_type"
+        ).fetchall()
+
+    def attachments(self, submission_ids):
+        """{submission_id: [(kind, file_name, sha256, size), ...]} — 주어진 신청분만 조회합니다."""
+        if not submission_ids:
+            return {}
+        found = {}
+        rows = self._connection().execute(
+            f"SELECT submission_id, kind, file_name, sha256, size FROM attachments "
+            f"WHERE submission_id IN ({', '.join('?' * len(submission_ids))}) ORDER BY submission_id, kind",
+            submission_ids,
+        )
+        for submission_id, *attachment in rows:
+            found.setdefault(submission_id, []).append(tuple(attachment))
+        return found
+
+    def iter_pages(self, application_filter, batch_size=500):
+        """조건에 맞는 모든 행을 batch_size 개씩 keyset 으로 읽어 페이지 단위로 내보냅니다 (내보내기용)."""
+        cursor = None
+        while True:
+            page = self.page(application_filter, cursor, batch_size)
+            if page.rows:
+                yield page.rows
+            if page.next_cursor is None:
+                return
+            cursor = page.next_cursor
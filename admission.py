@@ -0,0 +1,207 @@
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import streamlit as st
+from streamlit.runtime import Runtime
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+# --- 입장 제한(대기실) ---
+# 마감 직전처럼 방문이 몰릴 때 프로세스당 전체 페이지를 그리는 세션 수를 MAX_SESSIONS 로 묶습니다.
+# 자리가 없으면 가벼운 대기 화면만 그리고, 대기 화면은 POLL_SECONDS 마다 fragment 만 다시 실행해 순번을 확인합니다.
+# - 입장은 도착 순(FIFO)입니다. 대기열이 있으면 새 방문자는 빈자리가 있어도 줄 뒤에 섭니다.
+# - 빈자리가 나면 대기열 맨 앞 세션에 자리를 잡아 두고, 그 세션이 다음 확인 때 전체 페이지로 넘어갑니다.
+# - 연결이 끊긴 세션(Streamlit 런타임 기준)은 DISCONNECT_GRACE_SECONDS 뒤에, 재실행 없이 IDLE_SECONDS 가 지난 세션은
+#   바로 자리를 반납합니다. 대기 중 확인이 끊긴 방문자는 WAITING_TIMEOUT_SECONDS 뒤 줄에서 빠집니다.
+#   오래 머물러 자리를 반납한 세션이 다시 움직이면 먼저 온 방문자로 보고 대기열 맨 앞에 세웁니다.
+# - 신청 폼·FAQ 조작은 전체 재실행 없이 fragment 만 다시 실행하므로, fragment 도 keep_admitted() 로
+#   마지막 확인 시각을 갱신합니다. 폼을 작성 중인 신청자가 idle 로 처리되어 자리를 잃지 않게 하기 위함입니다.
+# - 정리는 SWEEP_INTERVAL 초마다 한 번만 하며, 그때 대기 순번 스냅숏도 새로 만듭니다.
+# TOOJAK_MAX_SESSIONS=0 이면 제한하지 않습니다. 이미 신청 폼을 작성 중인 사람의 응답 시간을 지키는 것이 목적이므로,
+# 한 프로세스가 감당할 수 있는 세션 수(bench.py 측정값)보다 약간 낮게 잡습니다.
+MAX_SESSIONS = int(os.environ.get("TOOJAK_MAX_SESSIONS", "80"))
+IDLE_SECONDS = float(os.environ.get("TOOJAK_ADMISSION_IDLE_SECONDS", "1200"))
+POLL_SECONDS = float(os.environ.get("TOOJAK_WAITING_POLL_SECONDS", "5"))
+WAITING_TIMEOUT_SECONDS = POLL_SECONDS * 4
+DISCONNECT_GRACE_SECONDS = 30.0
+SWEEP_INTERVAL = 1.0
+
+logger = logging.getLogger("toojak.admission")
+
+
+def session_is_connected(session_id):
+    # python app.py·AppTest 처럼 런타임이 없으면 연결 상태를 알 수 없으므로 연결된 것으로 봅니다.
+    if not Runtime.exists():
+        return True
+    return Runtime.instance().is_active_session(session_id)
+
+
+class AdmissionController:
+    def __init__(self, limit=MAX_SESSIONS, idle_seconds=IDLE_SECONDS, waiting_timeout=WAITING_TIMEOUT_SECONDS,
+                 disconnect_grace=DISCONNECT_GRACE_SECONDS, is_connected=session_is_connected, clock=time.monotonic):
+        self.limit = limit
+        self.idle_seconds = idle_seconds
+        self.waiting_timeout = waiting_timeout
+        self.disconnect_grace = disconnect_grace
+        self._is_connected = is_connected
+        self._clock = clock
+        self._admitted = {}             # 세션 -> 마지막 확인 시각 (자리를 잡아 둔 세션은 아직 확인 전)
+        self._reserved = set()          # 대기열에서 올라왔지만 아직 전체 페이지로 넘어가지 않은 세션
+        self._waiting = OrderedDict()   # 세션 -> 마지막 확인 시각, 도착 순
+        self._disconnected = {}         # 세션 -> 연결이 끊긴 것을 처음 본 시각
+        self._expired = {}              # 오래 머물러 자리를 반납한 세션 -> 반납 시각
+        self._positions = {}
+        self._swept_at = float("-inf")
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return self.limit > 0
+
+    def admit(self, session_id):
+        """입장했으면 0, 대기 중이면 대기 순번(1부터)을 돌려줍니다. 대기 중인 세션은 주기적으로 다시 불러야 합니다."""
+        if not self.enabled:
+            return 0
+        with self._lock:
+            now = self._clock()
+            if now - self._swept_at >= SWEEP_INTERVAL:
+                self._sweep(now)
+            if session_id in self._admitted:
+                self._admitted[session_id] = now
+                self._reserved.discard(session_id)
+                return 0
+            if session_id in self._waiting:
+                self._waiting[session_id] = now
+            elif self._expired.pop(session_id, None) is not None:
+                self._waiting[session_id] = now
+                self._waiting.move_to_end(session_id, last=False)
+                self._positions = {other: position + 1 for other, position in self._positions.items()}
+                self._positions[session_id] = 1
+            elif not self._waiting and len(self._admitted) < self.limit:
+                self._admitted[session_id] = now
+                return 0
+            else:
+                self._waiting[session_id] = now
+                self._positions[session_id] = len(self._waiting)
+                if len(self._waiting) == 1:
+                    logger.info("입장 인원 %d명이 찼습니다. 대기열을 시작합니다.", self.limit)
+            self._promote(now)
+            if session_id in self._admitted:
+                self._reserved.discard(session_id)
+                return 0
+            return self._positions.get(session_id, len(self._waiting))
+
+    def touch(self, session_id):
+        """입장한 세션의 마지막 확인 시각만 갱신합니다 (fragment 재실행용, 대기 화면을 그릴 수 없는 곳).
+        idle 로 자리를 반납한 세션은 대기열이 없고 빈자리가 있을 때만 다시 입장시킵니다."""
+        if not self.enabled:
+            return
+        with self._lock:
+            now = self._clock()
+            if session_id in self._admitted:
+                self._admitted[session_id] = now
+                self._reserved.discard(session_id)
+            elif session_id in self._expired and not self._waiting and len(self._admitted) < self.limit:
+                del self._expired[session_id]
+                self._admitted[session_id] = now
+
+    def stats(self):
+        """(입장 세션 수, 대기 세션 수)."""
+        with self._lock:
+            return len(self._admitted), len(self._waiting)
+
+    def _promote(self, now):
+        while self._waiting and len(self._admitted) < self.limit:
+            session_id, _ = self._waiting.popitem(last=False)
+            self._admitted[session_id] = now
+            self._reserved.add(session_id)
+        if not self._waiting and self._positions:
+            self._positions = {}
+
+    def _sweep(self, now):
+        self._swept_at = now
+        for session_id, seen_at in list(self._admitted.items()):
+            timeout = self.waiting_timeout if session_id in self._reserved else self.idle_seconds
+            if now - seen_at > timeout or self._gone(session_id, now):
+                del self._admitted[session_id]
+                if session_id not in self._reserved and now - seen_at > timeout:
+                    self._expired[session_id] = now
+                self._reserved.discard(session_id)
+        for session_id, seen_at in list(self._waiting.items()):
+            if now - seen_at > self.waiting_timeout or self._gone(session_id, now):
+                del self._waiting[session_id]
+        for session_id, expired_at in list(self._expired.items()):
+            if now - expired_at > self.idle_seconds or self._gone(session_id, now):
+                del self._expired[session_id]
+        for session_id in list(self._disconnected):
+            if session_id not in self._admitted and session_id not in self._waiting and session_id not in self._expired:
+                del self._disconnected[session_id]
+        self._promote(now)
+        self._positions = {session_id: position for position, session_id in enumerate(self._waiting, 1)}
+
+    def _gone(self, session_id, now):
+        if self._is_connected(session_id):
+            self._disconnected.pop(session_id, None)
+            return False
+        return now - self._disconnected.setdefault(session_id, now) > self.disconnect_grace
+
+
+ADMISSION = AdmissionController()
+
+WAITING_PAGE_HTML = """
+<div style="max-width: 560px; margin: 12vh auto 0; padding: 40px 32px; text-align: center; font-family: 'Pretendard', sans-serif;
+            border: 1px solid #e0e0e0; border-radius: 16px; box-shadow: 0 4px 8px rgba(0, 0, 0, 0.05); background: #FFFFFF;">
+    <div style="font-size: 2.4rem;">⏳</div>
+    <h2 style="margin: 12px 0 8px; color: #212529; font-size: 1.5rem;">{title}</h2>
+    <p style="margin: 0; color: #495057; line-height: 1.7;">
+        접속자가 많아 순서대로 입장하고 있습니다.<br>
+        차례가 되면 이 화면이 자동으로 교류회 안내 페이지로 바뀝니다.<br>
+        <strong>새로고침하면 대기 순번이 맨 뒤로 밀립니다.</strong>
+    </p>
+    {notice}
+</div>
+"""
+POSITION_HTML = """
+<div style="text-align: center; font-family: 'Pretendard', sans-serif; color: #689F38; font-size: 1.25rem; font-weight: 700; margin-top: 20px;">
+    대기 순번 {position:,}번
+</div>
+"""
+
+
+@st.cache_data(show_spinner=False)
+def waiting_page_html(title, notice):
+    # 대기 화면은 방문자와 무관하므로 한 번만 만듭니다. 순번은 POSITION_HTML 로 따로 그립니다.
+    notice_html = f'<p style="margin: 16px 0 0; color: #6c757d; font-size: 0.95rem;">{notice}</p>' if notice else ""
+    return WAITING_PAGE_HTML.format(title=title, notice=notice_html)
+
+
+def current_session_id():
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx else None
+
+
+def keep_admitted():
+    """fragment 재실행에서 현재 세션의 자리를 유지합니다."""
+    session_id = current_session_id()
+    if session_id is not None:
+        ADMISSION.touch(session_id)
+
+
+def wait_for_admission(title, notice=""):
+    """전체 페이지를 그려도 되면 True. 자리가 없으면 대기 화면과 순번 확인 fragment 를 그리고 False."""
+    session_id = current_session_id()
+    if not ADMISSION.enabled or session_id is None or ADMISSION.admit(session_id) == 0:
+        return True
+    st.markdown(waiting_page_html(title, notice), unsafe_allow_html=True)
+
+    @st.fragment(run_every=POLL_SECONDS)
+    def display_queue_position():
+        position = ADMISSION.admit(session_id)
+        if position == 0:
+            st.rerun(scope="app")
+        st.markdown(POSITION_HTML.format(position=position), unsafe_allow_html=True)
+
+    display_queue_position()
+    return False
@@ -1,11 +1,32 @@
+import os
+import time
+from datetime import datetime
 import streamlit as st
-import base64
 from pathlib import Path
 
+from admission import wait_for_admission
+from asset_cache import ASSET_CACHE
+from capacity import ALREADY_APPLIED, SEATS_FULL, CapacityTracker
+from css_pipeline import build_stylesheet
+from content_store import CONTENT_STORE
+from events import KST, STATUS_CLOSED, STATUS_LABELS, STATUS_OPEN, format_korean_deadline
+from faq import FAQ_INDEX
+from font_pipeline import PRETENDARD_CDN_CSS, available_weights, font_face_css, font_preload_html
+from image_pipeline import ResponsiveImage, build_responsive_image
+from intake_store import PARTICIPATION_TYPES, IntakeBusy, IntakeStore, new_submission_id, validate_application
+from ir_validator import describe as describe_deck, validate_many as validate_decks
+from page_cache import SECTION_CACHE
+from progressive import PROGRESSIVE, display_progressively
+from render_metrics import RENDER_METRICS
+from static_assets import STATIC_DIR, published_url
+from upload_spool import DOCUMENT_KINDS, MAX_FILE_BYTES, UploadRejected, UploadSession, cleanup_stale_temp, sweep_unreferenced
+
 # --- 페이지 설정 ---
+PAGE_TITLE = "2025 사회서비스 투자 교류회"
+PAGE_ICON = "📈"
 st.set_page_config(
-    page_title="2025 사회서비스 투자 교류회",
-    page_icon="📈",
+    page_title=PAGE_TITLE,
+    page_icon=PAGE_ICON,
     layout="wide",
     initial_sidebar_state="collapsed"
 )
@@ -28,18 +49,22 @@ BOX_SHADOW_DARK = "0 8px 16px rgba(0,0,0,0.15)"
 HEADER_HEIGHT_PX = 70
 # 실제 구글폼 링크
 GOOGLE_FORM_URL = "https://forms.gle/7tPQ2fEykJKYBtzi7"
+# 페이지 안의 신청 폼(intake_store.py)으로 접수합니다. TOOJAK_NATIVE_INTAKE=0 이면 기존처럼 구글폼으로 보냅니다.
+NATIVE_INTAKE = os.environ.get("TOOJAK_NATIVE_INTAKE", "1") != "0"
+APPLICATION_FORM_ANCHOR = "section-apply-form"
+APPLY_URL = f"#{APPLICATION_FORM_ANCHOR}" if NATIVE_INTAKE else GOOGLE_FORM_URL
+APPLY_LINK_TARGET = "" if NATIVE_INTAKE else ' target="_blank"'
 
 # --- 이미지 Base64 인코딩 함수 ---
+# 인코딩 결과는 asset_cache 의 프로세스 공용 캐시에 보관되어 재실행마다 파일을 다시 읽지 않습니다.
 def image_to_data_uri(file_path_str):
     file_path = Path(file_path_str)
     if not file_path.is_file(): return None
     try:
-        with open(file_path, "rb") as image_file:
-            encoded_string = base64.b64encode(image_file.read()).decode()
         ext = file_path.suffix.lower()
         mime_type = {".jpg": "image/jpeg", ".jpeg": "image/jpeg", ".png": "image/png",
                      ".gif": "image/gif", ".svg": "image/svg+xml"}.get(ext, "application/octet-stream")
-        return f"data:{mime_type};base64,{encoded_string}"
+        return ASSET_CACHE.data_uri(file_path, mime_type)
     except Exception: return None
 
 # --- 파일 Base64 인코딩 함수 (범용) ---
@@ -49,30 +74,186 @@ def file_to_data_uri(file_path_str):
         if not file_path.is_file():
             return None
         
-        with open(file_path, "rb") as file:
-            encoded_string = base64.b64encode(file.read()).decode()
-        
         # 한글 파일(.hwp)을 위한 MIME 타입
         mime_type = "application/x-hwp"
         
-        return f"data:{mime_type};base64,{encoded_string}"
+        return ASSET_CACHE.data_uri(file_path, mime_type)
     except Exception as e:
         st.error(f"파일 처리 중 오류 발생: {e}")
         return None
 
+# --- 정적 자산 URL ---
+# TOOJAK_ASSET_BASE_URL(asset_server.py 또는 CDN 주소)이 있으면 그 주소를, 없으면 Streamlit 정적 서빙(app/static/)을 사용합니다.
+# 둘 다 사용할 수 없거나 게시에 실패하면 기존처럼 base64 데이터 URI 로 인라인합니다.
+ASSET_BASE_URL = os.environ.get("TOOJAK_ASSET_BASE_URL") or ("app/static/" if st.get_option("server.enableStaticServing") else None)
+
+def asset_url(file_path_str, inline_fallback):
+    if ASSET_BASE_URL:
+        try:
+            url = published_url(file_path_str, ASSET_BASE_URL)
+            if url: return url
+        except OSError: pass
+    return inline_fallback(file_path_str)
+
+# --- 로고 이미지 (image_pipeline.py) ---
+# 빌드 단계(python image_pipeline.py)에서 만든 AVIF/WebP/PNG 변형을 매니페스트로 찾아 <picture>/srcset 로 제공합니다.
+# 자산 URL 을 쓸 수 없으면 2x WebP 하나를 인라인하고, 매니페스트에 없으면 원본 이미지를 그대로 사용합니다. 실행 중에는 인코딩하지 않습니다.
+def responsive_image(file_path_str, alt):
+    if not Path(file_path_str).is_file(): return None
+    def build(path):
+        try:
+            image = build_responsive_image(path, alt, STATIC_DIR, ASSET_BASE_URL)
+        except (OSError, KeyError, ValueError): image = None
+        return image or ResponsiveImage(alt, asset_url(str(path), image_to_data_uri))
+    return ASSET_CACHE.get(file_path_str, ("responsive-image", alt, ASSET_BASE_URL), build)
+
 # 로고 파일명을 실제 파일명으로 확인하고, 파일이 코드 실행 위치에 있거나 정확한 경로를 지정해야 합니다.
-LOGO_MOHW_DATA_URI = image_to_data_uri("mohw_logo.png")
-LOGO_KSSI_DATA_URI = image_to_data_uri("kssi_logo.png")
-LOGO_MYSC_DATA_URI = image_to_data_uri("mysc_logo.png")
+LOGOS = (
+    responsive_image("mohw_logo.png", "보건복지부"),
+    responsive_image("kssi_logo.png", "중앙사회서비스원"),
+    responsive_image("mysc_logo.png", "엠와이소셜컴퍼니(MYSC)"),
+)
+
+# 회차별 신청서 양식 (content/events.json 의 application_form). 게시·인코딩 결과는 asset_cache 에 회차 파일별로 보관됩니다.
+def application_form_link(event):
+    if not event.application_form: return (None, None)
+    return (event.application_form, asset_url(event.application_form, file_to_data_uri))
+
+# --- 웹폰트 (font_pipeline.py) ---
+# 서브셋 Pretendard 가 있고 자산 URL 로 제공할 수 있으면 직접 제공하고(font-display: swap + preload),
+# 그렇지 않으면 기존처럼 jsDelivr CSS 를 @import 합니다. 폰트는 base64 로 인라인하지 않습니다.
+FONT_FACE_CSS = f"@import url('{PRETENDARD_CDN_CSS}');"
+FONT_PRELOAD_HTML = ""
+if ASSET_BASE_URL and available_weights():
+    try:
+        FONT_FACE_CSS = font_face_css(lambda path: published_url(path, ASSET_BASE_URL))
+        FONT_PRELOAD_HTML = font_preload_html(lambda path: published_url(path, ASSET_BASE_URL))
+    except OSError: pass
+
+# --- 콘텐츠 (content/*.json, content_store.py) ---
+# 일정·FAQ·문의처는 감시 스레드가 파일이 바뀔 때만 다시 읽습니다 (감시는 아래 start_content_watch() 가 프로세스당 한 번 시작).
+# 섹션 렌더링은 호출 시점의 콘텐츠를 쓰고, 이 실행의 나머지 코드(신청 폼 등)는 아래 스냅숏을 씁니다.
+SCHEDULE = CONTENT_STORE.get("events")
+
+# --- 회차 선택 (?round=1|2|3) ---
+# 한 프로세스가 모든 회차 페이지를 제공합니다. 없는 회차나 값이 없으면 대표 회차(featured_round)를 보여 줍니다.
+# 회차에 따라 달라지는 섹션은 "이름@회차"로 섹션 캐시에 들어가며, 캐시는 최근에 쓴 항목 위주로 크기가 제한됩니다.
+EDITION_SECTIONS = ("hero", "application_method")
+
+def requested_edition(schedule):
+    try: requested = int(st.query_params.get("round", ""))
+    except ValueError: return schedule.featured_round
+    return schedule.edition(requested).round
+
+EDITION = requested_edition(SCHEDULE)
+
+# --- 선착순 정원 (capacity.py) ---
+# 접수를 이 페이지에서 받을 때만 잔여 좌석을 보여 줍니다. 값은 몇 초 단위 스냅숏이라 렌더링마다 DB 를 읽지 않습니다.
+# 프로세스를 시작할 때 접수 기록 없이 남은 예약(접수 큐에 넣기 전에 죽은 경우)을 정리합니다.
+@st.cache_resource
+def get_capacity_tracker():
+    tracker = CapacityTracker()
+    tracker.sync_limits(SCHEDULE.events)
+    tracker.reconcile()
+    return tracker
+
+def remaining_seats(events, tracker=None):
+    if not NATIVE_INTAKE: return ()
+    return (tracker or get_capacity_tracker()).remaining(events)
+
+# --- 섹션 렌더링 ---
+# render_*_html() 은 요청과 무관한 섹션 HTML 을 만들고, page_cache 가 이를 프로세스당 한 번만 실행해 재사용합니다.
+# 렌더 함수의 코드나 참조하는 상수(날짜, 신청 링크, 색상, 자산 URL)가 바뀌면 해당 섹션만 다시 만들어집니다.
+# 섹션별 <style> 블록은 떼어 내어, 헤더·히어로용 핵심 CSS 는 헤더와 함께 먼저 보내고 나머지는 히어로 뒤에 한 번에 보냅니다.
+CRITICAL_SECTIONS = ("header", "hero")
+
+# 콘텐츠 파일별로 그 내용을 쓰는 섹션. 파일이 바뀌면 이 섹션들과 스타일시트만 다시 만듭니다.
+CONTENT_SECTIONS = {
+    "events": ("hero", "annual_schedule", "application_method"),
+    "faq": ("faq_list",),
+    "contact": ("contact",),
+}
+
+def section_args(name, edition, tracker=None):
+    if name in ("header", "introduction", "footer"): return (LOGOS,)
+    if name == "hero": return (CONTENT_STORE.get("events").edition(edition),)
+    if name == "application_method":
+        event = CONTENT_STORE.get("events").edition(edition)
+        return (event, *application_form_link(event))
+    if name == "faq_list": return (CONTENT_STORE.get("faq"),)
+    if name == "contact": return (CONTENT_STORE.get("contact"),)
+    if name == "annual_schedule":
+        schedule = CONTENT_STORE.get("events")
+        return (schedule.events, schedule.status_epoch(), remaining_seats(schedule.events, tracker))
+    return ()
+
+def cache_name(name, edition):
+    return f"{name}@{edition}" if name in EDITION_SECTIONS else name
+
+def fetch_section(name, edition=None, tracker=None):
+    edition = edition or EDITION
+    return SECTION_CACHE.fetch(cache_name(name, edition), SECTION_RENDERERS[name], *section_args(name, edition, tracker))
+
+def rendered_section(name, edition=None, tracker=None):
+    return fetch_section(name, edition, tracker)[0]
+
+def fetch_stylesheet(critical, edition=None, tracker=None):
+    edition = edition or EDITION
+    names = [name for name in SECTION_RENDERERS if (name in CRITICAL_SECTIONS) == critical]
+    css_blocks = tuple(css for name in names for css in rendered_section(name, edition, tracker).css)
+    return SECTION_CACHE.fetch(f"stylesheet:{'critical' if critical else 'deferred'}@{edition}", build_stylesheet, css_blocks)
+
+def page_stylesheet(critical):
+    return fetch_stylesheet(critical)[0].html
+
+def emit_section(name):
+    started = time.perf_counter()
+    section, cache_hit = fetch_section(name)
+    html = section.html
+    if name == "header": html = f"<style>{page_stylesheet(critical=True)}</style>{html}"
+    st.markdown(html, unsafe_allow_html=True)
+    if RENDER_METRICS.enabled:
+        RENDER_METRICS.observe_section(name, time.perf_counter() - started, len(html.encode()), cache_hit)
+
+def rerender_changed_content(changed, tracker):
+    """감시 스레드에서 호출됩니다. 바뀐 콘텐츠를 쓰는 섹션만 새 내용으로 미리 렌더링해, 다음 세션이 기다리지 않게 합니다.
+    스크립트 실행 밖이므로 Streamlit 캐시 함수를 부르지 않고, 정원 관리자(tracker)는 등록할 때 넘겨받습니다."""
+    if "faq" in changed: FAQ_INDEX.sync(CONTENT_STORE.get("faq"))
+    if "events" in changed and tracker: tracker.sync_limits(CONTENT_STORE.get("events").events)
+    edition = CONTENT_STORE.get("events").featured_round  # 다른 회차는 다음 방문 때 다시 만들어집니다
+    for name in sorted({section for content in changed for section in CONTENT_SECTIONS.get(content, ())}):
+        rendered_section(name, edition, tracker)
+    fetch_stylesheet(True, edition, tracker)
+    fetch_stylesheet(False, edition, tracker)
+
+@st.cache_resource
+def start_content_watch():
+    # 프로세스당 한 번만 FAQ 색인을 채우고, 변경 콜백을 등록한 뒤 감시 스레드를 시작합니다.
+    FAQ_INDEX.sync(CONTENT_STORE.get("faq"))
+    tracker = get_capacity_tracker() if NATIVE_INTAKE else None
+    CONTENT_STORE.on_change("app", lambda changed: rerender_changed_content(changed, tracker))
+    CONTENT_STORE.watch()
+    return True
+
+start_content_watch()
+
+def display_deferred_styles():
+    started = time.perf_counter()
+    stylesheet, cache_hit = fetch_stylesheet(critical=False)
+    html = f"<style>{stylesheet.html}</style>"
+    st.markdown(html, unsafe_allow_html=True)
+    if RENDER_METRICS.enabled:
+        RENDER_METRICS.observe_section("deferred_styles", time.perf_counter() - started, len(html.encode()), cache_hit)
 
 # --- 고정 헤더, FAB 및 전역 스타일 ---
-def inject_global_styles_and_header():
+def render_header_html(logos):
+    logo_mohw, logo_kssi, logo_mysc = logos
     logos_html = ""
-    if LOGO_MOHW_DATA_URI: logos_html += f'<img src="{LOGO_MOHW_DATA_URI}" alt="보건복지부" class="header-logo">'
+    if logo_mohw: logos_html += logo_mohw.html("header-logo")
     else: logos_html += '<span class="header-logo-placeholder">보건복지부</span>'
-    if LOGO_KSSI_DATA_URI: logos_html += f'<img src="{LOGO_KSSI_DATA_URI}" alt="중앙사회서비스원" class="header-logo">'
+    if logo_kssi: logos_html += logo_kssi.html("header-logo")
     else: logos_html += '<span class="header-logo-placeholder">중앙사회서비스원</span>'
-    if LOGO_MYSC_DATA_URI: logos_html += f'<img src="{LOGO_MYSC_DATA_URI}" alt="엠와이소셜컴퍼니(MYSC)" class="header-logo header-logo-mysc">'
+    if logo_mysc: logos_html += logo_mysc.html("header-logo header-logo-mysc")
     else: logos_html += '<span class="header-logo-placeholder">엠와이소셜컴퍼니(MYSC)</span>'
 
     nav_items_data = [
@@ -89,7 +270,7 @@ def inject_global_styles_and_header():
 
     global_styles = f"""
     <style>
-        @import url('https://cdn.jsdelivr.net/gh/orioncactus/pretendard@v1.3.9/dist/web/static/pretendard.min.css');
+        {FONT_FACE_CSS}
         :root {{
             --primary-color: {PRIMARY_COLOR}; --primary-color-light: {PRIMARY_COLOR_LIGHT}; --primary-color-dark: {PRIMARY_COLOR_DARK};
             --text-primary: {TEXT_COLOR_PRIMARY}; --text-secondary: {TEXT_COLOR_SECONDARY}; --text-muted: {TEXT_COLOR_MUTED};
@@ -119,7 +300,8 @@ def inject_global_styles_and_header():
         }}
         .header-content {{ display: flex; justify-content: space-between; align-items: center; width: 100%; max-width: 1200px; height: 100%; }}
         .header-logo-group {{ display: flex; align-items: center; gap: 18px; }}
-        .header-logo {{ height: 34px; object-fit: contain; }}
+        .header-logo {{ height: 34px; width: auto; object-fit: contain; }}
+        .responsive-picture {{ display: contents; }}
         .header-logo-placeholder {{ font-size: 1.05rem; font-weight: 600; color: var(--text-muted); }}
         .header-nav {{
             display: flex;
@@ -221,15 +403,19 @@ def inject_global_styles_and_header():
             .header-logo {{ height: 30px; }} .header-logo-placeholder {{ font-size: 1rem;}}
         }}
     </style>
+    {FONT_PRELOAD_HTML}
     <div class="fixed-header"><div class="header-content"><div class="header-logo-group">{logos_html}</div><nav class="header-nav">{nav_html_elements}</nav></div></div>
-    <a href="{GOOGLE_FORM_URL}" target="_blank" class="fab"><span class="fab-icon">📝</span> 참가 신청하기</a>
+    <a href="{APPLY_URL}"{APPLY_LINK_TARGET} class="fab"><span class="fab-icon">📝</span> 참가 신청하기</a>
     """
-    st.markdown(global_styles, unsafe_allow_html=True)
+    return global_styles
 
-def display_hero_section():
-    first_event_date = "2025년 8월 4일(월) 13:30"
-    first_event_theme = "돌봄의 공백을 채우는 지역 상생 사회서비스"
-    application_deadline = "2025년 7월 21일(월) 오후 6시까지(기한 엄수)"
+def inject_global_styles_and_header():
+    emit_section("header")
+
+def render_hero_section_html(event):
+    event_date = event.datetime_label
+    event_theme = event.theme
+    application_deadline = f"{format_korean_deadline(event.deadline)}까지(기한 엄수)" if event.deadline else "추후 안내 예정"
 
     hero_catchphrase_html = """
         <p style="font-size: 1.5rem; margin-bottom: 0.5em;">사회서비스 기업-투자자-유관기관 연결의 장!</p>
@@ -306,22 +492,26 @@ def display_hero_section():
             <div class="hero-catchphrase-container">{hero_catchphrase_html}</div>
         </div>
         <div class="hero-key-info">
-            <h3>✨ 제2회 투자 교류회 안내 ✨</h3>
-            <p><span class="info-label">일시:</span> {first_event_date}</p>
-            <p><span class="info-label">주제:</span> {first_event_theme}</p>
+            <h3>✨ 제{event.round}회 투자 교류회 안내 ✨</h3>
+            <p><span class="info-label">일시:</span> {event_date}</p>
+            <p><span class="info-label">주제:</span> {event_theme}</p>
             <p><span class="info-label">신청마감:</span> <span class="deadline">{application_deadline}</span></p>
-            <p><span class="info-label">장소:</span> 대전테크노파크 디스테이션 10층</p>
+            <p><span class="info-label">장소:</span> {event.venue}</p>
         </div>
         <div class="hero-cta-button-container">
-            <a href="{GOOGLE_FORM_URL}" class="hero-cta-button custom-button">
+            <a href="{APPLY_URL}" class="hero-cta-button custom-button">
                 {hero_cta_button_text}
             </a>
         </div>
     </section>
     """
-    st.markdown(hero_html, unsafe_allow_html=True)
+    return hero_html
 
-def display_introduction_section():
+def display_hero_section():
+    emit_section("hero")
+
+def render_introduction_section_html(logos):
+    logo_mohw, logo_kssi, logo_mysc = logos
     intro_html = f"""
     <style>
         #section-introduction {{ background-color: var(--white-color); }}
@@ -347,18 +537,21 @@ def display_introduction_section():
                 <p>다양한 사회서비스 기업을 발굴하고 임팩트 투자 연계를 통해  기업의 스케일업을 지원하며,<br> 궁극적으로 국민 모두에게 고품질의 사회서비스가 제공될 수 있는 <br> 건강한 생태계 조성을 목표로 합니다.</p>
                  <div class="organizers-section">
                          <div class="organizer-logos-flex">
-                              <div class="organizer-logo-item">{f'<img src="{LOGO_MOHW_DATA_URI}" alt="보건복지부">' if LOGO_MOHW_DATA_URI else ""}</div>
-                              <div class="organizer-logo-item">{f'<img src="{LOGO_KSSI_DATA_URI}" alt="중앙사회서비스원">' if LOGO_KSSI_DATA_URI else ""}</div>
-                              <div class="organizer-logo-item">{f'<img src="{LOGO_MYSC_DATA_URI}" alt="엠와이소셜컴퍼니(MYSC)">' if LOGO_MYSC_DATA_URI else ""}</div>
+                              <div class="organizer-logo-item">{logo_mohw.html() if logo_mohw else ""}</div>
+                              <div class="organizer-logo-item">{logo_kssi.html() if logo_kssi else ""}</div>
+                              <div class="organizer-logo-item">{logo_mysc.html() if logo_mysc else ""}</div>
                          </div>
                  </div>
             </div>
         </div>
     </section>
     """
-    st.markdown(intro_html, unsafe_allow_html=True)
+    return intro_html
 
-def display_participation_guide_section():
+def display_introduction_section():
+    emit_section("introduction")
+
+def render_participation_guide_section_html():
     guide_html = f"""
     <style>
         #section-participation-guide {{ background-color: var(--background-light-gray); }}
@@ -411,9 +604,12 @@ def display_participation_guide_section():
         </div>
     </section>
     """
-    st.markdown(guide_html, unsafe_allow_html=True)
+    return guide_html
 
-def display_event_composition_section():
+def display_participation_guide_section():
+    emit_section("participation_guide")
+
+def render_event_composition_section_html():
     composition_html = f"""
     <style>
         #section-event-composition {{ background-color: {BACKGROUND_COLOR_LIGHT_GRAY}; }}
@@ -447,11 +643,45 @@ def display_event_composition_section():
         </div>
     </section>
     """
-    st.markdown(composition_html, unsafe_allow_html=True)
+    return composition_html
 
-def display_annual_schedule_section():
+def display_event_composition_section():
+    emit_section("event_composition")
+
+# 카드는 (행사 목록, 모집 상태) 조합마다 한 번만 렌더링되어, 마감 시각이 지나 상태가 바뀌면 새 카드가 캐시됩니다.
+def render_annual_schedule_section_html(events, statuses, seats=()):
     STATUS_COLOR_SCHEDULED = TEXT_COLOR_MUTED
-    event3_details = "복지, 보건·의료, 교육, 고용, 주거, 문화, 환경의 분야에서 국민의 삶을 HEAL하는 사회서비스 기업을 지원합니다."
+
+    def event_card_html(index, event, status, event_seats):
+        sold_out = bool(event_seats) and all(remaining == 0 for _, remaining, _ in event_seats)
+        seats_html = ""
+        if status == STATUS_OPEN and event_seats:
+            seats_html = '<p class="event-seats">잔여 ' + " · ".join(
+                f"{participation_type} {remaining}/{limit}" if remaining else f"{participation_type} 마감"
+                for participation_type, remaining, limit in event_seats
+            ) + "</p>"
+        if status == STATUS_OPEN and sold_out:
+            card_class, status_color = "event-schedule-card card-disabled-look", STATUS_COLOR_SCHEDULED
+            button_html = '<a href="#" class="card-apply-button custom-button button-disabled">선착순 마감</a>'
+        elif status == STATUS_OPEN:
+            card_class, status_color = "event-schedule-card", PRIMARY_COLOR
+            button_html = f'<a href="?round={event.round}#section-application-method" class="card-apply-button custom-button button-primary">세부 정보 확인 및 신청</a>'
+        else:
+            card_class, status_color = "event-schedule-card card-disabled-look", STATUS_COLOR_SCHEDULED
+            button_text = "모집 마감" if status == STATUS_CLOSED else "향후 모집 예정"
+            button_html = f'<a href="#" class="card-apply-button custom-button button-disabled">{button_text}</a>'
+        return f"""
+            <div class="{card_class}" style="animation-delay: {index * 0.15:g}s;">
+                <div class="card-header"> <span class="event-status" style="background-color:{status_color};">{STATUS_LABELS[status]}</span> </div>
+                <h3 class="event-theme"><a href="?round={event.round}" target="_self">제{event.round}회: {event.theme}</a></h3>
+                <p class="event-time"><span class="event-date-venue">{event.date_label} / {event.venue}</span></p>
+                <p class="event-details">{event.details}</p>
+                {seats_html}
+                {button_html}
+            </div>"""
+
+    seats = seats or ((),) * len(events)
+    cards_html = "".join(event_card_html(index, *card) for index, card in enumerate(zip(events, statuses, seats)))
     annual_schedule_html = f"""
     <style>
         #section-annual-schedule {{ background-color: var(--white-color); }}
@@ -466,9 +696,11 @@ def display_annual_schedule_section():
         .event-date-venue {{ font-size: 1rem; font-weight: 600; color: var(--text-primary); margin-bottom: 10px; text-align: center ; }}
         .event-status {{ font-size: 0.88rem; font-weight: 700; color: var(--white-color); padding: 7px 16px; border-radius: 20px; }}
         .event-theme {{ font-size: 1.5rem; font-weight: 700; color: var(--primary-color-dark); margin-bottom: 18px; line-height: 1.4; font-style: normal !important; text-align: center; min-height: calc(1.4em * 2 * 1.4); }}
+        .event-theme a {{ color: inherit; text-decoration: none; }}
         .event-time {{ font-size: 0.95rem; color: var(--text-secondary); margin-bottom: 20px; display: flex; align-items: center; justify-content: center; }}
         .event-time .icon-time-emoji {{ margin-right: 8px; color: {PRIMARY_COLOR_DARK}; font-size: 1.1em; }}
         .event-details {{ font-size: 0.9rem; color: var(--text-secondary); line-height: 1.65; margin-bottom: 25px; flex-grow: 1; text-align: center; min-height: calc(1.65em * 3); }}
+        .event-seats {{ font-size: 0.88rem; font-weight: 600; color: {PRIMARY_COLOR_DARK}; text-align: center; margin-bottom: 15px; }}
         .card-apply-button {{ margin-top: auto; text-align: center; width: 100%; padding-top: 14px; padding-bottom: 14px; font-size: 1rem; }}
         .custom-button.button-disabled {{ background-color: #d8d8d8 !important; color: #888888 !important; border-color: #d8d8d8 !important; box-shadow: none !important; pointer-events: none; cursor: not-allowed; }}
         .custom-button.button-disabled:hover {{ background-color: #d8d8d8 !important; transform: none !important; box-shadow: none !important; }}
@@ -478,40 +710,25 @@ def display_annual_schedule_section():
     </style>
     <section id="section-annual-schedule" class="section">
         <h2 class="section-title">2025년 투자 교류회 연간 일정</h2>
-        <div class="event-schedule-grid">
-            <div class="event-schedule-card card-disabled-look" style="animation-delay: 0s;">
-                <div class="card-header"> <span class="event-status" style="background-color:{STATUS_COLOR_SCHEDULED};">모집 마감</span> </div>
-                <h3 class="event-theme">제1회: 국민의 삶의 질을 높이는 AI 사회서비스</h3>
-                <span class="event-date-venue">2025. 6. 25.(수) / 서울</span>
-                <p class="event-details">AI 기술을 활용하여 사회서비스의 효율성과<br> 접근성을 혁신하는 기업을 위한 투자 교류의 장입니다. (참석 규모: 약 80명 내외)</p>
-                <a href="#" class="card-apply-button custom-button button-disabled">모집 마감</a>
-            </div>
-            <div class="event-schedule-card" style="animation-delay: 0.15s;">
-                <div class="card-header"> <span class="event-status" style="background-color:{PRIMARY_COLOR};">모집중</span> </div>
-                <h3 class="event-theme">제2회: 돌봄의 공백을 채우는 지역 상생 사회서비스</h3>
-                <p class="event-time"><span class="event-date-venue">2025. 8. 4.(월) / 대전테크노파크 디스테이션 10층 </span> </p>
-                <p class="event-details">지역 사회의 특성을 반영한 맞춤형 돌봄 서비스 및 지역사회 활성화에 기여하는 <br> 기업을 발굴합니다.</p>
-                <a href="#section-application-method" class="card-apply-button custom-button button-primary">세부 정보 확인 및 신청</a>
-            </div>
-            <div class="event-schedule-card card-disabled-look" style="animation-delay: 0.3s;">
-                <div class="card-header"> <span class="event-status" style="background-color:{STATUS_COLOR_SCHEDULED};">모집예정</span> </div>
-                <h3 class="event-theme">제3회: 국민의 삶을 HEAL하는 사회서비스</h3>
-                <p class="event-time"><strong>2025. 9. 9.(화) / aT센터</strong></p>
-                <p class="event-details">{event3_details}</p>
-                <a href="#section-application-method" class="card-apply-button custom-button button-disabled">향후 모집 예정</a>
-            </div>
+        <div class="event-schedule-grid">{cards_html}
         </div>
     </section>
     """
-    st.markdown(annual_schedule_html, unsafe_allow_html=True)
+    return annual_schedule_html
 
-def display_application_method_section():
-    application_note = "※ 교류회 주제 및 장소 여건에 따라 선착순 마감될 수 있으며, 선정 기업(기관) 별도 통보 예정"
-    hwp_file_name = "(양식)2025년 제2회 사회서비스 투자 교류회 참가 신청서 및 개인정보 동의서.hwp"
-    hwp_data_uri = file_to_data_uri(hwp_file_name)
+def display_annual_schedule_section():
+    emit_section("annual_schedule")
 
-    if hwp_data_uri:
-        download_button_html = f'<a href="{hwp_data_uri}" download="{hwp_file_name}" class="download-link-button"><span class="icon">📄</span>신청서식<br>(공통)</a>'
+def render_application_method_section_html(event, hwp_file_name, hwp_url):
+    application_note = "※ 교류회 주제 및 장소 여건에 따라 선착순 마감될 수 있으며, 선정 기업(기관) 별도 통보 예정"
+    if event.deadline:
+        deadline_banner = f"{event.round}회차 참가 신청 마감: {format_korean_deadline(event.deadline, with_year=False)}까지(시간 엄수)"
+    else:
+        deadline_banner = f"{event.round}회차 참가 신청 일정은 추후 안내 예정입니다"
+    if not hwp_file_name:
+        download_button_html = f'<div style="text-align:center; color:{TEXT_COLOR_MUTED}; padding: 30px;">{event.round}회차 신청서 양식은 추후 안내 예정입니다.</div>'
+    elif hwp_url:
+        download_button_html = f'<a href="{hwp_url}" download="{hwp_file_name}" class="download-link-button"><span class="icon">📄</span>신청서식<br>(공통)</a>'
     else:
         download_button_html = f'<div style="text-align:center; color:red; font-weight:bold; padding: 30px; border: 2px solid red; border-radius:10px;">\'{hwp_file_name}\' 파일을 찾을 수 없습니다.<br>실행중인 파이썬 파일과 같은 폴더에 파일이 있는지 확인해주세요.</div>'
 
@@ -542,17 +759,18 @@ def display_application_method_section():
         .application-notice {{ margin-top: 65px; padding: 30px; background-color: var(--white-color); border: 1px solid var(--border-color); border-left: 5px solid {TEXT_COLOR_MUTED}; border-radius: var(--border-radius-md); font-size: 1rem; color: var(--text-muted); line-height: 1.8; text-align: left; max-width: 800px; margin-left: auto; margin-right: auto; box-shadow: var(--box-shadow-light); }}
         .application-notice strong {{ color: {PRIMARY_COLOR_DARK}; }}
         .application-notice p:last-child {{ margin-bottom: 0; }}
+        .apply-form-anchor {{ scroll-margin-top: {HEADER_HEIGHT_PX + 20}px; }}
         @media (max-width: 600px) {{ .download-links-grid {{ grid-template-columns: 1fr; }} .application-step-title {{ font-size: 1.4rem; }} .application-step p {{ font-size: 1.05rem; }} .application-deadline-highlight {{ font-size: 1.2rem; padding: 18px 25px; }} .application-notice {{ text-align: left; }} }}
     </style>
      <section id="section-application-method" class="section">
          <div class="application-content">
              <div class="application-deadline-highlight">
-                 2회차 참가 신청 마감: 7월 21일(월) 오후 6시까지(시간 엄수)
+                 {deadline_banner}
              </div>
              <div class="application-step">
                  <h3 class="application-step-title">Step 1: 참가 유형 확인 & 온라인 신청서 작성</h3>
                  <p> <strong>IR발표, 홍보테이블 운영</strong> 참가를 희망하시는 기업은 아래 '온라인 참가 신청하기' 버튼을 통해 <br> 신청 페이지로 이동 후, 참가 유형을 확인하고 온라인 신청서 작성</p>
-                 <p><a href="{GOOGLE_FORM_URL}" target="_blank" class="form-link">➡️ 온라인 참가 신청하기</a></p>
+                 <p><a href="{APPLY_URL}"{APPLY_LINK_TARGET} class="form-link">➡️ 온라인 참가 신청하기</a></p>
              </div>
              <div class="application-step">
                  <h3 class="application-step-title">Step 2: 제출 서류 준비 및 업로드</h3>
@@ -560,7 +778,7 @@ def display_application_method_section():
              </div>
               <div class="download-area">
                   <p class="download-links-title">주요 신청 양식 다운로드</p>
-                   <span class="download-links-span">참가 유형별 참가신청서 1부와 개인정보 이용동의서 1부를 구글폼에 제출 부탁드립니다</span>
+                   <span class="download-links-span">참가 유형별 참가신청서 1부와 개인정보 이용동의서 1부를 {"아래 신청 폼" if NATIVE_INTAKE else "구글폼"}에 제출 부탁드립니다</span>
                    <div class="download-links-grid">
                        {download_button_html}
                    </div>
@@ -592,9 +810,97 @@ def display_application_method_section():
          </div>
      </section>
     """
-    st.markdown(application_html, unsafe_allow_html=True)
+    return application_html
 
-def display_faq_section():
+def display_application_method_section():
+    emit_section("application_method")
+
+# --- 온라인 참가 신청 폼 (intake_store.py) ---
+# 위젯이 있어 섹션 캐시를 쓰지 않습니다. 제출은 접수 큐에 넣고 바로 접수 번호를 보여 주며, 기록은 백그라운드에서 묶어서 합니다.
+# 프로세스를 시작할 때 중단된 업로드의 임시 파일과 접수되지 않은 채 오래된 업로드 파일을 정리합니다.
+@st.cache_resource
+def get_intake_store():
+    cleanup_stale_temp()
+    sweep_unreferenced()
+    return IntakeStore()
+
+def upload_session():
+    # 세션당 업로드 한도를 세기 위해 세션 상태에 보관합니다. 파일 내용은 디스크에만 있습니다.
+    if "upload_session" not in st.session_state:
+        st.session_state.upload_session = UploadSession()
+    return st.session_state.upload_session
+
+def display_application_form_section():
+    if not NATIVE_INTAKE: return
+    event = SCHEDULE.edition(EDITION)
+    st.markdown(f'<div id="{APPLICATION_FORM_ANCHOR}" class="apply-form-anchor"></div>', unsafe_allow_html=True)
+    status = event.status(datetime.now(KST))
+    if status != STATUS_OPEN:
+        st.info(f"{event.round}회차 참가 신청은 현재 {STATUS_LABELS[status]} 상태입니다.")
+        return
+    with st.form("application_form", clear_on_submit=True):
+        st.markdown(f"#### 제{event.round}회 교류회 온라인 참가 신청")
+        participation_type = st.radio("참가 유형", PARTICIPATION_TYPES, horizontal=True)
+        company_name = st.text_input("기업(기관)명")
+        business_number = st.text_input("사업자등록번호", placeholder="000-00-00000")
+        representative = st.text_input("대표자명")
+        contact_name = st.text_input("담당자명")
+        email = st.text_input("이메일")
+        phone = st.text_input("연락처", placeholder="010-0000-0000")
+        st.caption(f"제출 서류 (파일당 최대 {MAX_FILE_BYTES // (1024 * 1024)}MB)")
+        uploads = {kind: st.file_uploader(label, type=list(extensions), key=f"upload_{kind}") for kind, (label, extensions) in DOCUMENT_KINDS.items()}
+        privacy_consent = st.checkbox("개인정보 수집·이용에 동의합니다.")
+        submitted = st.form_submit_button("참가 신청 제출", type="primary")
+    if not submitted: return
+    fields = {
+        "participation_type": participation_type, "company_name": company_name, "business_number": business_number,
+        "representative": representative, "contact_name": contact_name, "email": email, "phone": phone,
+        "privacy_consent": privacy_consent,
+    }
+    # clear_on_submit 으로 제출 뒤에는 폼의 첨부가 비워지므로, 결과와 관계없이 세션 사용량에서도 뺍니다.
+    try:
+        submit_application_form(event, fields, uploads)
+    finally:
+        upload_session().discard()
+
+def submit_application_form(event, fields, uploads):
+    participation_type = fields["participation_type"]
+    errors = validate_application(fields)
+    errors += [f"{DOCUMENT_KINDS[kind][0]}을(를) 첨부해 주세요." for kind, uploaded in uploads.items() if uploaded is None]
+    attachments = []
+    if not errors:
+        for kind, uploaded in uploads.items():
+            try:
+                attachments.append(upload_session().store(kind, uploaded))
+            except UploadRejected as e:
+                errors.append(str(e))
+    # IR 발표 기업의 IR 자료는 16:9 PDF 여야 합니다. 비율이 확실히 다를 때만 막고, 읽을 수 없는 PDF 는 담당자 확인으로 넘깁니다.
+    deck = next((item for item in attachments if item.kind == "ir_deck"), None)
+    if deck and participation_type == PARTICIPATION_TYPES[0]:
+        report = validate_decks([deck.path], workers=1, digests={deck.path: deck.sha256})[deck.path]
+        if not report.error and not report.is_16_9:
+            errors.append(f"{DOCUMENT_KINDS['ir_deck'][0]}: {describe_deck(report)} — 16:9 비율 PDF 로 다시 올려 주세요.")
+    if errors:
+        st.error("\n".join(f"- {error}" for error in errors))
+        return
+    # 자리를 먼저 확보하고, 접수 큐에 넣지 못하면 돌려놓습니다. 같은 회차에는 사업자등록번호당 한 번만 신청할 수 있습니다.
+    submission_id = new_submission_id()
+    reservation = get_capacity_tracker().reserve(event.round, participation_type, submission_id, fields["business_number"])
+    if reservation == ALREADY_APPLIED:
+        st.error(f"이 사업자등록번호로 이미 {event.round}회차에 신청하셨습니다. 신청 내용을 바꾸시려면 운영 사무국에 문의해 주세요.")
+        return
+    if reservation == SEATS_FULL:
+        st.error(f"{participation_type} 참가는 선착순 정원이 모두 찼습니다.")
+        return
+    try:
+        get_intake_store().submit(event.round, fields, attachments, submission_id)
+    except IntakeBusy as e:
+        get_capacity_tracker().release(submission_id)
+        st.warning(str(e))
+        return
+    st.success(f"참가 신청이 접수되었습니다. 접수 번호: {submission_id[:12].upper()}")
+
+def render_faq_section_html():
     faq_html = f"""
     <style>
         #section-faq {{ background-color: var(--white-color); }}
@@ -608,7 +914,10 @@ def display_faq_section():
         }}
         .faq-intro p {{ margin-bottom: 12px; line-height: 1.75; }}
         .faq-intro p:last-child {{ margin-bottom: 0; }}
+        #section-faq {{ padding-bottom: 30px; }}
+        .faq-list-section {{ padding-top: 20px; }}
         .faq-list-container {{ max-width: 900px; margin: 0 auto; }}
+        .faq-empty {{ text-align: center; color: var(--text-muted); font-size: 1.05rem; }}
         .faq-item {{
             background-color: var(--white-color);
             border: 1px solid var(--border-color);
@@ -671,43 +980,44 @@ def display_faq_section():
         <div class="faq-intro">
             <p>❓ 궁금하신 질문을 클릭하시면 답변이 표시됩니다.</p>
             <p>모집 기간 중 수집 된 문의 사항 중 공유가 가능한 답변이 수시로 업데이트 됩니다.</p>
+            <p>아래 검색창에 궁금한 내용을 입력하면 관련 질문만 모아 볼 수 있습니다.</p>
         </div>
-        <div class="faq-list-container">
-            <details class="faq-item">
-                <summary class="faq-question">신청 가능한 ‘사회서비스 기업’은 어떤 곳인가요?</summary>
-                <div class="faq-answer">
-                    <p>‘사회서비스 기업’은 「사회보장기본법」 제3조 제4호에 따라 복지, 보건의료, 교육, 고용, 주거, 문화, 환경 등의 분야에서 상담, 재활, 돌봄, 정보의 제공, 관련 시설의 이용, 역량 개발, 사회참여 지원 등을 통해 국민 삶의 질이 향상되도록 서비스를 제공하는 기업입니다.</p>
-                </div>
-            </details>
-            <details class="faq-item">
-                <summary class="faq-question">지원 신청서 양식은 어디서 다운로드 받을 수 있나요?</summary>
-                <div class="faq-answer">
-                    <p>본 페이지의 <a href="#section-application-method">신청 양식 다운로드 칸 내(클릭)</a>에서 다운로드 가능합니다.</p>
-                </div>
-            </details>
-            <details class="faq-item">
-                <summary class="faq-question">최종 선정 팀 발표는 언제, 어떻게 되나요?</summary>
-                <div class="faq-answer">
-                    <p>심사 결과는 대표자 이메일 및 유선 연락을 통해 개별 통보되며, 1-2주 이내로 발표될 예정으로 선발 후 오리엔테이션이 진행될 예정입니다.</p>
-                </div>
-            </details>
-            <details class="faq-item">
-                <summary class="faq-question">‘소링아(소셜링크아카데미)’가 궁금해요!</summary>
-                <div class="faq-answer">
-                    <p>소링아(소셜링크아카데미)는 사회서비스 기업의 투자 유치 역량 강화를 위한 사회서비스 전문 액셀러레이팅 프로그램입니다.</p>
-                    <p>기업가치 고도화 및 투자 유치 역량 강화를 필요로 하는 혁신기술 또는 사회서비스 제공 기업을 대상으로 기본교육 및 심화교육을 제공하고 있습니다.</p>
-                    <p>상세 내용은 아래 링크 참고 부탁드립니다. <a href="https://sociallink3.streamlit.app/" target="_blank">소링아에 대해서 자세히 보러 가기(클릭)</a></p>
-                </div>
-            </details>
+    </section>
+    """
+    return faq_html
+
+# FAQ 목록은 content/faq.json 에서 읽고, 검색어가 있으면 faq.FAQ_INDEX 로 찾은 항목만 (펼친 상태로) 보여 줍니다.
+FAQ_SEARCH_LIMIT = 20
+
+def render_faq_list_html(entries, expanded=False):
+    def faq_item_html(entry):
+        answer_html = "".join(f"<p>{paragraph}</p>" for paragraph in entry.answer)
+        return f"""
+            <details class="faq-item"{" open" if expanded else ""}>
+                <summary class="faq-question">{entry.question}</summary>
+                <div class="faq-answer">{answer_html}</div>
+            </details>"""
+
+    items_html = "".join(faq_item_html(entry) for entry in entries) or '<p class="faq-empty">검색 결과가 없습니다. 다른 표현으로 검색하거나 아래 문의처로 연락해 주세요.</p>'
+    return f"""
+    <section class="section faq-list-section">
+        <div class="faq-list-container">{items_html}
         </div>
     </section>
     """
-    st.markdown(faq_html, unsafe_allow_html=True)
 
-def display_contact_section():
-    contact_email = "kcpassinvest@gmail.com"
-    phone_number = "02-499-5111"
-    operator_name = "프로그램 운영 사무국 (MYSC)"
+def display_faq_section():
+    emit_section("faq")
+    query = st.text_input("FAQ 검색", placeholder="예: 신청서 양식, 발표, 소링아", key="faq_query", label_visibility="collapsed").strip()
+    if not query:
+        emit_section("faq_list")
+        return
+    st.markdown(render_faq_list_html(FAQ_INDEX.search(query, limit=FAQ_SEARCH_LIMIT), expanded=True), unsafe_allow_html=True)
+
+def render_contact_section_html(contact):
+    contact_email = contact.email
+    phone_number = contact.phone
+    operator_name = contact.operator_name
     section_style = f"""
     <style>
         #section-contact {{ padding: 100px 25px; background-color: var(--white-color); color: var(--text-primary); font-family: 'Pretendard', sans-serif; text-align: center; position: relative; overflow: hidden; }}
@@ -736,9 +1046,13 @@ def display_contact_section():
         </div>
     </section>
     """
-    st.markdown(section_style, unsafe_allow_html=True)
+    return section_style
 
-def display_footer():
+def display_contact_section():
+    emit_section("contact")
+
+def render_footer_html(logos):
+    logo_mohw, logo_kssi, logo_mysc = logos
     footer_html = f"""
     <style>
         .page-footer {{ background-color: var(--background-dark-gray); color: var(--text-muted); padding: 70px 25px; text-align: center; font-size: 1rem; line-height: 1.75; border-top: 1px solid #444; }}
@@ -754,27 +1068,78 @@ def display_footer():
     </style>
     <footer class="page-footer">
         <div class="footer-logo-container">
-            <div class="footer-logo-item">{f'<img src="{LOGO_MOHW_DATA_URI}" alt="보건복지부">' if LOGO_MOHW_DATA_URI else "<span>보건복지부</span>"}</div>
-            <div class="footer-logo-item">{f'<img src="{LOGO_KSSI_DATA_URI}" alt="중앙사회서비스원">' if LOGO_KSSI_DATA_URI else "<span>중앙사회서비스원</span>"}</div>
-            <div class="footer-logo-item">{f'<img src="{LOGO_MYSC_DATA_URI}" alt="엠와이소셜컴퍼니(MYSC)">' if LOGO_MYSC_DATA_URI else "<span>엠와이소셜컴퍼니(MYSC)</span>"}</div>
+            <div class="footer-logo-item">{logo_mohw.html() if logo_mohw else "<span>보건복지부</span>"}</div>
+            <div class="footer-logo-item">{logo_kssi.html() if logo_kssi else "<span>중앙사회서비스원</span>"}</div>
+            <div class="footer-logo-item">{logo_mysc.html() if logo_mysc else "<span>엠와이소셜컴퍼니(MYSC)</span>"}</div>
         </div>
         <div class="footer-links"></div>
         <p class="footer-copyright">© 2025 사회서비스 투자 교류회 운영사무국. All Rights Reserved.<br>본 투자교류회는 <strong>보건복지부, 중앙사회서비스원, 엠와이소셜컴퍼니(MYSC)</strong>가 함께합니다.</p>
     </footer>
     """
-    st.markdown(footer_html, unsafe_allow_html=True)
+    return footer_html
+
+def display_footer():
+    emit_section("footer")
+
+SECTION_RENDERERS = {
+    "header": render_header_html,
+    "hero": render_hero_section_html,
+    "introduction": render_introduction_section_html,
+    "participation_guide": render_participation_guide_section_html,
+    "event_composition": render_event_composition_section_html,
+    "annual_schedule": render_annual_schedule_section_html,
+    "application_method": render_application_method_section_html,
+    "faq": render_faq_section_html,
+    "faq_list": render_faq_list_html,
+    "contact": render_contact_section_html,
+    "footer": render_footer_html,
+}
+
+# 페이지를 구성하는 섹션 순서 (export_static.py 도 같은 순서로 정적 페이지를 만듭니다)
+# 첫 화면(헤더·히어로)은 바로 보내고, 나머지는 progressive.py 가 스크롤·유휴 시점에 보냅니다.
+ABOVE_THE_FOLD = (
+    inject_global_styles_and_header,
+    display_hero_section,
+)
+BELOW_THE_FOLD = (
+    display_deferred_styles,
+    display_introduction_section,
+    display_participation_guide_section,
+    display_event_composition_section,
+    display_annual_schedule_section,
+    display_application_method_section,
+    display_application_form_section,
+    display_faq_section,
+    display_contact_section,
+    display_footer,
+)
+PAGE_SECTIONS = ABOVE_THE_FOLD + BELOW_THE_FOLD
+
+# --- 렌더링 계측 (render_metrics.py) ---
+# TOOJAK_METRICS_PORT 또는 TOOJAK_METRICS_LOG_INTERVAL 이 설정된 경우에만 섹션별 시간·크기·캐시 적중을 기록합니다.
+RENDER_METRICS.start_from_env()
+
+# --- 입장 제한 (admission.py) ---
+# 동시 세션이 TOOJAK_MAX_SESSIONS 를 넘으면 섹션을 그리지 않고 대기 화면만 보여 줍니다. 마감 시각도 함께 알려 줍니다.
+def waiting_room_notice():
+    event = SCHEDULE.edition(EDITION)
+    if not event.deadline:
+        return ""
+    return f"{event.round}회차 참가 신청 마감: {format_korean_deadline(event.deadline, with_year=False)}까지 · 대기 중에도 순번은 유지됩니다."
 
 def main():
-    inject_global_styles_and_header()
-    display_hero_section()
-    display_introduction_section()
-    display_participation_guide_section()
-    display_event_composition_section()
-    display_annual_schedule_section()
-    display_application_method_section()
-    display_faq_section()
-    display_contact_section()
-    display_footer()
+    if not wait_for_admission(PAGE_TITLE, waiting_room_notice()):
+        return
+    started = time.perf_counter()
+    if not PROGRESSIVE:
+        for display_section in PAGE_SECTIONS:
+            display_section()
+    else:
+        for display_section in ABOVE_THE_FOLD:
+            display_section()
+        display_progressively(BELOW_THE_FOLD)
+    if RENDER_METRICS.enabled:
+        RENDER_METRICS.observe_page(time.perf_counter() - started)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
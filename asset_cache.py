@@ -0,0 +1,81 @@
+import base64
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
+
+# --- 프로세스 공용 자산 캐시 ---
+# Streamlit 은 세션/재실행마다 app.py 를 처음부터 다시 실행하지만, import 된 모듈은 프로세스 단위로 유지됩니다.
+# 로고·신청서 파일의 디스크 읽기와 base64 인코딩 결과를 이 모듈에 보관해 프로세스당 한 번만 수행합니다.
+# 항목은 (경로, 종류)로 찾고 파일의 mtime/size 가 바뀌면 다시 읽으며, 총 용량이 max_bytes 를 넘으면 오래된 항목부터 버립니다.
+# 같은 항목을 여러 스레드가 동시에 처음 찾으면 한 스레드만 loader 를 실행하고 나머지는 그 결과를 기다립니다.
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+
+def _sizeof(value):
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    return sys.getsizeof(value)
+
+
+class AssetCache:
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # (경로, 종류) -> (파일 스탬프, 값, 크기)
+        self._loading = {}             # ((경로, 종류), 파일 스탬프) -> 만드는 중인 값의 Future
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, file_path, kind, loader):
+        """파일 변경 여부를 확인해 캐시된 값을 돌려주고, 없거나 바뀌었으면 loader(path)로 새로 만듭니다."""
+        path = Path(file_path)
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        key = (str(path.resolve()), kind)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stamp:
+                self._entries.move_to_end(key)
+                return entry[1]
+            pending = self._loading.get((key, stamp))
+            owner = pending is None
+            if owner:
+                pending = self._loading[(key, stamp)] = Future()
+        if not owner:
+            return pending.result()
+
+        # 인코딩은 락 밖에서 수행해 다른 자산 조회를 막지 않습니다.
+        try:
+            value = loader(path)
+        except BaseException as error:
+            with self._lock:
+                del self._loading[(key, stamp)]
+            pending.set_exception(error)
+            raise
+        size = _sizeof(value)
+        with self._lock:
+            del self._loading[(key, stamp)]
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= old[2]
+            if size <= self.max_bytes:
+                self._entries[key] = (stamp, value, size)
+                self._size += size
+                while self._size > self.max_bytes:
+                    _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                    self._size -= evicted_size
+        pending.set_result(value)
+        return value
+
+    def data_uri(self, file_path, mime_type):
+        def encode(path):
+            return f"data:{mime_type};base64,{base64.b64encode(path.read_bytes()).decode()}"
+        return self.get(file_path, ("data-uri", mime_type), encode)
+
+
+ASSET_CACHE = AssetCache()
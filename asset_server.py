@@ -0,0 +1,177 @@
+import argparse
+import mimetypes
+import os
+import re
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from precompress import ENCODINGS, is_variant, variant_path
+from static_assets import STATIC_DIR, content_hash
+
+# --- 정적 자산 서버 ---
+# static_assets.publish() 로 게시된 파일을 제공하는 가벼운 서버입니다. Streamlit 정적 서빙은 Cache-Control 을
+# 지정할 수 없으므로, 장기 캐시가 필요하면 이 서버(또는 static/ 을 복사한 CDN)를 두고 TOOJAK_ASSET_BASE_URL 로 연결합니다.
+#   python asset_server.py --port 8502
+# - 해시 파일명: Cache-Control: public, max-age=31536000, immutable
+# - ETag / If-None-Match → 304, Range(단일 구간) → 206
+# - Accept-Encoding 에 맞는 미리 압축된 .br/.gz 변형이 있으면 그 파일을 그대로 보냅니다 (요청별 압축 없음).
+#   ETag 는 인코딩별로 다르며, 변형이 있는 파일에는 Vary: Accept-Encoding 을 붙입니다.
+# - 디렉터리 요청은 그 안의 index.html 을 보냅니다 (export_static.py 결과를 --dir dist 로 확인할 때).
+IMMUTABLE_NAME_PATTERN = re.compile(r"\.[0-9a-f]{12}\.[A-Za-z0-9]+$")
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+COPY_CHUNK_SIZE = 64 * 1024
+
+mimetypes.add_type("application/x-hwp", ".hwp")
+mimetypes.add_type("image/webp", ".webp")
+
+
+def parse_range(header, size):
+    """'bytes=a-b' 형식의 단일 구간을 (start, end) 로 변환합니다. 해석할 수 없으면 None, 만족할 수 없으면 ValueError."""
+    match = re.fullmatch(r"\s*bytes=(\d*)-(\d*)\s*", header or "")
+    if not match or match.group(1) == match.group(2) == "":
+        return None
+    first, last = match.groups()
+    if first == "":
+        length = int(last)
+        if length == 0:
+            raise ValueError(header)
+        start, end = max(size - length, 0), size - 1
+    else:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError(header)
+    return start, end
+
+
+def accepted_encodings(header):
+    """Accept-Encoding 헤더에서 q>0 인 인코딩 집합. '*' 는 명시되지 않은 모든 인코딩을 뜻합니다."""
+    accepted, refused, wildcard = set(), set(), False
+    for item in (header or "").split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        match = re.search(r"q=([0-9.]+)", params)
+        if match:
+            try:
+                quality = float(match.group(1))
+            except ValueError:
+                quality = 0.0
+        if name == "*":
+            wildcard = quality > 0
+        elif quality > 0:
+            accepted.add(name)
+        else:
+            refused.add(name)
+    if wildcard:
+        accepted.update(encoding for encoding, _ in ENCODINGS if encoding not in refused)
+    return accepted
+
+
+def negotiate(path, accept_encoding):
+    """보낼 파일과 Content-Encoding 을 고릅니다. 변형이 없거나 받지 않으면 (원본, None)."""
+    accepted = accepted_encodings(accept_encoding)
+    for encoding, suffix in ENCODINGS:
+        variant = variant_path(path, suffix)
+        if encoding in accepted and variant.is_file():
+            return variant, encoding
+    return path, None
+
+
+def has_variants(path):
+    return any(variant_path(path, suffix).is_file() for _, suffix in ENCODINGS)
+
+
+class AssetRequestHandler(SimpleHTTPRequestHandler):
+    server_version = "TooJakAssets/1.0"
+
+    def __init__(self, *args, directory=None, **kwargs):
+        super().__init__(*args, directory=str(directory or STATIC_DIR), **kwargs)
+
+    def send_head(self):
+        path = Path(self.translate_path(self.path))
+        if path.is_dir():
+            path = path / "index.html"
+        if not path.is_file() or is_variant(path):
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return None
+
+        body_path, encoding = negotiate(path, self.headers.get("Accept-Encoding"))
+        size = body_path.stat().st_size
+        etag = f'"{content_hash(path)[:32]}{"-" + encoding if encoding else ""}"'
+        if etag in [tag.strip() for tag in self.headers.get("If-None-Match", "").split(",")]:
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self._send_cache_headers(path, etag)
+            self.end_headers()
+            return None
+
+        byte_range = None
+        if_range = self.headers.get("If-Range")
+        if "Range" in self.headers and (if_range is None or if_range == etag):
+            try:
+                byte_range = parse_range(self.headers["Range"], size)
+            except ValueError:
+                self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return None
+
+        start, end = byte_range or (0, size - 1)
+        self.send_response(HTTPStatus.PARTIAL_CONTENT if byte_range else HTTPStatus.OK)
+        self.send_header("Content-Type", self.guess_type(str(path)))
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("Content-Length", str(end - start + 1))
+        self.send_header("Accept-Ranges", "bytes")
+        if byte_range:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self._send_cache_headers(path, etag)
+        self.end_headers()
+
+        source = open(body_path, "rb")
+        source.seek(start)
+        self._remaining = end - start + 1
+        return source
+
+    def copyfile(self, source, outputfile):
+        remaining = self._remaining
+        while remaining > 0:
+            chunk = source.read(min(COPY_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            outputfile.write(chunk)
+            remaining -= len(chunk)
+
+    def list_directory(self, path):
+        self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+        return None
+
+    def _send_cache_headers(self, path, etag):
+        immutable = IMMUTABLE_NAME_PATTERN.search(path.name)
+        self.send_header("Cache-Control", IMMUTABLE_CACHE_CONTROL if immutable else REVALIDATE_CACHE_CONTROL)
+        self.send_header("ETag", etag)
+        if has_variants(path):
+            self.send_header("Vary", "Accept-Encoding")
+        self.send_header("Access-Control-Allow-Origin", "*")
+
+
+def serve(host="0.0.0.0", port=8502, directory=STATIC_DIR):
+    def handler(*args, **kwargs):
+        return AssetRequestHandler(*args, directory=directory, **kwargs)
+    with ThreadingHTTPServer((host, port), handler) as httpd:
+        print(f"정적 자산 서버: http://{host}:{port}/ ({directory})")
+        httpd.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="해시 파일명 정적 자산 서버")
+    parser.add_argument("--host", default=os.environ.get("TOOJAK_ASSET_HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.environ.get("TOOJAK_ASSET_PORT", "8502")))
+    parser.add_argument("--dir", default=str(STATIC_DIR))
+    args = parser.parse_args()
+    serve(args.host, args.port, Path(args.dir))
@@ -0,0 +1,229 @@
+import argparse
+import importlib
+import json
+import multiprocessing
+import os
+import resource
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+from export_static import CaptureBackend
+
+# --- 렌더링 벤치마크 ---
+# app.py 를 Streamlit AppTest(헤드리스 실행기)로 N 개 세션에서 동시에 실행해 스크립트 실행 지연(백분위),
+# st.markdown 호출별 전송 바이트, 최대 RSS 를 재고, 캡처 백엔드로 섹션별 렌더링 시간(캐시 전/후)을 잽니다.
+# AppTest 는 한 프로세스 안에서 동시에 실행할 수 없어 세션마다 별도 프로세스를 쓰고, 한 서버 프로세스 안의
+# 동시 세션(GIL 경합)은 캡처 백엔드로 main() 을 여러 스레드에서 실행해 따로 측정합니다.
+# AppTest 세션의 첫 실행은 점진적 렌더링(progressive.py)이 켜진 그대로, 즉 첫 화면(헤더·히어로)만 보내는 비용을 잽니다.
+#   python bench.py --sessions 20 --runs 5
+#   python bench.py --save-baseline bench_baseline.json     # 기준값 저장
+#   python bench.py --compare bench_baseline.json           # 기준 대비 회귀 시 종료 코드 1
+BASE_DIR = Path(__file__).resolve().parent
+APP_PATH = BASE_DIR / "app.py"
+COMPARED_METRICS = ("latency_ms.p50", "latency_ms.p90", "latency_ms.p99", "markdown_bytes.total")
+# 측정 조건은 실행하는 셸의 환경 변수와 관계없이 고정합니다: 배포 기본값(페이지 안 신청 폼, 점진적 렌더링)에
+# 입장 제한·지표 서버·콘텐츠 감시 스레드는 끈 상태. 접수 DB 와 업로드 위치는 bench_sessions 가 임시 디렉터리로 돌립니다.
+SESSION_ENV = {
+    "TOOJAK_NATIVE_INTAKE": "1",
+    "TOOJAK_PROGRESSIVE": "1",
+    "TOOJAK_MAX_SESSIONS": "0",
+    "TOOJAK_ASSET_BASE_URL": "",
+    "TOOJAK_METRICS_PORT": "",
+    "TOOJAK_METRICS_LOG_INTERVAL": "",
+    "TOOJAK_CONTENT_POLL_INTERVAL": "0",
+}
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = (len(ordered) - 1) * pct / 100
+    lower, upper = int(index), min(int(index) + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (index - lower)
+
+
+def set_environment(env):
+    os.environ.update(env)
+
+
+def run_session(runs, timeout):
+    from streamlit.testing.v1 import AppTest
+
+    app_test = AppTest.from_file(str(APP_PATH), default_timeout=timeout)
+    latencies = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        app_test.run()
+        latencies.append(time.perf_counter() - start)
+        if app_test.exception:
+            raise RuntimeError(app_test.exception[0].message)
+    markdown_bytes = [len(element.value.encode()) for element in app_test.markdown]
+    return latencies, markdown_bytes
+
+
+def bench_sessions(sessions, runs, timeout):
+    with tempfile.TemporaryDirectory(prefix="toojak-bench-") as data_dir:
+        env = {
+            **SESSION_ENV,
+            "TOOJAK_INTAKE_DB": str(Path(data_dir) / "intake.sqlite3"),
+            "TOOJAK_UPLOAD_DIR": str(Path(data_dir) / "uploads"),
+            "TOOJAK_IR_CHECK_DB": str(Path(data_dir) / "ir_checks.sqlite3"),
+        }
+        started = time.perf_counter()
+        # fork 는 Streamlit 의 백그라운드 스레드 상태까지 복제하므로 세션 프로세스는 spawn 으로 새로 띄웁니다.
+        # 환경은 app.py 를 가져오기 전에 initializer 로 설정합니다.
+        with ProcessPoolExecutor(max_workers=sessions, mp_context=multiprocessing.get_context("spawn"),
+                                 initializer=set_environment, initargs=(env,)) as pool:
+            results = list(pool.map(run_session, [runs] * sessions, [timeout] * sessions))
+        elapsed = time.perf_counter() - started
+
+    first_runs = [latencies[0] * 1000 for latencies, _ in results]
+    reruns = [latency * 1000 for latencies, _ in results for latency in latencies[1:]]
+    all_runs = first_runs + reruns
+    markdown_bytes = results[0][1]
+    return {
+        "sessions": sessions,
+        "runs_per_session": runs,
+        "wall_s": round(elapsed, 3),
+        "runs_per_s": round(len(all_runs) / elapsed, 1),
+        "latency_ms": {
+            "p50": round(percentile(all_runs, 50), 2),
+            "p90": round(percentile(all_runs, 90), 2),
+            "p99": round(percentile(all_runs, 99), 2),
+            "max": round(max(all_runs), 2),
+            "first_run_p50": round(percentile(first_runs, 50), 2),
+            "rerun_p50": round(percentile(reruns, 50), 2) if reruns else None,
+        },
+        "markdown_bytes": {
+            "calls": len(markdown_bytes),
+            "total": sum(markdown_bytes),
+            "per_call": markdown_bytes,
+            "mean": round(statistics.mean(markdown_bytes), 1) if markdown_bytes else 0,
+        },
+    }
+
+
+class ThreadLocalCapture(CaptureBackend):
+    """스레드마다 따로 HTML 을 모으는 캡처 백엔드."""
+
+    def __init__(self):
+        self._local = threading.local()
+
+    @property
+    def chunks(self):
+        if not hasattr(self._local, "chunks"):
+            self._local.chunks = []
+        return self._local.chunks
+
+
+def load_app():
+    sys.path.insert(0, str(BASE_DIR))
+    os.environ.update(SESSION_ENV)
+    os.environ["TOOJAK_NATIVE_INTAKE"] = "0"  # 신청 폼 위젯은 캡처 백엔드로 실행할 수 없습니다
+    os.environ["TOOJAK_PROGRESSIVE"] = "0"  # fragment·감시 프레임도 마찬가지로, 전체 섹션을 한 번에 그립니다
+    app = importlib.import_module("app")
+    app.st = ThreadLocalCapture()
+    return app
+
+
+def bench_threaded_renders(app, threads, runs):
+    """한 프로세스 안에서 threads 개 세션이 동시에 main() 을 실행할 때의 렌더링 지연."""
+    def session(_):
+        latencies = []
+        for _ in range(runs):
+            app.st.chunks.clear()
+            start = time.perf_counter()
+            app.main()
+            latencies.append((time.perf_counter() - start) * 1000)
+        return latencies
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        latencies = [latency for result in pool.map(session, range(threads)) for latency in result]
+    return {
+        "threads": threads,
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p90_ms": round(percentile(latencies, 90), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+    }
+
+
+def bench_sections(app, iterations):
+    """캡처 백엔드로 섹션 함수를 직접 호출해, 캐시가 빈 상태(cold)와 채워진 상태(warm)의 시간을 잽니다."""
+    from page_cache import SECTION_CACHE
+
+    backend = app.st
+    timings = {}
+    for display_section in app.PAGE_SECTIONS:
+        name = display_section.__name__
+        SECTION_CACHE.invalidate()
+        first_chunk = len(backend.chunks)  # 섹션 하나가 st.markdown 을 여러 번 부를 수 있으므로 이번 호출분을 모두 셉니다
+        start = time.perf_counter()
+        display_section()
+        cold = time.perf_counter() - start
+        section_bytes = sum(len(chunk.encode()) for chunk in backend.chunks[first_chunk:])
+        warm = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            display_section()
+            warm.append(time.perf_counter() - start)
+        timings[name] = {
+            "cold_ms": round(cold * 1000, 3),
+            "warm_ms": round(statistics.median(warm) * 1000, 4),
+            "bytes": section_bytes,
+        }
+    return timings
+
+
+def peak_rss_mb(who=resource.RUSAGE_SELF):
+    # 리눅스는 KB, macOS 는 바이트 단위입니다. RUSAGE_CHILDREN 은 세션 프로세스 중 가장 큰 값입니다.
+    peak = resource.getrusage(who).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def lookup(report, dotted):
+    value = report
+    for key in dotted.split("."):
+        value = value[key]
+    return value
+
+
+def compare(report, baseline, tolerance):
+    regressions = []
+    for metric in COMPARED_METRICS:
+        current, previous = lookup(report, metric), lookup(baseline, metric)
+        if previous and current > previous * (1 + tolerance):
+            regressions.append(f"{metric}: {previous} → {current} (+{(current / previous - 1) * 100:.0f}%)")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="app.py 렌더링 벤치마크")
+    parser.add_argument("--sessions", type=int, default=10, help="동시 세션 수 (기본값: 10)")
+    parser.add_argument("--runs", type=int, default=5, help="세션당 스크립트 실행 횟수 (첫 실행 + 재실행, 기본값: 5)")
+    parser.add_argument("--section-iterations", type=int, default=200, help="섹션별 warm 측정 반복 횟수")
+    parser.add_argument("--timeout", type=float, default=120.0, help="스크립트 실행 제한 시간(초, 첫 실행은 접수 DB 준비·정적 자산 게시·스타일시트 빌드 포함)")
+    parser.add_argument("--save-baseline", metavar="PATH", help="결과를 기준값으로 저장")
+    parser.add_argument("--compare", metavar="PATH", help="저장된 기준값과 비교")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="허용 회귀 비율 (기본값: 0.2 = 20%%)")
+    args = parser.parse_args()
+
+    report = bench_sessions(args.sessions, args.runs, args.timeout)
+    app = load_app()
+    report["sections"] = bench_sections(app, args.section_iterations)
+    report["threaded_render"] = bench_threaded_renders(app, args.sessions, args.runs * 10)
+    report["peak_rss_mb"] = {"session_process": peak_rss_mb(resource.RUSAGE_CHILDREN), "render_process": peak_rss_mb()}
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+    if args.save_baseline:
+        Path(args.save_baseline).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    if args.compare:
+        regressions = compare(report, json.loads(Path(args.compare).read_text(encoding="utf-8")), args.tolerance)
+        for regression in regressions:
+            print(f"회귀: {regression}", file=sys.stderr)
+        sys.exit(1 if regressions else 0)
@@ -0,0 +1,380 @@
+import argparse
+import csv
+import hashlib
+import hmac
+import io
+import os
+import re
+import sys
+import time
+import tomllib
+import zipfile
+from datetime import datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qsl, quote, urlencode, urlsplit
+from xml.sax.saxutils import escape
+
+from admin_queries import COMPLETENESS_ALL, ApplicationFilter, ApplicationQueries
+from events import KST
+from intake_store import DEFAULT_DB_PATH
+from upload_spool import DOCUMENT_KINDS, UPLOAD_DIR, object_path
+
+# --- 심사용 일괄 내보내기 ---
+# 심사 회의 전에 신청자 목록(CSV/XLSX)과 제출 서류 묶음(ZIP)을 만듭니다. 모든 단계가 생성기로 이어져 있어
+# 신청이 50건이든 5,000건이든 메모리에는 BATCH_SIZE 행과 COPY_CHUNK_SIZE 바이트만 올라갑니다.
+# - 행은 admin_queries 의 keyset 페이지로 BATCH_SIZE 개씩 읽습니다.
+# - XLSX 는 시트 XML 을 한 행씩 zip 항목에 바로 씁니다 (inline string, 공유 문자열 표 없음).
+# - ZIP 은 서류 파일을 조각 단위로 복사하며 항목을 하나씩 닫습니다. 출력이 파일이 아니어도(표준 출력, HTTP 응답) 됩니다.
+#   이미 압축된 PDF·HWP·이미지는 다시 압축하지 않습니다(ZIP_STORED).
+# 내려받기는 별도 서버로 제공합니다. Streamlit download_button 은 파일 전체를 만든 뒤에야 보내기 때문입니다.
+#   python bulk_export.py serve --port 8504
+#   python bulk_export.py csv --round 2 --out 제2회.csv     (--out 생략 시 표준 출력)
+# 서버 주소는 대시보드에 TOOJAK_EXPORT_URL 로 알려 주고, 서명 키는 TOOJAK_EXPORT_SECRET 또는
+# .streamlit/secrets.toml 의 export_secret 입니다. 대시보드가 만든 링크는 LINK_TTL_SECONDS 동안만 유효합니다.
+BATCH_SIZE = 500
+COPY_CHUNK_SIZE = 64 * 1024
+LINK_TTL_SECONDS = 10 * 60
+EXPORT_URL = os.environ.get("TOOJAK_EXPORT_URL", "http://localhost:8504")
+SECRETS_PATH = Path(__file__).resolve().parent / ".streamlit" / "secrets.toml"
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+XML_ILLEGAL_PATTERN = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+FILE_NAME_UNSAFE_PATTERN = re.compile(r'[\\/:*?"<>|\x00-\x1f]+')
+COLUMNS = (
+    "접수 번호", "회차", "참가 유형", "기업명", "사업자등록번호", "대표자", "담당자",
+    "이메일", "연락처", "제출 시각", "제출 서류 수", "누락 서류",
+)
+FORMATS = {
+    "csv": ("text/csv; charset=utf-8", ".csv"),
+    "xlsx": ("application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", ".xlsx"),
+    "zip": ("application/zip", ".zip"),
+}
+
+
+def export_rows(queries, application_filter, batch_size=BATCH_SIZE):
+    """COLUMNS 순서의 튜플을 하나씩 내보냅니다."""
+    for rows in queries.iter_pages(application_filter, batch_size):
+        for row in rows:
+            yield (
+                row["submission_id"].upper(),
+                row["round"],
+                row["participation_type"],
+                row["company_name"],
+                row["business_number"],
+                row["representative"],
+                row["contact_name"],
+                row["email"],
+                row["phone"],
+                row["submitted_at"][:19].replace("T", " "),
+                len(row["documents"]),
+                ", ".join(label for kind, (label, _) in DOCUMENT_KINDS.items() if kind not in row["documents"]),
+            )
+
+
+def spreadsheet_safe(value):
+    # 스프레드시트가 수식으로 해석하지 않도록 = + - @ 로 시작하는 값 앞에 ' 를 붙입니다.
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def csv_chunks(rows, chunk_size=COPY_CHUNK_SIZE):
+    """CSV 바이트 조각. 엑셀이 한글을 바로 읽도록 UTF-8 BOM 으로 시작합니다."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(COLUMNS)
+    yield "\ufeff".encode()
+    for row in rows:
+        writer.writerow([spreadsheet_safe(value) for value in row])
+        if buffer.tell() >= chunk_size:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode()
+
+
+def write_csv(rows, out):
+    for chunk in csv_chunks(rows):
+        out.write(chunk)
+
+
+# --- XLSX ---
+# 시트 하나짜리 최소 SpreadsheetML 패키지입니다. 첫 행(머리글)을 고정합니다.
+XLSX_PARTS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    ),
+    "xl/workbook.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="신청자" sheetId="1" r:id="rId1"/></sheets></workbook>'
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+        '</Relationships>'
+    ),
+}
+SHEET_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<sheetViews><sheetView workbookViewId="0">'
+    '<pane ySplit="1" topLeftCell="A2" activePane="bottomLeft" state="frozen"/>'
+    '</sheetView></sheetViews><sheetData>'
+)
+SHEET_FOOTER = "</sheetData></worksheet>"
+
+
+def sheet_cell(value):
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return f"<c><v>{value}</v></c>"
+    text = escape(XML_ILLEGAL_PATTERN.sub("", "" if value is None else str(value)))
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def sheet_row(values):
+    return "<row>" + "".join(sheet_cell(value) for value in values) + "</row>"
+
+
+def write_xlsx(rows, out):
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, xml in XLSX_PARTS.items():
+            archive.writestr(name, xml)
+        with archive.open("xl/worksheets/sheet1.xml", "w") as sheet:
+            sheet.write((SHEET_HEADER + sheet_row(COLUMNS)).encode())
+            for row in rows:
+                sheet.write(sheet_row(row).encode())
+            sheet.write(SHEET_FOOTER.encode())
+
+
+# --- 서류 ZIP ---
+# 제N회/참가 유형/기업명_접수번호/서류명.확장자 구조로 담고, 맨 앞에 신청자.csv 를 둡니다.
+# 업로드 저장소에 파일이 없는 서류는 건너뛰고 마지막에 누락_파일.txt 로 알립니다.
+def safe_name(text, fallback="이름없음"):
+    return FILE_NAME_UNSAFE_PATTERN.sub("_", (text or "").strip()).strip(". ")[:60] or fallback
+
+
+def attachment_entries(queries, application_filter, upload_dir=UPLOAD_DIR, batch_size=BATCH_SIZE):
+    """(zip 안 경로, 원본 경로 또는 None)."""
+    for rows in queries.iter_pages(application_filter, batch_size):
+        attachments = queries.attachments([row["submission_id"] for row in rows])
+        for row in rows:
+            folder = "/".join((
+                f"제{row['round']}회",
+                safe_name(row["participation_type"]),
+                f"{safe_name(row['company_name'])}_{row['submission_id'][:12].upper()}",
+            ))
+            for kind, file_name, sha256, _ in attachments.get(row["submission_id"], ()):
+                label = safe_name(DOCUMENT_KINDS.get(kind, (kind,))[0])
+                path = object_path(sha256, upload_dir)
+                yield f"{folder}/{label}{Path(file_name).suffix.lower()}", path if path.is_file() else None
+
+
+def write_zip(queries, application_filter, out, upload_dir=UPLOAD_DIR):
+    missing = []
+    with zipfile.ZipFile(out, "w") as archive:
+        listing_info = zipfile.ZipInfo("신청자.csv", now_zip_time())
+        listing_info.compress_type = zipfile.ZIP_DEFLATED
+        with archive.open(listing_info, "w") as listing:
+            write_csv(export_rows(queries, application_filter), listing)
+        for arcname, path in attachment_entries(queries, application_filter, upload_dir):
+            if path is None:
+                missing.append(arcname)
+                continue
+            info = zipfile.ZipInfo(arcname, now_zip_time())
+            info.file_size = path.stat().st_size  # 크기를 알려 두면 4GB 를 넘는 묶음에서만 zip64 헤더를 씁니다
+            with open(path, "rb") as source, archive.open(info, "w") as target:
+                while chunk := source.read(COPY_CHUNK_SIZE):
+                    target.write(chunk)
+        if missing:
+            archive.writestr("누락_파일.txt", "업로드 저장소에서 찾지 못한 서류입니다.\n" + "\n".join(missing) + "\n")
+
+
+def now_zip_time():
+    return datetime.now(KST).timetuple()[:6]
+
+
+def write_export(export_format, queries, application_filter, out, upload_dir=UPLOAD_DIR):
+    if export_format == "csv":
+        write_csv(export_rows(queries, application_filter), out)
+    elif export_format == "xlsx":
+        write_xlsx(export_rows(queries, application_filter), out)
+    elif export_format == "zip":
+        write_zip(queries, application_filter, out, upload_dir)
+    else:
+        raise ValueError(f"지원하지 않는 형식: {export_format}")
+
+
+def export_file_name(export_format, application_filter):
+    parts = [f"제{application_filter.round}회" if application_filter.round is not None else "전체회차"]
+    if application_filter.participation_type:
+        parts.append(application_filter.participation_type)
+    parts.append("서류" if export_format == "zip" else "신청자")
+    parts.append(datetime.now(KST).strftime("%Y%m%d"))
+    return "_".join(parts) + FORMATS[export_format][1]
+
+
+# --- 서명된 내려받기 링크 ---
+def export_secret():
+    secret = os.environ.get("TOOJAK_EXPORT_SECRET")
+    if not secret and SECRETS_PATH.is_file():
+        with open(SECRETS_PATH, "rb") as file:
+            secret = tomllib.load(file).get("export_secret")
+    return secret or None
+
+
+def filter_params(application_filter):
+    params = {
+        "round": application_filter.round,
+        "type": application_filter.participation_type,
+        "from": application_filter.submitted_from,
+        "to": application_filter.submitted_to,
+        "completeness": None if application_filter.completeness == COMPLETENESS_ALL else application_filter.completeness,
+    }
+    return {key: str(value) for key, value in params.items() if value not in (None, "")}
+
+
+def filter_from_params(params):
+    return ApplicationFilter(
+        int(params["round"]) if params.get("round") else None,
+        params.get("type") or None,
+        params.get("from") or None,
+        params.get("to") or None,
+        params.get("completeness") or COMPLETENESS_ALL,
+    )
+
+
+def signature(export_format, params, secret):
+    message = "&".join([export_format, *(f"{key}={params[key]}" for key in sorted(params))])
+    return hmac.new(secret.encode(), message.encode(), hashlib.sha256).hexdigest()
+
+
+def signed_url(export_format, application_filter, secret, base_url=EXPORT_URL, ttl=LINK_TTL_SECONDS):
+    params = {**filter_params(application_filter), "expires": str(int(time.time()) + ttl)}
+    params["signature"] = signature(export_format, params, secret)
+    return f"{base_url.rstrip('/')}/{export_format}?{urlencode(params)}"
+
+
+def verify(export_format, params, secret):
+    params = dict(params)
+    given = params.pop("signature", "")
+    if not params.get("expires", "").isdigit() or int(params["expires"]) < time.time():
+        return False
+    return hmac.compare_digest(given, signature(export_format, params, secret))
+
+
+# --- 내려받기 서버 ---
+class ChunkedWriter:
+    """HTTP/1.1 chunked 응답 본문. 작은 쓰기를 모아 COPY_CHUNK_SIZE 단위로 보냅니다.
+    tell() 이 없으므로 zipfile 은 데이터 디스크립터를 쓰는 스트리밍 모드로 동작합니다."""
+
+    def __init__(self, wfile):
+        self.wfile = wfile
+        self.buffer = bytearray()
+
+    def write(self, data):
+        self.buffer += data
+        if len(self.buffer) >= COPY_CHUNK_SIZE:
+            self.flush()
+        return len(data)
+
+    def flush(self):
+        if self.buffer:
+            self.wfile.write(f"{len(self.buffer):x}\r\n".encode() + bytes(self.buffer) + b"\r\n")
+            self.buffer.clear()
+
+    def close(self):
+        self.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+
+class ExportRequestHandler(BaseHTTPRequestHandler):
+    server_version = "TooJakExport/1.0"
+    protocol_version = "HTTP/1.1"
+    queries = None
+    secret = None
+    upload_dir = UPLOAD_DIR
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        export_format = url.path.strip("/")
+        if export_format not in FORMATS:
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+        params = dict(parse_qsl(url.query))
+        if not verify(export_format, params, self.secret):
+            self.send_error(HTTPStatus.FORBIDDEN, explain="링크가 만료되었거나 올바르지 않습니다. 대시보드에서 다시 내려받으세요.")
+            return
+        try:
+            application_filter = filter_from_params(params)
+        except ValueError:
+            self.send_error(HTTPStatus.BAD_REQUEST)
+            return
+
+        # 머리글을 먼저 보내고 본문은 만들어지는 대로 흘려보냅니다 (Content-Length 없음).
+        file_name = export_file_name(export_format, application_filter)
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", FORMATS[export_format][0])
+        self.send_header(
+            "Content-Disposition",
+            f"attachment; filename=\"export{FORMATS[export_format][1]}\"; filename*=UTF-8''{quote(file_name)}",
+        )
+        self.send_header("Cache-Control", "no-store")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        body = ChunkedWriter(self.wfile)
+        try:
+            write_export(export_format, self.queries, application_filter, body, self.upload_dir)
+            body.close()
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+
+
+def serve(host="0.0.0.0", port=8504, db_path=DEFAULT_DB_PATH, upload_dir=UPLOAD_DIR):
+    secret = export_secret()
+    if not secret:
+        raise SystemExit("서명 키가 없습니다. TOOJAK_EXPORT_SECRET 또는 secrets.toml 의 export_secret 을 지정하세요.")
+    handler = type("Handler", (ExportRequestHandler,), {
+        "queries": ApplicationQueries(db_path), "secret": secret, "upload_dir": Path(upload_dir),
+    })
+    with ThreadingHTTPServer((host, port), handler) as httpd:
+        print(f"내려받기 서버: http://{host}:{port}/")
+        httpd.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="신청자 목록·제출 서류를 내보냅니다.")
+    parser.add_argument("format", choices=[*FORMATS, "serve"])
+    parser.add_argument("--round", type=int)
+    parser.add_argument("--type", dest="participation_type")
+    parser.add_argument("--out", help="출력 파일 (생략 시 표준 출력)")
+    parser.add_argument("--db", default=str(DEFAULT_DB_PATH))
+    parser.add_argument("--uploads", default=str(UPLOAD_DIR))
+    parser.add_argument("--host", default=os.environ.get("TOOJAK_EXPORT_HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.environ.get("TOOJAK_EXPORT_PORT", "8504")))
+    args = parser.parse_args()
+    if args.format == "serve":
+        serve(args.host, args.port, args.db, args.uploads)
+    else:
+        application_filter = ApplicationFilter(args.round, args.participation_type)
+        queries = ApplicationQueries(args.db)
+        if args.out:
+            with open(args.out, "wb") as out:
+                write_export(args.format, queries, application_filter, out, Path(args.uploads))
+        else:
+            write_export(args.format, queries, application_filter, sys.stdout.buffer, Path(args.uploads))
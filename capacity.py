@@ -0,0 +1,213 @@
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from intake_store import DEFAULT_DB_PATH, SCHEMA as INTAKE_SCHEMA, normalize_business_number
+
+# --- 선착순 정원 관리 ---
+# 회차·참가 유형별 정원(content/events.json 의 capacity)과 확정된 자리 수를 접수 DB 에 두고,
+# 자리 확보는 "남은 자리가 있을 때만 1 증가" 하는 UPDATE 한 문장을 BEGIN IMMEDIATE 트랜잭션 안에서 실행합니다.
+# SQLite 의 쓰기 잠금이 프로세스 사이에서도 직렬화하므로, Streamlit 서버를 여러 개 띄워도 정원을 넘지 않습니다.
+# 자리 확보는 접수 번호와 함께 기록해 취소(release)를 여러 번 호출해도 한 번만 반영됩니다.
+# 같은 회차에는 사업자등록번호 하나당 한 자리만 잡을 수 있습니다 (reservations 의 유니크 인덱스).
+# 접수 기록은 큐를 거쳐 나중에 쓰이므로, 그 사이 프로세스가 죽으면 자리만 남습니다. 이런 자리는 접수 기록 없이
+# STALE_RESERVATION_SECONDS 가 지나면 시작할 때(reconcile)와 정원이 찼을 때 회수하고, 확정 수를 예약 수로 다시 셉니다.
+# 페이지 렌더링에서 읽는 잔여 좌석은 snapshot_ttl 초마다 한 스레드만 DB 에서 새로 읽고, 나머지는 잠금 없이
+# 직전 스냅숏(불변 dict)을 그대로 씁니다.
+SNAPSHOT_TTL_SECONDS = 2.0
+STALE_RESERVATION_SECONDS = 600.0
+
+RESERVED, SEATS_FULL, ALREADY_APPLIED = "reserved", "full", "duplicate"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS capacity (
+    round INTEGER NOT NULL,
+    participation_type TEXT NOT NULL,
+    seat_limit INTEGER NOT NULL,
+    taken INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (round, participation_type)
+);
+CREATE TABLE IF NOT EXISTS reservations (
+    submission_id TEXT PRIMARY KEY,
+    round INTEGER NOT NULL,
+    participation_type TEXT NOT NULL
+);
+"""
+RESERVATION_COLUMNS = {"business_number": "TEXT", "reserved_at": "REAL"}
+
+
+class CapacityTracker:
+    def __init__(self, db_path=DEFAULT_DB_PATH, snapshot_ttl=SNAPSHOT_TTL_SECONDS):
+        self.db_path = Path(db_path)
+        self.snapshot_ttl = snapshot_ttl
+        self._local = threading.local()
+        self._snapshot = {}  # (회차, 참가 유형) -> (확정 수, 정원)
+        self._snapshot_at = float("-inf")
+        self._refresh_lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = self._connection()
+        connection.executescript(INTAKE_SCHEMA + SCHEMA)
+        existing = {row[1] for row in connection.execute("PRAGMA table_info(reservations)")}
+        for column, column_type in RESERVATION_COLUMNS.items():
+            if column not in existing:
+                connection.execute(f"ALTER TABLE reservations ADD COLUMN {column} {column_type}")
+        connection.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS reservations_round_business ON reservations (round, business_number)"
+        )
+
+    def _connection(self):
+        # sqlite3 연결은 스레드 사이에 공유하지 않습니다.
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            self._local.connection = connection
+        return connection
+
+    def sync_limits(self, events):
+        """행사 설정의 정원을 DB 에 반영합니다. 이미 확정된 자리 수는 유지하고, 설정에서 빠진 정원은 지웁니다."""
+        rows = [(event.round, participation_type, limit) for event in events for participation_type, limit in event.capacity]
+        configured = {(round_number, participation_type) for round_number, participation_type, _ in rows}
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            existing = connection.execute("SELECT round, participation_type FROM capacity").fetchall()
+            connection.executemany(
+                "DELETE FROM capacity WHERE round = ? AND participation_type = ?",
+                [key for key in existing if key not in configured],
+            )
+            connection.executemany(
+                "INSERT INTO capacity (round, participation_type, seat_limit) VALUES (?, ?, ?) "
+                "ON CONFLICT (round, participation_type) DO UPDATE SET seat_limit = excluded.seat_limit",
+                rows,
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        self._snapshot_at = float("-inf")
+
+    def reserve(self, round_number, participation_type, submission_id, business_number):
+        """RESERVED, SEATS_FULL(정원이 참), ALREADY_APPLIED(같은 회차에 같은 사업자등록번호로 이미 신청) 중 하나.
+        정원이 정해지지 않은 유형도 중복 신청 확인을 위해 예약을 남깁니다."""
+        business_number = normalize_business_number(business_number)
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            if connection.execute("SELECT 1 FROM reservations WHERE submission_id = ?", (submission_id,)).fetchone():
+                connection.execute("COMMIT")
+                return RESERVED
+            if connection.execute(
+                "SELECT 1 FROM reservations WHERE round = ? AND business_number = ?", (round_number, business_number)
+            ).fetchone():
+                connection.execute("COMMIT")
+                return ALREADY_APPLIED
+            limited = connection.execute(
+                "SELECT 1 FROM capacity WHERE round = ? AND participation_type = ?", (round_number, participation_type)
+            ).fetchone()
+            if limited and not self._take_seat(connection, round_number, participation_type):
+                # 접수 기록 없이 남은 자리가 있으면 회수하고 한 번 더 시도합니다.
+                if not self._reclaim_stale(connection) or not self._take_seat(connection, round_number, participation_type):
+                    connection.execute("COMMIT")
+                    self._snapshot_at = float("-inf")
+                    return SEATS_FULL
+            connection.execute(
+                "INSERT INTO reservations (submission_id, round, participation_type, business_number, reserved_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (submission_id, round_number, participation_type, business_number, time.time()),
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        self._snapshot_at = float("-inf")
+        return RESERVED
+
+    def reconcile(self):
+        """접수 기록 없이 오래된 예약을 지우고 확정 수를 예약 수로 다시 맞춥니다. 지운 예약 수를 돌려줍니다.
+        프로세스를 시작할 때 한 번 부릅니다."""
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            # 이전 버전에서 만든 예약에는 사업자등록번호가 없으므로 접수 기록에서 채웁니다.
+            # 같은 회차에 이미 같은 번호가 있으면 유니크 인덱스에 걸리므로 건너뜁니다.
+            missing = connection.execute(
+                "SELECT r.submission_id, a.business_number FROM reservations r "
+                "JOIN applications a ON a.submission_id = r.submission_id WHERE r.business_number IS NULL"
+            ).fetchall()
+            connection.executemany(
+                "UPDATE OR IGNORE reservations SET business_number = ? WHERE submission_id = ?",
+                [(business_number, submission_id) for submission_id, business_number in missing],
+            )
+            removed = self._reclaim_stale(connection)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        self._snapshot_at = float("-inf")
+        return removed
+
+    @staticmethod
+    def _take_seat(connection, round_number, participation_type):
+        return connection.execute(
+            "UPDATE capacity SET taken = taken + 1 WHERE round = ? AND participation_type = ? AND taken < seat_limit",
+            (round_number, participation_type),
+        ).rowcount > 0
+
+    @staticmethod
+    def _reclaim_stale(connection):
+        # 열린 트랜잭션 안에서 부릅니다. 예약 시각이 없는(이전 버전) 예약도 접수 기록이 없으면 오래된 것으로 봅니다.
+        removed = connection.execute(
+            "DELETE FROM reservations WHERE (reserved_at IS NULL OR reserved_at < ?) "
+            "AND submission_id NOT IN (SELECT submission_id FROM applications)",
+            (time.time() - STALE_RESERVATION_SECONDS,),
+        ).rowcount
+        connection.execute(
+            "UPDATE capacity SET taken = (SELECT COUNT(*) FROM reservations r "
+            "WHERE r.round = capacity.round AND r.participation_type = capacity.participation_type)"
+        )
+        return removed
+
+    def release(self, submission_id):
+        """접수 번호로 확보한 자리를 돌려놓습니다. 이미 돌려놓았거나 없으면 False."""
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = connection.execute(
+                "SELECT round, participation_type FROM reservations WHERE submission_id = ?", (submission_id,)
+            ).fetchone()
+            if row:
+                connection.execute("DELETE FROM reservations WHERE submission_id = ?", (submission_id,))
+                connection.execute(
+                    "UPDATE capacity SET taken = taken - 1 WHERE round = ? AND participation_type = ? AND taken > 0", row
+                )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        self._snapshot_at = float("-inf")
+        return row is not None
+
+    def snapshot(self):
+        """{(회차, 참가 유형): (확정 수, 정원)}. 오래된 경우 한 스레드만 새로 읽고 나머지는 직전 값을 씁니다."""
+        if time.monotonic() - self._snapshot_at >= self.snapshot_ttl and self._refresh_lock.acquire(blocking=False):
+            try:
+                rows = self._connection().execute("SELECT round, participation_type, taken, seat_limit FROM capacity").fetchall()
+                self._snapshot = {(round_number, participation_type): (taken, limit) for round_number, participation_type, taken, limit in rows}
+                self._snapshot_at = time.monotonic()
+            finally:
+                self._refresh_lock.release()
+        return self._snapshot
+
+    def remaining(self, events):
+        """행사별 ((참가 유형, 남은 자리, 정원), ...) 튜플. 섹션 캐시 키로 쓸 수 있습니다."""
+        snapshot = self.snapshot()
+        seats = []
+        for event in events:
+            counts = []
+            for participation_type, limit in event.capacity:
+                taken, limit = snapshot.get((event.round, participation_type), (0, limit))
+                counts.append((participation_type, max(limit - taken, 0), limit))
+            seats.append(tuple(counts))
+        return tuple(seats)
@@ -0,0 +1,118 @@
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from events import EVENTS_FILE, read_schedule
+from faq import FAQ_FILE, read_faq
+
+# --- 콘텐츠 파일 감시 ---
+# 행사 일정(events.json), FAQ(faq.json), 문의처(contact.json)를 프로세스당 한 번 읽어 두고, 감시 스레드가
+# POLL_INTERVAL 초마다 파일의 mtime/size 를 확인해 바뀐 파일만 다시 읽습니다. 재실행마다 파일을 확인하지 않으며,
+# 바뀐 콘텐츠 이름을 on_change() 로 등록한 콜백에 알려 주면 app.py 가 그 콘텐츠를 쓰는 섹션만 미리 다시 렌더링합니다.
+# 읽기에 실패하면(편집 중인 JSON 등) 이전 값을 그대로 쓰고 경고만 남깁니다.
+CONTENT_DIR = Path(__file__).resolve().parent / "content"
+CONTACT_FILE = CONTENT_DIR / "contact.json"
+POLL_INTERVAL = float(os.environ.get("TOOJAK_CONTENT_POLL_INTERVAL", "1.0"))
+
+logger = logging.getLogger("toojak.content")
+
+
+@dataclass(frozen=True, slots=True)
+class Contact:
+    operator_name: str
+    email: str
+    phone: str
+
+
+def read_contact(path):
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    return Contact(operator_name=data["operator_name"], email=data["email"], phone=data["phone"])
+
+
+def _stamp(path):
+    try:
+        stat = Path(path).stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class ContentStore:
+    def __init__(self):
+        self._sources = {}    # 이름 -> (경로, 읽기 함수)
+        self._values = {}     # 이름 -> (파일 스탬프, 값)
+        self._listeners = {}  # 키 -> 콜백(바뀐 이름 집합)
+        self._lock = threading.Lock()
+        self._watcher = None
+
+    def register(self, name, path, reader):
+        self._sources[name] = (Path(path), reader)
+
+    def get(self, name):
+        entry = self._values.get(name)
+        if entry is None:
+            with self._lock:
+                entry = self._values.get(name) or self._load(name)
+        return entry[1]
+
+    def _load(self, name):
+        path, reader = self._sources[name]
+        entry = (_stamp(path), reader(path))
+        self._values[name] = entry
+        return entry
+
+    def on_change(self, key, callback):
+        """콘텐츠가 바뀌면 callback(바뀐 이름 집합)을 호출합니다. 같은 key 로 다시 등록하면 교체됩니다."""
+        self._listeners[key] = callback
+
+    def check(self):
+        """바뀐 파일을 다시 읽고 콜백에 알립니다. 바뀐 이름 집합을 돌려줍니다."""
+        changed = set()
+        with self._lock:
+            for name, (path, reader) in self._sources.items():
+                entry = self._values.get(name)
+                if entry is None:
+                    continue  # 아직 아무도 읽지 않은 콘텐츠는 처음 get() 할 때 읽습니다
+                stamp = _stamp(path)
+                if stamp == entry[0]:
+                    continue
+                try:
+                    value = reader(path)
+                except (OSError, ValueError, KeyError, TypeError) as e:
+                    logger.warning("%s 을(를) 다시 읽지 못해 이전 내용을 유지합니다: %s", path.name, e)
+                    self._values[name] = (stamp, entry[1])
+                    continue
+                self._values[name] = (stamp, value)
+                if value != entry[1]:
+                    changed.add(name)
+        if changed:
+            for callback in list(self._listeners.values()):
+                try:
+                    callback(frozenset(changed))
+                except Exception:
+                    logger.exception("콘텐츠 변경 처리 중 오류")
+        return changed
+
+    def watch(self, interval=POLL_INTERVAL):
+        """감시 스레드를 시작합니다. 프로세스당 한 번만 동작하며, interval 이 0 이면 감시하지 않습니다."""
+        if self._watcher is not None or interval <= 0:
+            return
+        with self._lock:
+            if self._watcher is not None:
+                return
+            def run():
+                while True:
+                    time.sleep(interval)
+                    self.check()
+            self._watcher = threading.Thread(target=run, name="toojak-content-watcher", daemon=True)
+            self._watcher.start()
+
+
+CONTENT_STORE = ContentStore()
+CONTENT_STORE.register("events", EVENTS_FILE, read_schedule)
+CONTENT_STORE.register("faq", FAQ_FILE, read_faq)
+CONTENT_STORE.register("contact", CONTACT_FILE, read_contact)
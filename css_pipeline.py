@@ -0,0 +1,121 @@
+import re
+from dataclasses import dataclass
+
+# --- CSS 추출·중복 제거·최소화 ---
+# 섹션마다 들어 있는 <style> 블록을 떼어 내 하나의 스타일시트로 합칩니다.
+#   - 주석/공백 제거, @media 안의 규칙까지 규칙 단위로 분해
+#   - 같은 문맥(@media)·선택자·선언의 규칙이 여러 번 나오면 마지막 것만 남김 (마지막 규칙이 이기므로 결과가 같음)
+#   - 연속된 같은 @media 규칙은 하나의 블록으로 다시 묶음
+# 히어로까지의 화면(헤더·히어로)에 필요한 규칙만 즉시 적용하고 나머지는 뒤로 미루는 데 사용됩니다.
+STYLE_BLOCK_PATTERN = re.compile(r"<style[^>]*>(.*?)</style>", re.S | re.I)
+GROUPING_AT_RULES = ("@media", "@supports")
+
+
+@dataclass(frozen=True)
+class Rule:
+    context: tuple  # 바깥 @media/@supports 조건들
+    prelude: str    # 선택자 또는 @keyframes 이름, 문장형 @규칙(@import)이면 전체 문장
+    body: str | None = None  # 선언 블록 (문장형 @규칙은 None)
+
+
+def split_styles(html):
+    """HTML 에서 <style> 블록을 떼어 내 (스타일 없는 HTML, CSS 목록)을 돌려줍니다."""
+    return STYLE_BLOCK_PATTERN.sub("", html), STYLE_BLOCK_PATTERN.findall(html)
+
+
+def _squeeze(text, punctuation):
+    text = re.sub(r"\s+", " ", text).strip()
+    return re.sub(rf"\s*([{re.escape(punctuation)}])\s*", r"\1", text)
+
+
+def _minify_prelude(prelude):
+    return _squeeze(prelude, ",>")
+
+
+def _minify_body(body):
+    return _squeeze(body, ";:{},").replace(";}", "}").rstrip(";")
+
+
+def _find(css, pos, targets):
+    """따옴표 안을 건너뛰며 targets 중 처음 나오는 문자의 위치를 찾습니다."""
+    quote = None
+    for index in range(pos, len(css)):
+        char = css[index]
+        if quote:
+            if char == quote and css[index - 1] != "\\":
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char in targets:
+            return index
+    return len(css)
+
+
+def _matching_brace(css, open_index):
+    depth, pos = 0, open_index
+    while pos < len(css):
+        pos = _find(css, pos, "{}")
+        if pos >= len(css):
+            break
+        depth += 1 if css[pos] == "{" else -1
+        if depth == 0:
+            return pos
+        pos += 1
+    raise ValueError("CSS 중괄호가 맞지 않습니다")
+
+
+def _parse_block(css, pos, context, rules):
+    while pos < len(css):
+        stop = _find(css, pos, "{};")
+        if stop >= len(css):
+            break
+        if css[stop] == "}":
+            return stop + 1
+        prelude = css[pos:stop].strip()
+        if css[stop] == ";":
+            if prelude:
+                rules.append(Rule(context, _squeeze(prelude, ",") + ";"))
+            pos = stop + 1
+        elif prelude.startswith(GROUPING_AT_RULES):
+            pos = _parse_block(css, stop + 1, context + (_squeeze(prelude, ","),), rules)
+        else:
+            end = _matching_brace(css, stop)
+            body = _minify_body(css[stop + 1:end])
+            if prelude and body:
+                rules.append(Rule(context, _minify_prelude(prelude), body))
+            pos = end + 1
+    return len(css)
+
+
+def parse(css):
+    rules = []
+    _parse_block(re.sub(r"/\*.*?\*/", "", css, flags=re.S), 0, (), rules)
+    return rules
+
+
+def deduplicate(rules):
+    """같은 규칙이 여러 번 나오면 마지막 위치의 것만 남깁니다."""
+    last_index = {rule: index for index, rule in enumerate(rules)}
+    return [rule for index, rule in enumerate(rules) if last_index[rule] == index]
+
+
+def serialize(rules):
+    # @import 등 문장형 규칙은 스타일시트 맨 앞에 있어야 유효합니다.
+    statements = [rule.prelude for rule in rules if rule.body is None]
+    parts, open_context = [], ()
+    for rule in (rule for rule in rules if rule.body is not None):
+        if rule.context != open_context:
+            parts.append("}" * len(open_context))
+            parts.extend(f"{condition}{{" for condition in rule.context)
+            open_context = rule.context
+        parts.append(f"{rule.prelude}{{{rule.body}}}")
+    parts.append("}" * len(open_context))
+    return "".join(dict.fromkeys(statements)) + "".join(parts)
+
+
+def build_stylesheet(css_blocks):
+    """여러 <style> 블록의 내용을 중복 제거·최소화된 하나의 스타일시트로 만듭니다."""
+    rules = []
+    for css in css_blocks:
+        rules.extend(parse(css))
+    return serialize(deduplicate(rules))
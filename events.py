@@ -0,0 +1,109 @@
+import json
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from pathlib import Path
+
+# --- 행사 일정 모델 ---
+# 연간 일정 카드와 히어로 안내는 content/events.json 한 곳에서 읽습니다.
+# 모집 상태는 현재 시각과 마감 시각을 비교해 계산하므로, 마감이 지나면 재배포 없이 카드가 '모집 마감'으로 바뀝니다.
+#   - deadline 이 없으면 '모집예정' (모집 공고 전), opens_at 이 있으면 그 이전까지 '모집예정'
+#   - deadline 이 지나면(마감일이 없으면 행사일이 되면) '모집 마감'
+EVENTS_FILE = Path(__file__).resolve().parent / "content" / "events.json"
+KST = timezone(timedelta(hours=9), "KST")
+WEEKDAYS_KO = "월화수목금토일"
+
+STATUS_SCHEDULED = "scheduled"
+STATUS_OPEN = "open"
+STATUS_CLOSED = "closed"
+STATUS_LABELS = {STATUS_SCHEDULED: "모집예정", STATUS_OPEN: "모집중", STATUS_CLOSED: "모집 마감"}
+
+
+def _parse_datetime(value):
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=KST)
+
+
+def format_korean_date(day, with_year=True):
+    text = f"{day.month}월 {day.day}일({WEEKDAYS_KO[day.weekday()]})"
+    return f"{day.year}년 {text}" if with_year else text
+
+
+def format_korean_deadline(moment, with_year=True):
+    moment = moment.astimezone(KST)
+    meridiem = "오전" if moment.hour < 12 else "오후"
+    hour = moment.hour % 12 or 12
+    minute = f" {moment.minute}분" if moment.minute else ""
+    return f"{format_korean_date(moment.date(), with_year)} {meridiem} {hour}시{minute}"
+
+
+@dataclass(frozen=True, slots=True)
+class Event:
+    round: int
+    theme: str
+    date: date
+    venue: str
+    details: str
+    start_time: str | None = None
+    deadline: datetime | None = None
+    opens_at: datetime | None = None
+    capacity: tuple = ()  # ((참가 유형, 정원), ...) — 선착순 마감 기준 (capacity.py)
+    selection: tuple = ()  # ((참가 유형, 선정 인원), ...) — 심사 후 최종 선정 인원 (scoring.py), 정원과 따로 정합니다
+    application_form: str | None = None  # 회차별 참가 신청서 양식 파일명 (앱 폴더 기준)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(round=int(data["round"]), theme=data["theme"], date=date.fromisoformat(data["date"]),
+                   venue=data["venue"], details=data.get("details", ""), start_time=data.get("start_time"),
+                   deadline=_parse_datetime(data.get("deadline")), opens_at=_parse_datetime(data.get("opens_at")),
+                   capacity=tuple((name, int(limit)) for name, limit in data.get("capacity", {}).items()),
+                   selection=tuple((name, int(count)) for name, count in data.get("selection", {}).items()),
+                   application_form=data.get("application_form"))
+
+    @property
+    def closes_at(self):
+        return self.deadline or datetime.combine(self.date, time(0), KST)
+
+    def status(self, now):
+        if now >= self.closes_at:
+            return STATUS_CLOSED
+        if self.deadline is None or (self.opens_at is not None and now < self.opens_at):
+            return STATUS_SCHEDULED
+        return STATUS_OPEN
+
+    @property
+    def date_label(self):
+        """카드용 표기 — 2025. 8. 4.(월)"""
+        return f"{self.date.year}. {self.date.month}. {self.date.day}.({WEEKDAYS_KO[self.date.weekday()]})"
+
+    @property
+    def datetime_label(self):
+        """히어로용 표기 — 2025년 8월 4일(월) 13:30"""
+        label = format_korean_date(self.date)
+        return f"{label} {self.start_time}" if self.start_time else label
+
+
+@dataclass(frozen=True, slots=True)
+class Schedule:
+    featured_round: int
+    events: tuple
+
+    @property
+    def featured(self):
+        return next(event for event in self.events if event.round == self.featured_round)
+
+    def edition(self, round_number):
+        """round_number 회차의 행사. 없는 회차면 대표 회차를 돌려줍니다."""
+        return next((event for event in self.events if event.round == round_number), self.featured)
+
+    def status_epoch(self, now=None):
+        """행사별 모집 상태 튜플. 값이 바뀔 때만 일정 카드가 다시 렌더링됩니다."""
+        now = now or datetime.now(KST)
+        return tuple(event.status(now) for event in self.events)
+
+
+def read_schedule(path):
+    data = json.loads(path.read_text(encoding="utf-8"))
+    events = tuple(sorted((Event.from_dict(item) for item in data["events"]), key=lambda event: event.round))
+    return Schedule(featured_round=int(data.get("featured_round", events[0].round)), events=events)
@@ -0,0 +1,114 @@
+import argparse
+import importlib
+import os
+import re
+import sys
+from pathlib import Path
+
+from css_pipeline import STYLE_BLOCK_PATTERN
+
+# --- 정적 사이트 내보내기 ---
+# app.py 의 display_* 섹션을 캡처 백엔드로 실행해, nginx/CDN 이 그대로 제공할 수 있는 정적 번들을 만듭니다.
+#   python export_static.py --out dist
+# 결과: dist/index.html (최소화된 단일 HTML) + dist/assets/ (해시 파일명의 로고, 신청서 양식, CSS)
+# 로고 변형과 매니페스트(image_pipeline.py)를 dist/assets/ 에 먼저 만든 뒤 앱을 불러옵니다.
+# 모든 파일 옆에 미리 압축한 .br/.gz 변형을 둡니다 (precompress.py, asset_server.py --dir dist 로 확인 가능).
+# 헤더·히어로용 핵심 CSS 는 <head> 에 인라인하고, 나머지 스타일시트는 preload 후 비동기로 적용합니다.
+# 모집 상태는 내보낸 시점 기준이므로, 마감 시각이 지나면 다시 내보내야 합니다.
+ASSETS_DIR_NAME = "assets"
+PRELOAD_LINK_PATTERN = re.compile(r'<link rel="preload"[^>]*>')
+
+
+class CaptureBackend:
+    """st.markdown 호출로 보내질 HTML 을 모아 두는 Streamlit 대역."""
+
+    def __init__(self):
+        self.chunks = []
+
+    def markdown(self, body, unsafe_allow_html=False, **kwargs):
+        self.chunks.append(body)
+
+    def text_input(self, label, value="", **kwargs):
+        return value  # 정적 페이지에는 입력값이 없으므로 기본값(빈 검색어)으로 렌더링합니다
+
+    def error(self, body, **kwargs):
+        raise RuntimeError(body)
+
+
+def load_app(asset_dir, asset_base_url):
+    """자산 게시 위치를 내보내기 디렉터리로 지정한 뒤 app 모듈을 불러옵니다."""
+    os.environ["TOOJAK_STATIC_DIR"] = str(asset_dir)
+    os.environ["TOOJAK_ASSET_BASE_URL"] = asset_base_url
+    os.environ["TOOJAK_NATIVE_INTAKE"] = "0"  # 정적 페이지에는 접수 서버가 없으므로 구글폼으로 연결합니다
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    for name in ("static_assets", "app"):
+        sys.modules.pop(name, None)
+    return importlib.import_module("app")
+
+
+def capture_sections(app):
+    """섹션별로 캡처한 HTML 을 (섹션 함수 이름, HTML) 목록으로 돌려줍니다."""
+    backend = CaptureBackend()
+    app.st = backend
+    sections = []
+    for display_section in app.PAGE_SECTIONS:
+        start = len(backend.chunks)
+        display_section()
+        sections.append((display_section.__name__, "".join(backend.chunks[start:])))
+    return sections
+
+
+def minify_html(html):
+    # 인라인 요소 사이의 공백은 화면에 보이므로 지우지 않고 하나로만 줄입니다.
+    return re.sub(r"\s+", " ", html).strip()
+
+
+def build_page(app, sections, critical_css, stylesheet_href):
+    body = STYLE_BLOCK_PATTERN.sub("", "".join(html for _, html in sections))
+    # 섹션 안의 preload 힌트(웹폰트)는 <head> 로 옮겨 가능한 한 일찍 요청되게 합니다.
+    preload_links = "".join(PRELOAD_LINK_PATTERN.findall(body))
+    body = PRELOAD_LINK_PATTERN.sub("", body)
+    return minify_html(f"""
+    <!DOCTYPE html>
+    <html lang="ko">
+    <head>
+        <meta charset="utf-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1">
+        <title>{app.PAGE_TITLE}</title>
+        <link rel="icon" href="data:image/svg+xml,<svg xmlns=%22http://www.w3.org/2000/svg%22 viewBox=%220 0 100 100%22><text y=%22.9em%22 font-size=%2290%22>{app.PAGE_ICON}</text></svg>">
+        {preload_links}
+        <style>{critical_css}</style>
+        <link rel="preload" as="style" href="{stylesheet_href}" onload="this.onload=null;this.rel='stylesheet'">
+        <noscript><link rel="stylesheet" href="{stylesheet_href}"></noscript>
+    </head>
+    <body style="margin:0"><div class="stApp">{body}</div></body>
+    </html>
+    """)
+
+
+def export(out_dir):
+    from image_pipeline import build_manifest
+    from precompress import precompress_tree
+    from static_assets import publish_bytes, write_atomic
+
+    out_dir = Path(out_dir).resolve()
+    asset_dir = out_dir / ASSETS_DIR_NAME
+    build_manifest(static_dir=asset_dir)
+    app = load_app(asset_dir, f"{ASSETS_DIR_NAME}/")
+    sections = capture_sections(app)
+
+    critical_css = app.page_stylesheet(critical=True)
+    css = app.page_stylesheet(critical=False)
+    stylesheet_name = publish_bytes(css.encode(), "site", ".css", asset_dir)
+    page = build_page(app, sections, critical_css, f"{ASSETS_DIR_NAME}/{stylesheet_name}")
+    write_atomic(out_dir / "index.html", page.encode())
+    precompress_tree(out_dir)
+    return out_dir / "index.html", len(page.encode()), len(css.encode())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="app.py 섹션을 정적 HTML 번들로 내보냅니다.")
+    parser.add_argument("--out", default="dist", help="출력 디렉터리 (기본값: dist)")
+    args = parser.parse_args()
+    index_path, page_bytes, css_bytes = export(args.out)
+    print(f"{index_path} ({page_bytes:,} bytes HTML, {css_bytes:,} bytes CSS)")
@@ -0,0 +1,128 @@
+import heapq
+import json
+import re
+from collections import Counter
+import threading
+import unicodedata
+from dataclasses import dataclass
+from pathlib import Path
+
+# --- 모집 FAQ ---
+# FAQ 항목은 content/faq.json 에 두고, 질문·답변 텍스트의 글자 2-gram(한 글자 검색어는 1-gram) 역색인으로 검색합니다.
+# 띄어쓰기를 지우고 색인하므로 "신청서양식"과 "신청서 양식"이 같은 결과를 냅니다.
+# 색인은 항목 id 단위로 추가·교체·삭제되어, FAQ 파일이 바뀌어도 바뀐 항목만 다시 색인합니다.
+FAQ_FILE = Path(__file__).resolve().parent / "content" / "faq.json"
+TAG_PATTERN = re.compile(r"<[^>]+>")
+MIN_SCORE = 0.6  # 검색어 2-gram 중 이 비율 이상이 들어 있는 항목만 돌려줍니다 (오타 한두 글자 허용)
+
+
+@dataclass(frozen=True, slots=True)
+class FaqEntry:
+    id: str
+    question: str
+    answer: tuple  # 문단별 HTML
+
+    @classmethod
+    def from_dict(cls, data):
+        answer = data["answer"]
+        return cls(id=data["id"], question=data["question"], answer=tuple([answer] if isinstance(answer, str) else answer))
+
+    @property
+    def text(self):
+        return " ".join((self.question, *(TAG_PATTERN.sub(" ", paragraph) for paragraph in self.answer)))
+
+
+def normalize(text):
+    """검색용 표기 — NFKC, 소문자, 글자·숫자만 남기고 공백 제거."""
+    text = unicodedata.normalize("NFKC", text).lower()
+    return "".join(char for char in text if char.isalnum())
+
+
+def grams(text):
+    text = normalize(text)
+    if len(text) < 2:
+        return set(text)
+    return {text[index:index + 2] for index in range(len(text) - 1)}
+
+
+class FaqIndex:
+    def __init__(self, entries=()):
+        self._entries = {}   # id -> FaqEntry (파일 순서 유지)
+        self._grams = {}     # id -> 그 항목의 gram 집합
+        self._postings = {}  # gram -> 항목 id 집합 (2-gram 과 1-gram 모두)
+        self._positions = {}  # id -> FAQ 안의 순서 (검색 결과 정렬용)
+        self._lock = threading.Lock()
+        self.sync(entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(self, entry):
+        """항목을 추가하거나, 같은 id 의 항목이 있으면 교체합니다."""
+        with self._lock:
+            if self._entries.get(entry.id) == entry:
+                return
+            self._remove(entry.id)
+            text = normalize(entry.text)
+            entry_grams = grams(text) | set(text)
+            self._entries[entry.id] = entry
+            self._positions.setdefault(entry.id, len(self._positions))
+            self._grams[entry.id] = entry_grams
+            for gram in entry_grams:
+                self._postings.setdefault(gram, set()).add(entry.id)
+
+    def remove(self, entry_id):
+        with self._lock:
+            self._remove(entry_id)
+
+    def _remove(self, entry_id):
+        self._entries.pop(entry_id, None)
+        self._positions.pop(entry_id, None)
+        for gram in self._grams.pop(entry_id, ()):
+            postings = self._postings.get(gram)
+            if postings is not None:
+                postings.discard(entry_id)
+                if not postings:
+                    del self._postings[gram]
+
+    def sync(self, entries):
+        """entries 와 같아지도록 바뀐 항목만 추가·교체·삭제하고, 순서는 entries 를 따릅니다."""
+        entries = tuple(entries)
+        if entries == self.entries:
+            return
+        wanted = {entry.id for entry in entries}
+        for entry_id in [entry_id for entry_id in self._entries if entry_id not in wanted]:
+            self.remove(entry_id)
+        for entry in entries:
+            self.add(entry)
+        with self._lock:
+            self._entries = {entry.id: self._entries[entry.id] for entry in entries}
+            self._positions = {entry.id: position for position, entry in enumerate(entries)}
+
+    @property
+    def entries(self):
+        return tuple(self._entries.values())
+
+    def search(self, query, limit=None):
+        """검색어와 겹치는 gram 비율이 높은 순(같으면 FAQ 순서)으로 항목을 돌려줍니다."""
+        query_grams = grams(query)
+        if not query_grams:
+            return self.entries
+        scores = Counter()
+        with self._lock:
+            for gram in query_grams:
+                scores.update(self._postings.get(gram, ()))
+            needed = len(query_grams) * MIN_SCORE
+            positions = self._positions
+            candidates = [entry_id for entry_id, score in scores.items() if score >= needed]
+            rank = lambda entry_id: (-scores[entry_id], positions[entry_id])
+            matches = heapq.nsmallest(limit, candidates, key=rank) if limit else sorted(candidates, key=rank)
+            return tuple(self._entries[entry_id] for entry_id in matches)
+
+
+def read_faq(path):
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return tuple(FaqEntry.from_dict(item) for item in data["entries"])
+
+
+FAQ_INDEX = FaqIndex()
@@ -0,0 +1,133 @@
+import argparse
+import ast
+import tempfile
+import urllib.request
+from pathlib import Path
+
+# --- Pretendard 서브셋 폰트 ---
+# 페이지 텍스트(app.py 와 app.py 가 가져오는 이 저장소의 모듈, content/*.json)에 실제로 쓰인 글자만 남긴
+# Pretendard WOFF2 를 만들어 직접 제공합니다. 대기 화면·신청 폼 오류처럼 다른 모듈에 있는 문구도 함께 들어갑니다.
+# jsDelivr 의 전체 CSS 를 @import 하면 텍스트가 그려지기 전에 외부 CSS 와 폰트를 차례로 받아야 하므로,
+# 서브셋 파일이 있으면 font-display: swap 인 @font-face 와 preload 힌트로 바꾸고, 없으면 기존 @import 를 그대로 씁니다.
+#   python font_pipeline.py --download            # jsDelivr 에서 원본을 받아 서브셋 생성
+#   python font_pipeline.py --source ~/Pretendard  # 내려받아 둔 원본(woff2/otf/ttf) 사용
+# 생성에는 fontTools 와 brotli 가 필요합니다 (pip install fonttools brotli). 페이지 문구를 바꾸면 다시 생성하세요.
+BASE_DIR = Path(__file__).resolve().parent
+FONT_DIR = BASE_DIR / "assets" / "fonts"
+PAGE_MODULE = BASE_DIR / "app.py"
+
+PRETENDARD_VERSION = "v1.3.9"
+PRETENDARD_CDN_CSS = f"https://cdn.jsdelivr.net/gh/orioncactus/pretendard@{PRETENDARD_VERSION}/dist/web/static/pretendard.min.css"
+PRETENDARD_CDN_WOFF2 = f"https://cdn.jsdelivr.net/gh/orioncactus/pretendard@{PRETENDARD_VERSION}/dist/web/static/woff2/Pretendard-{{name}}.woff2"
+PRETENDARD_WEIGHTS = {300: "Light", 400: "Regular", 500: "Medium", 600: "SemiBold", 700: "Bold", 800: "ExtraBold"}
+PRELOAD_WEIGHTS = (400, 700)  # 본문과 제목에 쓰이는 굵기만 미리 받습니다
+ALWAYS_INCLUDED = "".join(chr(code) for code in range(0x20, 0x7F)) + "·‘’“”…※→←↑↓−–—©"
+
+
+def subset_path(weight):
+    return FONT_DIR / f"Pretendard-{PRETENDARD_WEIGHTS[weight]}.subset.woff2"
+
+
+def available_weights():
+    return [weight for weight in PRETENDARD_WEIGHTS if subset_path(weight).is_file()]
+
+
+def font_face_css(url_for):
+    """서브셋 폰트의 @font-face 규칙. 서브셋이 없으면 jsDelivr CSS @import 로 대체합니다."""
+    weights = available_weights()
+    if not weights:
+        return f"@import url('{PRETENDARD_CDN_CSS}');"
+    return "".join(
+        f"@font-face {{ font-family: 'Pretendard'; font-style: normal; font-weight: {weight}; font-display: swap; "
+        f"src: url('{url_for(subset_path(weight))}') format('woff2'); }}"
+        for weight in weights
+    )
+
+
+def font_preload_html(url_for):
+    return "".join(
+        f'<link rel="preload" as="font" type="font/woff2" href="{url_for(subset_path(weight))}" crossorigin>'
+        for weight in PRELOAD_WEIGHTS if subset_path(weight).is_file()
+    )
+
+
+def local_imports(entry=PAGE_MODULE):
+    """entry 와, entry 가 (함수 안에서 가져오는 것까지) 직접·간접으로 가져오는 같은 디렉터리 모듈의 경로."""
+    found, pending = [], [Path(entry)]
+    while pending:
+        path = pending.pop()
+        if path in found:
+            continue
+        found.append(path)
+        for node in ast.walk(ast.parse(path.read_text(encoding="utf-8"))):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and not node.level and node.module:
+                names = [node.module]
+            else:
+                continue
+            pending += [module for name in names if (module := path.parent / f"{name.split('.')[0]}.py").is_file()]
+    return sorted(found)
+
+
+def text_sources():
+    return (*local_imports(), *sorted((BASE_DIR / "content").glob("*.json")))
+
+
+def used_text(sources=None):
+    # 모듈은 주석을 빼고 문자열 상수(f-string 조각 포함)만 봅니다.
+    chars = set(ALWAYS_INCLUDED)
+    sources = text_sources() if sources is None else sources
+    for source in sources:
+        text = source.read_text(encoding="utf-8")
+        if source.suffix == ".py":
+            text = "".join(node.value for node in ast.walk(ast.parse(text)) if isinstance(node, ast.Constant) and isinstance(node.value, str))
+        chars.update(text)
+    return "".join(sorted(char for char in chars if char.isprintable()))
+
+
+def download_sources(target_dir):
+    for name in PRETENDARD_WEIGHTS.values():
+        url = PRETENDARD_CDN_WOFF2.format(name=name)
+        print(f"내려받는 중: {url}")
+        urllib.request.urlretrieve(url, Path(target_dir) / f"Pretendard-{name}.woff2")
+
+
+def find_source(source_dir, name):
+    for suffix in (".woff2", ".otf", ".ttf"):
+        matches = sorted(Path(source_dir).rglob(f"Pretendard-{name}{suffix}"))
+        if matches:
+            return matches[0]
+    raise FileNotFoundError(f"{source_dir} 에서 Pretendard-{name} 원본을 찾을 수 없습니다")
+
+
+def build(source_dir):
+    from fontTools import subset
+
+    text = used_text()
+    FONT_DIR.mkdir(parents=True, exist_ok=True)
+    for weight, name in PRETENDARD_WEIGHTS.items():
+        options = subset.Options()
+        options.flavor = "woff2"
+        options.layout_features = ["*"]
+        font = subset.load_font(str(find_source(source_dir, name)), options)
+        subsetter = subset.Subsetter(options)
+        subsetter.populate(text=text)
+        subsetter.subset(font)
+        subset.save_font(font, str(subset_path(weight)), options)
+        print(f"{subset_path(weight).relative_to(BASE_DIR)}: {subset_path(weight).stat().st_size:,} bytes")
+    print(f"글자 수: {len(text)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="페이지에서 쓰는 글자만 담은 Pretendard WOFF2 서브셋을 만듭니다.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--source", help="Pretendard 원본 폰트(woff2/otf/ttf)가 있는 디렉터리")
+    source.add_argument("--download", action="store_true", help=f"jsDelivr 에서 Pretendard {PRETENDARD_VERSION} 원본을 내려받아 사용")
+    args = parser.parse_args()
+    if args.download:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            download_sources(tmp_dir)
+            build(tmp_dir)
+    else:
+        build(args.source)
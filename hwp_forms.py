@@ -0,0 +1,444 @@
+import argparse
+import csv
+import json
+import os
+import re
+import sqlite3
+import struct
+import sys
+import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from xml.etree import ElementTree
+
+try:
+    import olefile
+except ImportError:  # olefile 이 없으면 HWPX 만 읽을 수 있습니다 (HWP 5.0 을 만나면 설치 안내와 함께 멈춥니다)
+    olefile = None
+
+from intake_store import normalize_business_number
+from ir_validator import sha256_file
+
+# --- 참가 신청서(HWP) 항목 추출 ---
+# 제출된 참가 신청서(.hwp, .hwpx)에서 표의 "항목명 칸 → 오른쪽 칸" 값을 읽어 신청 정보로 정리합니다.
+# - HWP 5.0: OLE 복합 문서의 BodyText/Section* 스트림을 raw deflate(wbits=-15)로 풀고 레코드를 순회합니다.
+#   표 셀은 LIST_HEADER(태그 72)의 셀 주소(열·행·열 병합)로, 글자는 PARA_TEXT(태그 67)로 읽습니다.
+# - HWPX: Contents/section*.xml 의 hp:tc(cellAddr, cellSpan)와 hp:t 를 읽습니다.
+# 양식에 미리 적힌 안내 문구(PLACEHOLDERS: "0000-00-00", "00명(공고일 기준)" 등)가 그대로 남은 칸은 빈 값으로 봅니다. 체크박스는 □ 를 ■/☑/V 등으로 바꾼 항목을 선택으로 봅니다.
+# 결과는 파일 내용의 sha256 으로 캐시(data/hwp_forms.sqlite3)하고, 캐시에 없는 파일만 프로세스 풀에서 처리합니다.
+#   python hwp_forms.py form1.hwp form2.hwpx        # 파일 추출
+#   python hwp_forms.py --uploads --csv forms.csv   # 접수된 모든 신청서 추출 후 CSV 저장
+# HWP 5.0(OLE) 파일을 읽으려면 olefile 이 필요합니다 (pip install olefile).
+BASE_DIR = Path(__file__).resolve().parent
+CACHE_DB_PATH = Path(os.environ.get("TOOJAK_HWP_FORM_DB") or BASE_DIR / "data" / "hwp_forms.sqlite3")
+EXTRACTOR_VERSION = 2  # 추출 방식이 바뀌면 올려서 캐시를 무효화합니다
+
+HWP_SIGNATURE = b"HWP Document File"
+FLAG_COMPRESSED, FLAG_PASSWORD, FLAG_DISTRIBUTION = 0x1, 0x2, 0x4
+TAG_CTRL_HEADER, TAG_PARA_TEXT, TAG_LIST_HEADER = 71, 67, 72
+TABLE_CTRL_ID = b" lbt"  # 'tbl ' (리틀 엔디언)
+# 8 WCHAR 를 차지하는 확장·인라인 컨트롤 문자
+WIDE_CONTROL_CHARS = frozenset({1, 2, 3, 4, 5, 6, 7, 8, 9, 11, 12, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23})
+HWPX_NAMESPACE = "{http://www.hancom.co.kr/hwpml/2011/paragraph}"
+
+# 항목명(공백 제거) -> 필드
+LABELS = {
+    "성명": "representative",
+    "휴대폰번호": "phone",
+    "이메일주소": "email",
+    "회사명": "company_name",
+    "설립일자": "established_on",
+    "사업자등록번호": "business_number",
+    "근로자수": "employees",
+    "소재지": "address",
+    "명칭": "product_name",
+    "소셜미션": "social_mission",
+}
+CHECKBOX_LABELS = {"참가유형": "participation_type", "사회서비스분야": "service_field"}
+PARTICIPATION_OPTIONS = (("홍보테이블", "홍보테이블 운영"), ("발표", "IR 발표"))
+REQUIRED_FIELDS = {
+    "participation_type": "참가 유형", "company_name": "회사명", "business_number": "사업자 등록번호",
+    "representative": "대표자 성명", "phone": "휴대폰 번호", "email": "이메일 주소", "privacy_consent": "개인정보 동의",
+}
+EMPTY_BOX, CHECK_MARKS = "□☐", "■☑☒▣✔✓√"
+CHECKBOX_PATTERN = re.compile(f"([{EMPTY_BOX}{CHECK_MARKS}])")
+MARKED_LABEL_PATTERN = re.compile(r"^\s*[vVoO○●◉✔✓√]\s*")
+# 제출 양식에 적힌 안내 문구 그대로(공백을 지우고 비교). "0명"·"0" 처럼 실제로 적은 값은 빈 값으로 보지 않습니다.
+PLACEHOLDERS = frozenset({"010-0000-0000", "0000-00-00", "00명(공고일기준)", "*예:건강e옴", "1줄로작성하여주시기바랍니다."})
+CONSENT_PATTERN = re.compile(r"동의함\s*\(([^)]*)\)")
+
+
+@dataclass(frozen=True)
+class FormRecord:
+    sha256: str
+    size: int
+    participation_type: str = ""
+    company_name: str = ""
+    business_number: str = ""
+    representative: str = ""
+    phone: str = ""
+    email: str = ""
+    established_on: str = ""
+    employees: str = ""
+    address: str = ""
+    product_name: str = ""
+    social_mission: str = ""
+    service_field: str = ""
+    privacy_consent: bool = False
+    missing: tuple = ()  # 비어 있는 필수 항목 이름
+    error: str = ""
+
+    @property
+    def complete(self):
+        return not self.error and not self.missing
+
+
+@dataclass(frozen=True, slots=True)
+class Cell:
+    table: int
+    row: int
+    col: int
+    col_span: int
+    text: str
+
+
+class FormError(Exception):
+    """신청서를 읽을 수 없습니다 (암호화, 배포용 문서, 손상 등)."""
+
+
+def _para_text(payload):
+    chars = []
+    count = len(payload) // 2
+    codes = struct.unpack(f"<{count}H", payload[:count * 2])
+    index = 0
+    while index < count:
+        code = codes[index]
+        if code in WIDE_CONTROL_CHARS:
+            if code == 9:
+                chars.append("\t")
+            index += 8
+            continue
+        if code == 10 or code == 13:
+            chars.append("\n")
+        elif code >= 32:
+            chars.append(chr(code))
+        index += 1
+    return "".join(chars)
+
+
+def _records(data):
+    position, end = 0, len(data)
+    while position + 4 <= end:
+        (header,) = struct.unpack_from("<I", data, position)
+        position += 4
+        size = header >> 20
+        if size == 0xFFF:
+            (size,) = struct.unpack_from("<I", data, position)
+            position += 4
+        yield header & 0x3FF, (header >> 10) & 0x3FF, data[position:position + size]
+        position += size
+
+
+def _hwp_cells(path):
+    """HWP 5.0 문서의 (표 셀 목록, 표 밖 문단 목록)."""
+    if olefile is None:
+        # 파일 문제가 아니므로 FormError 로 기록(캐시)하지 않고 멈춥니다.
+        raise ImportError("HWP 5.0 신청서를 읽으려면 olefile 이 필요합니다: pip install olefile")
+    try:
+        document = olefile.OleFileIO(str(path))
+    except OSError as e:
+        raise FormError(f"HWP 파일을 열 수 없습니다 ({e})") from None
+    with document:
+        header = document.openstream("FileHeader").read() if document.exists("FileHeader") else b""
+        if not header.startswith(HWP_SIGNATURE):
+            raise FormError("HWP 5.0 문서가 아닙니다")
+        (flags,) = struct.unpack_from("<I", header, 36)
+        if flags & FLAG_PASSWORD:
+            raise FormError("암호가 걸린 문서입니다")
+        if flags & FLAG_DISTRIBUTION:
+            raise FormError("배포용 문서는 읽을 수 없습니다")
+        sections = sorted(
+            (entry for entry in document.listdir() if len(entry) == 2 and entry[0] == "BodyText" and entry[1].startswith("Section")),
+            key=lambda entry: int(entry[1][7:] or 0),
+        )
+        cells, paragraphs, table_count = [], [], 0
+        for entry in sections:
+            data = document.openstream(entry).read()
+            if flags & FLAG_COMPRESSED:
+                try:
+                    data = zlib.decompress(data, -15)
+                except zlib.error as e:
+                    raise FormError(f"본문을 풀 수 없습니다 ({e})") from None
+            table_count = read_section(data, cells, paragraphs, table_count)
+    return cells, paragraphs
+
+
+def read_section(data, cells, paragraphs, table_count=0):
+    """압축을 푼 BodyText 섹션 하나의 표 셀과 표 밖 문단을 덧붙이고, 지금까지의 표 개수를 돌려줍니다."""
+    tables = []  # [표 컨트롤 레벨, 표 번호, 현재 셀 글자 목록, 셀 주소] — 셀 안의 표가 위에 쌓입니다
+    for tag, level, payload in _records(data):
+        while tables and level <= tables[-1][0]:
+            _close_cell(tables.pop(), cells)
+        if tag == TAG_CTRL_HEADER and payload[:4] == TABLE_CTRL_ID:
+            tables.append([level, table_count, None, None])
+            table_count += 1
+        elif tag == TAG_LIST_HEADER and tables and level == tables[-1][0] + 1 and len(payload) >= 16:
+            _close_cell(tables[-1], cells)
+            col, row, col_span, _ = struct.unpack_from("<4H", payload, 8)
+            tables[-1][2], tables[-1][3] = [], (row, col, col_span)
+        elif tag == TAG_PARA_TEXT:
+            text = _para_text(payload)
+            (tables[-1][2] if tables and tables[-1][2] is not None else paragraphs).append(text)
+    while tables:
+        _close_cell(tables.pop(), cells)
+    return table_count
+
+
+def _close_cell(table, cells):
+    _, number, texts, address = table
+    if texts is not None:
+        row, col, col_span = address
+        cells.append(Cell(number, row, col, col_span, "".join(texts).strip()))
+        table[2] = None
+
+
+def _hwpx_cells(path):
+    """HWPX(OWPML) 문서의 (표 셀 목록, 표 밖 문단 목록)."""
+    try:
+        archive = zipfile.ZipFile(path)
+    except zipfile.BadZipFile:
+        raise FormError("HWPX 파일이 아닙니다") from None
+    cells, paragraphs, counter = [], [], [0]
+
+    def paragraph_text(paragraph):
+        # 문단 안의 글자만 모으고, 문단 안에 들어 있는 표는 따로 처리합니다.
+        texts = []
+        for run in paragraph.findall(f"{HWPX_NAMESPACE}run"):
+            for child in run:
+                if child.tag == f"{HWPX_NAMESPACE}t":
+                    texts.append("".join(child.itertext()))
+                elif child.tag == f"{HWPX_NAMESPACE}tbl":
+                    walk_table(child)
+        return "".join(texts)
+
+    def walk_table(table):
+        number = counter[0]
+        counter[0] += 1
+        for cell in (cell for row in table.findall(f"{HWPX_NAMESPACE}tr") for cell in row.findall(f"{HWPX_NAMESPACE}tc")):
+            if cell.find(f"{HWPX_NAMESPACE}cellAddr") is None:
+                continue
+            address, span = cell.find(f"{HWPX_NAMESPACE}cellAddr"), cell.find(f"{HWPX_NAMESPACE}cellSpan")
+            sub_list = cell.find(f"{HWPX_NAMESPACE}subList")
+            lines = [paragraph_text(paragraph) for paragraph in (sub_list if sub_list is not None else ()) if paragraph.tag == f"{HWPX_NAMESPACE}p"]
+            cells.append(Cell(number, int(address.get("rowAddr", 0)), int(address.get("colAddr", 0)),
+                              int(span.get("colSpan", 1)) if span is not None else 1, "\n".join(lines).strip()))
+
+    with archive:
+        names = sorted((name for name in archive.namelist() if re.fullmatch(r"Contents/section\d+\.xml", name)),
+                       key=lambda name: int(re.search(r"\d+", name).group()))
+        if not names:
+            raise FormError("HWPX 본문(section.xml)이 없습니다")
+        for name in names:
+            try:
+                root = ElementTree.fromstring(archive.read(name))
+            except ElementTree.ParseError as e:
+                raise FormError(f"HWPX 본문을 읽을 수 없습니다 ({e})") from None
+            for paragraph in root.findall(f"{HWPX_NAMESPACE}p"):  # 셀 안 문단은 walk_table 이 읽습니다
+                paragraphs.append(paragraph_text(paragraph))
+    return cells, paragraphs
+
+
+def _normalize_label(text):
+    return re.sub(r"\s+", "", text).replace("*", "")
+
+
+def _value(text):
+    text = text.strip()
+    compact = re.sub(r"[\s◦]+", "", text)
+    return "" if not compact or compact in PLACEHOLDERS else re.sub(r"\s*\n\s*", " ", text)
+
+
+def checked_options(text):
+    """체크박스 문구에서 선택된 항목 이름 목록. '□V 항목' 처럼 상자 뒤에 표시한 경우도 선택으로 봅니다."""
+    parts = CHECKBOX_PATTERN.split(text)
+    selected = []
+    for marker, label in zip(parts[1::2], parts[2::2]):
+        marked = MARKED_LABEL_PATTERN.match(label)
+        if marker in CHECK_MARKS or marked:
+            selected.append(MARKED_LABEL_PATTERN.sub("", label).split("※")[0].strip())
+    return selected
+
+
+def _participation_type(options):
+    types = {value for option in options for keyword, value in PARTICIPATION_OPTIONS if keyword in option}
+    return types.pop() if len(types) == 1 else ""
+
+
+def read_form(cells, paragraphs):
+    """셀 목록에서 신청 항목 dict 를 만듭니다."""
+    by_position = {(cell.table, cell.row, cell.col): cell for cell in cells}
+    values = {}
+    for cell in sorted(cells, key=lambda cell: (cell.table, cell.row, cell.col)):  # 같은 항목명이면 앞쪽 표(바깥 표)가 우선
+        # "참가 유형\n* 중복신청 불가" 처럼 항목명 아래에 안내가 붙은 칸은 첫 줄로 찾습니다.
+        field = next((LABELS.get(label) or CHECKBOX_LABELS.get(label)
+                      for label in (_normalize_label(cell.text), _normalize_label(cell.text.split("\n")[0]))
+                      if label in LABELS or label in CHECKBOX_LABELS), None)
+        if not field or field in values:
+            continue
+        neighbour = by_position.get((cell.table, cell.row, cell.col + cell.col_span))
+        if neighbour is None:
+            continue
+        if field == "participation_type":
+            values[field] = _participation_type(checked_options(neighbour.text))
+        elif field in CHECKBOX_LABELS.values():
+            values[field] = ", ".join(checked_options(neighbour.text))
+        else:
+            values[field] = _value(neighbour.text)
+    if values.get("business_number"):
+        digits = normalize_business_number(values["business_number"])
+        values["business_number"] = digits if len(digits) == 10 else values["business_number"]
+    consents = [match.group(1) for text in (*paragraphs, *(cell.text for cell in cells)) for match in CONSENT_PATTERN.finditer(text)]
+    values["privacy_consent"] = bool(consents) and all(consent.strip() for consent in consents)
+    return values
+
+
+def extract(path):
+    """신청서 한 개를 읽어 FormRecord 를 돌려줍니다. 읽을 수 없으면 error 에 이유를 담습니다."""
+    path = Path(path)
+    digest, size = sha256_file(path), path.stat().st_size
+    try:
+        with open(path, "rb") as source:
+            magic = source.read(8)
+        if magic.startswith(b"\xd0\xcf\x11\xe0"):
+            cells, paragraphs = _hwp_cells(path)
+        elif magic.startswith(b"PK"):
+            cells, paragraphs = _hwpx_cells(path)
+        else:
+            raise FormError("HWP/HWPX 파일이 아닙니다")
+        values = read_form(cells, paragraphs)
+    except FormError as e:
+        return FormRecord(digest, size, error=str(e))
+    except (OSError, struct.error, ValueError) as e:
+        return FormRecord(digest, size, error=f"신청서를 읽는 중 오류 ({e})")
+    missing = tuple(label for field, label in REQUIRED_FIELDS.items() if not values.get(field))
+    return FormRecord(digest, size, missing=missing, **values)
+
+
+class RecordCache:
+    """sha256 -> FormRecord 를 SQLite 에 보관합니다."""
+
+    def __init__(self, db_path=CACHE_DB_PATH):
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(db_path, timeout=30)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS hwp_forms (sha256 TEXT NOT NULL, version INTEGER NOT NULL, record TEXT NOT NULL, PRIMARY KEY (sha256, version))"
+        )
+
+    def get_many(self, digests):
+        found = {}
+        digests = list(digests)
+        for start in range(0, len(digests), 500):
+            chunk = digests[start:start + 500]
+            rows = self._connection.execute(
+                f"SELECT record FROM hwp_forms WHERE version = ? AND sha256 IN ({', '.join('?' * len(chunk))})", (EXTRACTOR_VERSION, *chunk)
+            )
+            for (row,) in rows:
+                values = json.loads(row)
+                values["missing"] = tuple(values["missing"])
+                found[values["sha256"]] = FormRecord(**values)
+        return found
+
+    def put_many(self, records):
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO hwp_forms (sha256, version, record) VALUES (?, ?, ?)",
+                [(record.sha256, EXTRACTOR_VERSION, json.dumps(asdict(record), ensure_ascii=False)) for record in records],
+            )
+
+    def close(self):
+        self._connection.close()
+
+
+def extract_many(paths, workers=None, cache=None, digests=None):
+    """여러 신청서를 추출해 {경로: FormRecord} 를 돌려줍니다.
+
+    캐시에 있는 파일은 건너뛰고 나머지만 프로세스 풀에서 처리합니다. digests(경로 -> sha256)를 알고 있으면
+    (예: upload_spool 의 내용 해시 경로) 해시 계산도 생략합니다.
+    """
+    paths = [Path(path) for path in paths]
+    own_cache = cache is None
+    cache = cache or RecordCache()
+    try:
+        digests = {path: (digests or {}).get(path) or sha256_file(path) for path in paths}
+        cached = cache.get_many(set(digests.values()))
+        pending = list({digests[path]: path for path in paths if digests[path] not in cached}.values())
+        if len(pending) > 1 and workers != 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                fresh = list(pool.map(extract, pending, chunksize=max(1, len(pending) // 32)))
+        else:
+            fresh = [extract(path) for path in pending]
+        cache.put_many(fresh)
+        cached.update((record.sha256, record) for record in fresh)
+        return {path: cached[digests[path]] for path in paths}
+    finally:
+        if own_cache:
+            cache.close()
+
+
+def uploaded_forms(db_path=None):
+    """접수된 신청의 참가 신청서 (접수 번호, 파일명, 경로, sha256) 목록. PDF 로 낸 신청서는 제외합니다."""
+    from intake_store import DEFAULT_DB_PATH
+    from upload_spool import object_path
+
+    connection = sqlite3.connect(db_path or DEFAULT_DB_PATH)
+    try:
+        rows = connection.execute(
+            "SELECT submission_id, file_name, sha256 FROM attachments WHERE kind = 'application_form' ORDER BY submission_id"
+        ).fetchall()
+    finally:
+        connection.close()
+    return [(submission_id, file_name, object_path(sha256), sha256) for submission_id, file_name, sha256 in rows
+            if Path(file_name).suffix.lower() in (".hwp", ".hwpx")]
+
+
+def describe(record):
+    if record.error:
+        return f"추출 불가 — {record.error}"
+    summary = f"{record.company_name or '(회사명 없음)'} · {record.representative or '(대표자 없음)'} · {record.participation_type or '(참가 유형 미선택)'}"
+    return summary if record.complete else f"{summary} · 누락: {', '.join(record.missing)}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="참가 신청서(HWP/HWPX)에서 신청 항목을 추출합니다.")
+    parser.add_argument("paths", nargs="*", help="추출할 신청서 파일")
+    parser.add_argument("--uploads", action="store_true", help="접수된 모든 신청서를 추출")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본값: CPU 수)")
+    parser.add_argument("--csv", metavar="PATH", help="추출 결과를 CSV 로 저장 ('-' 는 표준 출력)")
+    args = parser.parse_args()
+
+    targets = [("", str(path), Path(path), None) for path in args.paths]
+    if args.uploads:
+        targets += [(submission_id, f"{submission_id[:12].upper()} {file_name}", path, sha256) for submission_id, file_name, path, sha256 in uploaded_forms()]
+    try:
+        records = extract_many([path for _, _, path, _ in targets], args.workers, digests={path: sha256 for _, _, path, sha256 in targets if sha256})
+    except ImportError as e:
+        parser.exit(2, f"{e}\n")
+    if args.csv:
+        columns = ["submission_id", "file", *(field.name for field in fields(FormRecord))]
+        output = sys.stdout if args.csv == "-" else open(args.csv, "w", newline="", encoding="utf-8-sig")
+        try:
+            writer = csv.DictWriter(output, columns)
+            writer.writeheader()
+            for submission_id, label, path, _ in targets:
+                record = asdict(records[path])
+                writer.writerow({"submission_id": submission_id, "file": label, **record, "missing": " / ".join(record["missing"])})
+        finally:
+            if output is not sys.stdout:
+                output.close()
+    if args.csv != "-":
+        for _, label, path, _ in targets:
+            print(f"{label}: {describe(records[path])}")
+    parser.exit(0 if all(record.complete for record in records.values()) else 1)
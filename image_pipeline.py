@@ -0,0 +1,167 @@
+import argparse
+import base64
+import io
+import json
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import quote
+
+from asset_cache import ASSET_CACHE
+from static_assets import STATIC_DIR, content_hash, publish_bytes, write_atomic
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow 가 없으면 변형을 만들 수 없으므로 원본 이미지를 그대로 사용합니다
+    Image = None
+
+# --- 로고 이미지 최적화 ---
+# 로고는 헤더(34px)·소개(최대 60px)·푸터(55px)에서 작게 표시되지만 원본 PNG 는 수백~수천 px 입니다.
+# 표시 높이(60px)의 1x/2x 크기로 줄인 AVIF·WebP·PNG 를 빌드 단계에서 한 번만 만들어 해시 파일명으로 게시하고,
+# 원본 sha256 과 변형 파일명을 매니페스트(static/images.json)에 적어 둡니다. 인코딩(특히 AVIF·WebP method=6)은
+# 로고당 수 초가 걸리므로 앱은 매니페스트만 읽어 <picture>/srcset 마크업을 만들고, 실행 중에는 인코딩하지 않습니다.
+# 매니페스트가 없거나 원본이 바뀌었으면 원본 이미지를 그대로 씁니다.
+#   python image_pipeline.py                  # static/ 에 로고 변형과 매니페스트 생성 (export_static.py 도 실행)
+# 세 위치가 같은 변형을 공유하므로 브라우저는 로고마다 한 벌만 받습니다.
+BASE_DIR = Path(__file__).resolve().parent
+LOGO_FILES = ("mohw_logo.png", "kssi_logo.png", "mysc_logo.png")
+MANIFEST_NAME = "images.json"
+LOGO_DISPLAY_HEIGHT = 60
+DENSITIES = (1, 2)
+FORMAT_OPTIONS = {
+    "AVIF": {"quality": 70},
+    "WEBP": {"quality": 90, "method": 6},
+    "PNG": {"optimize": True},
+}
+MIME_TYPES = {"AVIF": "image/avif", "WEBP": "image/webp", "PNG": "image/png"}
+SUFFIXES = {"AVIF": ".avif", "WEBP": ".webp", "PNG": ".png"}
+
+logger = logging.getLogger("toojak.images")
+
+
+@dataclass(frozen=True)
+class ResponsiveImage:
+    alt: str
+    src: str
+    width: int | None = None
+    height: int | None = None
+    srcset: str = ""
+    sources: tuple = ()  # (MIME 타입, srcset) — 선호하는 형식부터
+
+    def html(self, img_class=""):
+        attrs = f' srcset="{self.srcset}"' if self.srcset else ""
+        if self.width and self.height:
+            attrs += f' width="{self.width}" height="{self.height}"'
+        if img_class:
+            attrs += f' class="{img_class}"'
+        img = f'<img src="{self.src}"{attrs} alt="{self.alt}" decoding="async">'
+        if not self.sources:
+            return img
+        sources = "".join(f'<source type="{mime}" srcset="{srcset}">' for mime, srcset in self.sources)
+        return f'<picture class="responsive-picture">{sources}{img}</picture>'
+
+
+def available_formats():
+    if Image is None:
+        return ()
+    Image.init()
+    return tuple(image_format for image_format in FORMAT_OPTIONS if image_format in Image.SAVE)
+
+
+def encode_variants(file_path, display_height=LOGO_DISPLAY_HEIGHT):
+    """(형식, 배율, 너비, 높이, 바이트) 목록. 빌드 단계에서만 호출합니다."""
+    variants = []
+    with Image.open(file_path) as original:
+        original.load()
+        image = original.convert("RGBA")
+    for density in DENSITIES:
+        height = min(display_height * density, image.height)
+        width = max(1, round(image.width * height / image.height))
+        resized = image.resize((width, height), Image.LANCZOS)
+        for image_format in available_formats():
+            buffer = io.BytesIO()
+            resized.save(buffer, image_format, **FORMAT_OPTIONS[image_format])
+            variants.append((image_format, density, width, height, buffer.getvalue()))
+    return variants
+
+
+def build_manifest(paths=LOGO_FILES, static_dir=STATIC_DIR, display_height=LOGO_DISPLAY_HEIGHT):
+    """paths 의 변형을 static_dir 에 게시하고 매니페스트를 씁니다. 원본이 그대로인 항목은 다시 인코딩하지 않습니다."""
+    if Image is None:
+        raise RuntimeError("Pillow 가 설치되어 있지 않아 이미지 변형을 만들 수 없습니다 (pip install pillow).")
+    static_dir = Path(static_dir)
+    manifest = dict(read_manifest(static_dir))
+    for file_path in paths:
+        path = Path(file_path) if Path(file_path).is_absolute() else BASE_DIR / file_path
+        digest = content_hash(path)
+        entry = manifest.get(path.name)
+        if (entry and entry["sha256"] == digest and entry["display_height"] == display_height
+                and all((static_dir / variant["name"]).is_file() for variant in entry["variants"])):
+            continue
+        manifest[path.name] = {
+            "sha256": digest,
+            "display_height": display_height,
+            "variants": [
+                {"format": image_format, "density": density, "width": width, "height": height,
+                 "name": publish_bytes(data, f"{path.stem}-{height}", SUFFIXES[image_format], static_dir)}
+                for image_format, density, width, height, data in encode_variants(path, display_height)
+            ],
+        }
+    write_atomic(static_dir / MANIFEST_NAME, json.dumps(manifest, ensure_ascii=False, indent=1).encode())
+    return manifest
+
+
+def read_manifest(static_dir=STATIC_DIR):
+    """{원본 파일명: 항목}. 매니페스트가 없거나 읽을 수 없으면 빈 dict."""
+    def load(path):
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except ValueError:
+            logger.warning("%s 를 읽을 수 없습니다. python image_pipeline.py 로 다시 만드세요.", path)
+            return {}
+    return ASSET_CACHE.get(Path(static_dir) / MANIFEST_NAME, "image-manifest", load) or {}
+
+
+def bytes_to_data_uri(data, image_format):
+    return f"data:{MIME_TYPES[image_format]};base64,{base64.b64encode(data).decode()}"
+
+
+def build_responsive_image(file_path, alt, static_dir=STATIC_DIR, base_url=None):
+    """매니페스트에 있는 변형으로 ResponsiveImage 를 만듭니다. 변형이 없거나 원본과 맞지 않으면 None.
+
+    base_url 이 있으면 게시된 변형의 URL 을 쓰고, 없으면 2x WebP(없으면 PNG) 하나를 데이터 URI 로 인라인합니다.
+    """
+    path = Path(file_path)
+    entry = read_manifest(static_dir).get(path.name)
+    if entry is None or entry["sha256"] != content_hash(path):
+        logger.warning("%s 의 이미지 변형이 없거나 오래되었습니다. python image_pipeline.py 를 실행하세요.", path.name)
+        return None
+    by_format = {}
+    for variant in entry["variants"]:
+        by_format.setdefault(variant["format"], []).append(variant)
+    if "PNG" not in by_format:
+        return None
+    display_width, display_height = by_format["PNG"][0]["width"], by_format["PNG"][0]["height"]
+
+    if base_url is None:
+        image_format = "WEBP" if "WEBP" in by_format else "PNG"
+        data = (Path(static_dir) / by_format[image_format][-1]["name"]).read_bytes()
+        return ResponsiveImage(alt, bytes_to_data_uri(data, image_format), display_width, display_height)
+
+    srcsets = {
+        image_format: ", ".join(f"{base_url}{quote(variant['name'])} {variant['density']}x" for variant in variants)
+        for image_format, variants in by_format.items()
+    }
+    png_src = base_url + quote(by_format["PNG"][0]["name"])
+    sources = tuple((MIME_TYPES[image_format], srcsets[image_format]) for image_format in ("AVIF", "WEBP") if image_format in srcsets)
+    return ResponsiveImage(alt, png_src, display_width, display_height, srcsets["PNG"], sources)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="로고 이미지의 AVIF/WebP/PNG 변형과 매니페스트를 만듭니다.")
+    parser.add_argument("paths", nargs="*", default=list(LOGO_FILES), help="원본 이미지 (기본값: 로고 세 개)")
+    parser.add_argument("--static-dir", default=str(STATIC_DIR))
+    args = parser.parse_args()
+    manifest = build_manifest(args.paths, args.static_dir)
+    for name in (Path(path).name for path in args.paths):
+        print(f"{name}: 변형 {len(manifest[name]['variants'])}개")
@@ -0,0 +1,199 @@
+import atexit
+import logging
+import os
+import queue
+import re
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+from events import KST
+
+# --- 참가 신청 접수 저장소 ---
+# 신청 제출은 메모리 큐에 넣고 바로 접수 번호를 돌려주며, 백그라운드 작성 스레드가 큐에 쌓인 신청을 묶어
+# 한 트랜잭션으로 SQLite(WAL 모드)에 기록합니다. 마감 직전에 수백 건이 몰려도 제출 요청은 디스크 쓰기를 기다리지 않습니다.
+# - 큐가 가득 차면(max_queue) IntakeBusy 를 던져 잠시 후 다시 제출하도록 안내합니다.
+# - 쓰기 실패(잠금 등)는 버리지 않고 간격을 늘려 가며 다시 시도합니다. submission_id 가 고유하므로 재시도해도 중복되지 않습니다.
+# - 프로세스 종료 시 남은 큐를 모두 기록합니다.
+# 저장 위치는 TOOJAK_INTAKE_DB (기본값: data/intake.sqlite3) 입니다.
+BASE_DIR = Path(__file__).resolve().parent
+DEFAULT_DB_PATH = Path(os.environ.get("TOOJAK_INTAKE_DB") or BASE_DIR / "data" / "intake.sqlite3")
+PARTICIPATION_TYPES = ("IR 발표", "홍보테이블 운영")
+ATTACHMENT_FIELDS = ("submission_id", "kind", "file_name", "sha256", "size")
+FIELDS = (
+    "submission_id", "round", "participation_type", "company_name", "business_number",
+    "representative", "contact_name", "email", "phone", "privacy_consent", "submitted_at",
+)
+EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS applications (
+    id INTEGER PRIMARY KEY,
+    submission_id TEXT NOT NULL UNIQUE,
+    round INTEGER NOT NULL,
+    participation_type TEXT NOT NULL,
+    company_name TEXT NOT NULL,
+    business_number TEXT NOT NULL,
+    representative TEXT NOT NULL,
+    contact_name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    phone TEXT NOT NULL,
+    privacy_consent INTEGER NOT NULL,
+    submitted_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS applications_round_submitted ON applications (round, submitted_at, id);
+CREATE INDEX IF NOT EXISTS applications_round_type_submitted ON applications (round, participation_type, submitted_at, id);
+CREATE INDEX IF NOT EXISTS applications_submitted ON applications (submitted_at, id);
+CREATE TABLE IF NOT EXISTS attachments (
+    submission_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    file_name TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    PRIMARY KEY (submission_id, kind)
+);
+"""
+
+logger = logging.getLogger("toojak.intake")
+
+
+class IntakeBusy(Exception):
+    """접수 큐가 가득 차 지금은 신청을 받을 수 없습니다."""
+
+
+def new_submission_id():
+    return uuid.uuid4().hex
+
+
+def normalize_business_number(value):
+    return re.sub(r"\D", "", value or "")
+
+
+def validate_application(fields):
+    """신청 항목을 확인해 오류 메시지 목록을 돌려줍니다 (비어 있으면 정상)."""
+    errors = []
+    labels = {"company_name": "기업(기관)명", "representative": "대표자명", "contact_name": "담당자명", "phone": "연락처"}
+    for name, label in labels.items():
+        if not str(fields.get(name, "")).strip():
+            errors.append(f"{label}을(를) 입력해 주세요.")
+    if fields.get("participation_type") not in PARTICIPATION_TYPES:
+        errors.append("참가 유형을 선택해 주세요.")
+    if len(normalize_business_number(fields.get("business_number"))) != 10:
+        errors.append("사업자등록번호 10자리를 입력해 주세요.")
+    if not EMAIL_PATTERN.match(str(fields.get("email", "")).strip()):
+        errors.append("올바른 이메일 주소를 입력해 주세요.")
+    if not fields.get("privacy_consent"):
+        errors.append("개인정보 수집·이용에 동의해 주세요.")
+    return errors
+
+
+def connect(db_path):
+    db_path = Path(db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def _insert_sql(table, fields):
+    return f"INSERT OR IGNORE INTO {table} ({', '.join(fields)}) VALUES ({', '.join('?' * len(fields))})"
+
+
+class IntakeStore:
+    def __init__(self, db_path=DEFAULT_DB_PATH, batch_size=200, max_queue=10000, max_retry_delay=5.0):
+        self.db_path = Path(db_path)
+        self.batch_size = batch_size
+        self.max_retry_delay = max_retry_delay
+        self.written = 0
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._closed = threading.Event()
+        self._connection = connect(self.db_path)
+        self._writer = threading.Thread(target=self._run, name="toojak-intake-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def submit(self, round_number, fields, attachments=(), submission_id=None):
+        """신청을 큐에 넣고 접수 번호를 돌려줍니다. 실제 기록은 작성 스레드가 합니다.
+
+        attachments 는 upload_spool.StoredFile 목록이며, 파일 자체는 이미 디스크에 저장된 상태여야 합니다.
+        submission_id 를 주면(예: 먼저 정원을 확보한 경우) 그 번호로 접수합니다.
+        """
+        if self._closed.is_set():
+            raise IntakeBusy("접수 저장소가 닫혔습니다")
+        record = {
+            **{name: str(fields.get(name, "")).strip() for name in FIELDS},
+            "submission_id": submission_id or new_submission_id(),
+            "round": int(round_number),
+            "business_number": normalize_business_number(fields.get("business_number")),
+            "privacy_consent": 1 if fields.get("privacy_consent") else 0,
+            "submitted_at": datetime.now(KST).isoformat(timespec="milliseconds"),
+        }
+        try:
+            self._queue.put_nowait((
+                tuple(record[name] for name in FIELDS),
+                tuple((record["submission_id"], item.kind, item.file_name, item.sha256, item.size) for item in attachments),
+            ))
+        except queue.Full:
+            raise IntakeBusy("접수 요청이 많아 잠시 후 다시 시도해 주세요") from None
+        return record["submission_id"]
+
+    def pending(self):
+        return self._queue.qsize()
+
+    def flush(self, timeout=None):
+        """지금까지 제출된 신청이 모두 기록될 때까지 기다립니다."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout=10.0):
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._writer.join(timeout)
+
+    def _next_batch(self):
+        try:
+            batch = [self._queue.get(timeout=0.5)]
+        except queue.Empty:
+            return []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, batch):
+        with self._connection:
+            self._connection.executemany(_insert_sql("applications", FIELDS), [record for record, _ in batch])
+            self._connection.executemany(_insert_sql("attachments", ATTACHMENT_FIELDS), [row for _, rows in batch for row in rows])
+
+    def _run(self):
+        while not (self._closed.is_set() and self._queue.empty()):
+            batch = self._next_batch()
+            if not batch:
+                continue
+            delay = 0.05
+            while True:
+                try:
+                    self._write(batch)
+                    break
+                except sqlite3.Error as e:
+                    logger.warning("신청 %d건 기록 실패, %.2f초 후 다시 시도합니다: %s", len(batch), delay, e)
+                    time.sleep(delay)
+                    delay = min(delay * 2, self.max_retry_delay)
+            self.written += len(batch)
+            for _ in batch:
+                self._queue.task_done()
+        self._connection.close()
@@ -0,0 +1,311 @@
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import re
+import sqlite3
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+# --- IR 자료 16:9 PDF 검사 ---
+# IR 발표 기업의 제출 서류는 "16:9 비율 PDF" 여야 합니다. 페이지를 그리지 않고 PDF 객체에서 페이지 상자
+# (CropBox, 없으면 MediaBox)와 /Rotate 만 읽어 비율·페이지 수·파일 크기를 보고합니다.
+# 페이지 순서는 /Root → /Pages → /Kids 를 문서 순서대로 따라가 정하고, 상자와 /Rotate 는 상위 Pages 노드에서 상속합니다.
+# 객체는 파일(mmap) 안의 위치만 기록하고, 페이지 트리에 필요한 객체의 사전 부분만 잘라 읽습니다.
+# 압축된 객체 스트림(/ObjStm)은 페이지 트리를 따라가지 못했을 때만 풀어 봅니다.
+# 결과는 파일 내용의 sha256 으로 캐시(data/ir_checks.sqlite3)하므로, 같은 파일을 다시 검사하면 바로 돌려줍니다.
+#   python ir_validator.py deck1.pdf deck2.pdf     # 파일 검사
+#   python ir_validator.py --uploads               # 접수된 모든 IR 자료 재검사 (프로세스 풀)
+BASE_DIR = Path(__file__).resolve().parent
+CACHE_DB_PATH = Path(os.environ.get("TOOJAK_IR_CHECK_DB") or BASE_DIR / "data" / "ir_checks.sqlite3")
+TARGET_RATIO = 16 / 9
+RATIO_TOLERANCE = 0.01  # 1% 이내면 16:9 로 봅니다 (A4 가로 1.414, 4:3 1.333 과 구분)
+VALIDATOR_VERSION = 2   # 검사 방식이 바뀌면 올려서 캐시를 무효화합니다
+
+OBJECT_PATTERN = re.compile(rb"(\d+)\s+(\d+)\s+obj\b(.*?)\bendobj", re.S)
+OBJECT_STREAM_PATTERN = re.compile(rb"/Type\s*/ObjStm")
+PAGE_TYPE_PATTERN = re.compile(rb"/Type\s*/Page(?![A-Za-z])")
+CATALOG_PATTERN = re.compile(rb"/Type\s*/Catalog")
+ROOT_PATTERN = re.compile(rb"/Root\s+(\d+)\s+\d+\s+R")
+PAGES_PATTERN = re.compile(rb"/Pages\s+(\d+)\s+\d+\s+R")
+KIDS_PATTERN = re.compile(rb"/Kids\s*(?:\[([^\]]*)\]|(\d+)\s+\d+\s+R)")
+REFERENCE_PATTERN = re.compile(rb"(\d+)\s+\d+\s+R")
+ROTATE_PATTERN = re.compile(rb"/Rotate\s+(-?\d+)")
+NUMBER = rb"(-?[\d.]+)"
+BOX_PATTERNS = {
+    name: re.compile(rb"/" + name + rb"\s*(?:\[\s*" + rb"\s+".join([NUMBER] * 4) + rb"\s*\]|(\d+)\s+\d+\s+R)")
+    for name in (b"CropBox", b"MediaBox")
+}
+ARRAY_PATTERN = re.compile(rb"^\s*\[\s*" + rb"\s+".join([NUMBER] * 4) + rb"\s*\]")
+
+
+@dataclass(frozen=True)
+class DeckReport:
+    sha256: str
+    size: int
+    page_count: int = 0
+    width: float = 0.0   # 첫 페이지의 표시 너비/높이(pt)
+    height: float = 0.0
+    aspect_ratio: float = 0.0
+    mismatched_pages: tuple = ()  # 16:9 가 아닌 페이지 번호 (1부터)
+    error: str = ""
+
+    @property
+    def is_16_9(self):
+        return not self.error and self.page_count > 0 and not self.mismatched_pages
+
+
+def sha256_file(path, chunk_size=1024 * 1024):
+    digest = hashlib.sha256()
+    with open(path, "rb") as source:
+        while chunk := source.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _stream_data(body):
+    match = re.search(rb"stream\r?\n", body)
+    if not match:
+        return None
+    data = body[match.end():body.rfind(b"endstream")]
+    return zlib.decompress(data) if b"/FlateDecode" in body[:match.start()] else data
+
+
+def _object_stream_members(body):
+    """/ObjStm 을 풀어 (객체 번호, 본문) 목록을 돌려줍니다."""
+    header = body[:body.find(b"stream")]
+    count, first = re.search(rb"/N\s+(\d+)", header), re.search(rb"/First\s+(\d+)", header)
+    data = _stream_data(body)
+    if not (count and first and data):
+        return []
+    first = int(first.group(1))
+    numbers = [int(value) for value in data[:first].split()]
+    pairs = list(zip(numbers[0::2], numbers[1::2]))[:int(count.group(1))]
+    members = []
+    for index, (number, offset) in enumerate(pairs):
+        end = first + pairs[index + 1][1] if index + 1 < len(pairs) else len(data)
+        members.append((number, data[first + offset:end]))
+    return members
+
+
+def _objects(data, expand_streams):
+    """{객체 번호: (시작, 끝)} — 파일 안 본문 위치. 객체 스트림을 풀면 그 안의 객체는 본문(bytes)으로 들어갑니다."""
+    objects = {}
+    for match in OBJECT_PATTERN.finditer(data):
+        number = int(match.group(1))
+        objects[number] = match.span(3)  # 증분 갱신으로 같은 번호가 다시 나오면 나중 것이 유효합니다
+        if expand_streams and OBJECT_STREAM_PATTERN.search(_dictionary(data, objects, number)):
+            try:
+                objects.update(_object_stream_members(data[match.start(3):match.end(3)]))
+            except (zlib.error, ValueError):
+                pass
+    return objects
+
+
+def _dictionary(data, objects, number):
+    """객체의 사전 부분. 스트림이 딸린 객체는 스트림 앞까지만 읽습니다."""
+    body = objects.get(number, b"")
+    if isinstance(body, bytes):
+        end = body.find(b"stream")
+        return body if end < 0 else body[:end]
+    start, end = body
+    stream = data.find(b"stream", start, end)
+    return data[start:end if stream < 0 else stream]
+
+
+def _root(data, objects):
+    # 증분 갱신이 있으면 마지막 트레일러(또는 XRef 스트림)의 /Root 가 유효합니다.
+    # 트레일러가 잘린 파일은 /Type /Catalog 객체를 찾습니다.
+    position = len(data)
+    while (position := data.rfind(b"/Root", 0, position)) >= 0:
+        if match := ROOT_PATTERN.match(data, position):
+            return int(match.group(1))
+    return next((number for number in objects if CATALOG_PATTERN.search(_dictionary(data, objects, number))), None)
+
+
+def _box(data, objects, match):
+    if match.group(5):
+        array = ARRAY_PATTERN.match(_dictionary(data, objects, int(match.group(5))))
+        return [float(value) for value in array.groups()] if array else None
+    return [float(value) for value in match.groups()[:4]]
+
+
+def _kids(data, objects, body):
+    match = KIDS_PATTERN.search(body)
+    if not match:
+        return []
+    array = match.group(1) if match.group(2) is None else _dictionary(data, objects, int(match.group(2)))
+    return [int(number) for number in REFERENCE_PATTERN.findall(array)]
+
+
+def _page_tree_boxes(data, objects):
+    """페이지 트리를 문서 순서대로 따라가 페이지마다 (상자, Rotate) 를 모읍니다. 필요한 객체가 없으면 None."""
+    root = _root(data, objects)
+    pages = root in objects and PAGES_PATTERN.search(_dictionary(data, objects, root))
+    if not pages:
+        return None
+    boxes, seen = [], set()
+    stack = [(int(pages.group(1)), {})]
+    while stack:
+        number, inherited = stack.pop()
+        if number in seen or number not in objects:
+            return None
+        seen.add(number)
+        body = _dictionary(data, objects, number)
+        attributes = dict(inherited)
+        for name, pattern in BOX_PATTERNS.items():
+            if (match := pattern.search(body)) and (box := _box(data, objects, match)):
+                attributes[name] = box
+        if match := ROTATE_PATTERN.search(body):
+            attributes[b"Rotate"] = int(match.group(1))
+        if PAGE_TYPE_PATTERN.search(body):
+            boxes.append((attributes.get(b"CropBox") or attributes.get(b"MediaBox"), attributes.get(b"Rotate", 0)))
+        else:
+            stack.extend((kid, attributes) for kid in reversed(_kids(data, objects, body)))
+    return boxes
+
+
+def _page_boxes(data):
+    for expand_streams in (False, True):
+        boxes = _page_tree_boxes(data, _objects(data, expand_streams))
+        if boxes:
+            return boxes
+    return []
+
+
+def inspect(path):
+    """PDF 의 페이지 상자를 읽어 DeckReport 를 만듭니다. 페이지는 그리지 않습니다."""
+    path = Path(path)
+    size = path.stat().st_size
+    if size == 0:
+        return DeckReport(hashlib.sha256().hexdigest(), 0, error="빈 파일입니다")
+    # 파일 전체를 메모리로 읽지 않고 mmap 위에서 해시와 객체 탐색을 합니다.
+    with open(path, "rb") as source, mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        report = {"sha256": hashlib.sha256(data).hexdigest(), "size": size}
+        if data.find(b"%PDF-", 0, 1024) < 0:
+            return DeckReport(**report, error="PDF 파일이 아닙니다")
+        try:
+            boxes = _page_boxes(data)
+        except (ValueError, zlib.error) as e:
+            return DeckReport(**report, error=f"PDF 구조를 읽을 수 없습니다: {e}")
+    if not boxes:
+        return DeckReport(**report, error="페이지를 찾을 수 없습니다")
+
+    sizes, mismatched = [], []
+    for page_number, (box, rotate) in enumerate(boxes, start=1):
+        if box is None:
+            mismatched.append(page_number)
+            sizes.append((0.0, 0.0))
+            continue
+        width, height = abs(box[2] - box[0]), abs(box[3] - box[1])
+        if rotate % 180:
+            width, height = height, width
+        sizes.append((width, height))
+        if not height or abs(width / height / TARGET_RATIO - 1) > RATIO_TOLERANCE:
+            mismatched.append(page_number)
+    width, height = sizes[0]
+    return DeckReport(
+        **report, page_count=len(boxes), width=round(width, 2), height=round(height, 2),
+        aspect_ratio=round(width / height, 4) if height else 0.0, mismatched_pages=tuple(mismatched),
+    )
+
+
+class ReportCache:
+    """sha256 -> DeckReport 를 SQLite 에 보관합니다."""
+
+    def __init__(self, db_path=CACHE_DB_PATH):
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(db_path, timeout=30)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS ir_checks (sha256 TEXT NOT NULL, version INTEGER NOT NULL, report TEXT NOT NULL, PRIMARY KEY (sha256, version))"
+        )
+
+    def get_many(self, digests):
+        found = {}
+        digests = list(digests)
+        for start in range(0, len(digests), 500):
+            chunk = digests[start:start + 500]
+            rows = self._connection.execute(
+                f"SELECT report FROM ir_checks WHERE version = ? AND sha256 IN ({', '.join('?' * len(chunk))})", (VALIDATOR_VERSION, *chunk)
+            )
+            for (row,) in rows:
+                values = json.loads(row)
+                values["mismatched_pages"] = tuple(values["mismatched_pages"])
+                found[values["sha256"]] = DeckReport(**values)
+        return found
+
+    def put_many(self, reports):
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO ir_checks (sha256, version, report) VALUES (?, ?, ?)",
+                [(report.sha256, VALIDATOR_VERSION, json.dumps(asdict(report), ensure_ascii=False)) for report in reports],
+            )
+
+    def close(self):
+        self._connection.close()
+
+
+def validate_many(paths, workers=None, cache=None, digests=None):
+    """여러 PDF 를 검사해 {경로: DeckReport} 를 돌려줍니다.
+
+    캐시에 있는 파일은 건너뛰고 나머지만 프로세스 풀에서 검사합니다. digests(경로 -> sha256)를 알고 있으면
+    (예: upload_spool 의 내용 해시 경로) 해시 계산도 생략합니다.
+    """
+    paths = [Path(path) for path in paths]
+    own_cache = cache is None
+    cache = cache or ReportCache()
+    try:
+        digests = {path: (digests or {}).get(path) or sha256_file(path) for path in paths}
+        cached = cache.get_many(set(digests.values()))
+        pending = [path for path in paths if digests[path] not in cached]
+        if len(pending) > 1 and workers != 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                fresh = list(pool.map(inspect, pending, chunksize=max(1, len(pending) // 32)))
+        else:
+            fresh = [inspect(path) for path in pending]
+        cache.put_many(fresh)
+        cached.update((report.sha256, report) for report in fresh)
+        return {path: cached[digests[path]] for path in paths}
+    finally:
+        if own_cache:
+            cache.close()
+
+
+def uploaded_decks(db_path=None):
+    """접수된 신청의 IR 자료 (접수 번호, 파일명, 경로, sha256) 목록."""
+    from intake_store import DEFAULT_DB_PATH
+    from upload_spool import object_path
+
+    connection = sqlite3.connect(db_path or DEFAULT_DB_PATH)
+    try:
+        rows = connection.execute("SELECT submission_id, file_name, sha256 FROM attachments WHERE kind = 'ir_deck' ORDER BY submission_id").fetchall()
+    finally:
+        connection.close()
+    return [(submission_id, file_name, object_path(sha256), sha256) for submission_id, file_name, sha256 in rows]
+
+
+def describe(report):
+    if report.error:
+        return f"확인 불가 — {report.error}"
+    verdict = "16:9 확인" if report.is_16_9 else f"16:9 아님 (페이지 {', '.join(map(str, report.mismatched_pages[:10]))})"
+    return f"{verdict} · {report.page_count}쪽 · {report.width:g}×{report.height:g}pt ({report.aspect_ratio:.3f}) · {report.size / 1024 / 1024:.1f}MB"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="IR 자료가 16:9 PDF 인지 검사합니다.")
+    parser.add_argument("paths", nargs="*", help="검사할 PDF 파일")
+    parser.add_argument("--uploads", action="store_true", help="접수된 모든 IR 자료를 검사")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본값: CPU 수)")
+    args = parser.parse_args()
+
+    targets = [(str(path), Path(path), None) for path in args.paths]
+    if args.uploads:
+        targets += [(f"{submission_id[:12].upper()} {file_name}", path, sha256) for submission_id, file_name, path, sha256 in uploaded_decks()]
+    reports = validate_many([path for _, path, _ in targets], args.workers, digests={path: sha256 for _, path, sha256 in targets if sha256})
+    for label, path, _ in targets:
+        print(f"{label}: {describe(reports[path])}")
+    parser.exit(0 if all(report.is_16_9 for report in reports.values()) else 1)
@@ -0,0 +1,312 @@
+import argparse
+import asyncio
+import csv
+import json
+import logging
+import os
+import random
+import smtplib
+import ssl
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from email.message import EmailMessage
+from email.utils import formataddr, make_msgid
+from pathlib import Path
+
+from content_store import CONTACT_FILE, CONTENT_DIR, read_contact
+from events import EVENTS_FILE, KST, read_schedule
+from intake_store import DEFAULT_DB_PATH, connect
+
+# --- 선정 결과 안내 메일 ---
+# 심사 결과 파일(CSV: submission_id,result)과 접수 DB 의 신청 정보를 합쳐 content/notifications.json 의 템플릿으로
+# 메일을 만들고, SMTP 연결 몇 개(--concurrency)를 열어 둔 채 재사용하며 asyncio 로 동시에 보냅니다.
+# smtplib 는 동기 API 이므로 연결마다 작업 스레드에서 보내고, 연결 수가 곧 동시 발송 수의 상한입니다.
+# - 일시적 오류(연결 끊김, 4xx 응답, 시간 초과)는 지수 백오프(+지터)로 max_attempts 번까지 다시 시도합니다.
+# - 영구 오류(5xx, 수신자 거부)는 바로 실패로 기록합니다.
+# - 발송 기록(notifications 테이블, 접수 DB)에 건별로 결과를 남겨, 중단 후 다시 실행하면 보내지 않은 건만 보냅니다.
+#   python notifier.py --round 2 --results results.csv --dry-run
+#   python notifier.py --round 2 --results results.csv --concurrency 8
+# SMTP 설정: TOOJAK_SMTP_HOST, TOOJAK_SMTP_PORT, TOOJAK_SMTP_USER, TOOJAK_SMTP_PASSWORD, TOOJAK_SMTP_FROM,
+#            TOOJAK_SMTP_STARTTLS (기본값 1, 로컬 테스트 서버는 0)
+TEMPLATES_FILE = CONTENT_DIR / "notifications.json"
+SMTP_HOST = os.environ.get("TOOJAK_SMTP_HOST", "localhost")
+SMTP_PORT = int(os.environ.get("TOOJAK_SMTP_PORT", "587"))
+SMTP_USER = os.environ.get("TOOJAK_SMTP_USER")
+SMTP_PASSWORD = os.environ.get("TOOJAK_SMTP_PASSWORD")
+SMTP_FROM = os.environ.get("TOOJAK_SMTP_FROM") or SMTP_USER
+SMTP_STARTTLS = os.environ.get("TOOJAK_SMTP_STARTTLS", "1") != "0"
+SMTP_TIMEOUT = 30
+DEFAULT_CONCURRENCY = 4
+MAX_ATTEMPTS = 5
+BASE_RETRY_DELAY = 1.0
+MAX_RETRY_DELAY = 60.0
+RECORD_FIELDS = ("email", "company_name", "representative", "participation_type")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS notifications (
+    campaign TEXT NOT NULL,
+    submission_id TEXT NOT NULL,
+    result TEXT NOT NULL,
+    email TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    message_id TEXT,
+    last_error TEXT,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (campaign, submission_id)
+);
+"""
+STATUS_PENDING, STATUS_SENT, STATUS_FAILED = "pending", "sent", "failed"
+
+logger = logging.getLogger("toojak.notifier")
+
+
+@dataclass(frozen=True, slots=True)
+class Notice:
+    submission_id: str
+    result: str
+    email: str
+    subject: str
+    body: str
+
+
+class PermanentFailure(Exception):
+    """다시 보내도 성공하지 않을 오류 (5xx 응답, 수신자 거부)."""
+
+
+def read_templates(path=TEMPLATES_FILE):
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    return {result: (template["subject"], "\n\n".join(template["body"])) for result, template in data.items()}
+
+
+def read_results(path):
+    """심사 결과 CSV 를 {submission_id: 행(dict)} 로 읽습니다. 접수 DB 에 없는 신청(구글폼 등)은 행의 email 등을 씁니다."""
+    with open(path, newline="", encoding="utf-8-sig") as results_file:
+        return {row["submission_id"].strip(): row for row in csv.DictReader(results_file) if row.get("submission_id")}
+
+
+def build_notices(connection, round_number, results, templates, event, contact):
+    """회차 신청 정보와 심사 결과로 Notice 목록을 만듭니다. 템플릿이 없거나 이메일을 알 수 없는 건은 경고 후 건너뜁니다."""
+    records = {
+        row[0]: dict(zip(RECORD_FIELDS, row[1:]))
+        for row in connection.execute(
+            f"SELECT submission_id, {', '.join(RECORD_FIELDS)} FROM applications WHERE round = ? ORDER BY submitted_at, id",
+            (round_number,),
+        )
+    }
+    shared = {
+        "round": round_number, "event_theme": event.theme, "event_datetime": event.datetime_label,
+        "event_venue": event.venue, "operator_name": contact.operator_name,
+        "contact_email": contact.email, "contact_phone": contact.phone,
+    }
+    notices = []
+    for submission_id, row in results.items():
+        result = row.get("result", "").strip()
+        record = {name: (records.get(submission_id, {}).get(name) or row.get(name) or "").strip() for name in RECORD_FIELDS}
+        if result not in templates:
+            logger.warning("%s: 알 수 없는 결과 %r 는 건너뜁니다", submission_id, result)
+            continue
+        if not record["email"]:
+            logger.warning("%s: 이메일 주소가 없어 건너뜁니다", submission_id)
+            continue
+        subject, body = templates[result]
+        values = {**shared, **record}
+        notices.append(Notice(submission_id, result, record["email"], subject.format_map(values), body.format_map(values)))
+    return notices
+
+
+def build_message(notice, sender, contact):
+    message = EmailMessage()
+    message["From"] = formataddr((contact.operator_name, sender))
+    message["To"] = notice.email
+    message["Reply-To"] = contact.email
+    message["Subject"] = notice.subject
+    message["Message-ID"] = make_msgid(domain=sender.rpartition("@")[2] or None)
+    message.set_content(notice.body)
+    return message
+
+
+class SendLog:
+    """캠페인별 발송 기록. 같은 캠페인으로 다시 실행하면 sent 가 아닌 건만 다시 보냅니다."""
+
+    def __init__(self, connection):
+        self._connection = connection
+        self._connection.executescript(SCHEMA)
+
+    def plan(self, campaign, notices):
+        """발송 대상을 기록하고 아직 보내지 않은 Notice 만 돌려줍니다."""
+        now = datetime.now(KST).isoformat(timespec="seconds")
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO notifications (campaign, submission_id, result, email, status, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+                [(campaign, notice.submission_id, notice.result, notice.email, STATUS_PENDING, now) for notice in notices],
+            )
+        sent = {row[0] for row in self._connection.execute(
+            "SELECT submission_id FROM notifications WHERE campaign = ? AND status = ?", (campaign, STATUS_SENT)
+        )}
+        return [notice for notice in notices if notice.submission_id not in sent]
+
+    def record(self, campaign, submission_id, status, attempts, message_id=None, error=None):
+        with self._connection:
+            self._connection.execute(
+                "UPDATE notifications SET status = ?, attempts = attempts + ?, message_id = COALESCE(?, message_id), "
+                "last_error = ?, updated_at = ? WHERE campaign = ? AND submission_id = ?",
+                (status, attempts, message_id, error, datetime.now(KST).isoformat(timespec="seconds"), campaign, submission_id),
+            )
+
+    def summary(self, campaign):
+        return dict(self._connection.execute(
+            "SELECT status, COUNT(*) FROM notifications WHERE campaign = ? GROUP BY status", (campaign,)
+        ).fetchall())
+
+
+class SmtpPool:
+    """열어 둔 SMTP 연결을 돌려 쓰는 풀. 연결은 처음 쓸 때 열고, 끊기면 다음 발송에서 다시 엽니다."""
+
+    def __init__(self, host=SMTP_HOST, port=SMTP_PORT, size=DEFAULT_CONCURRENCY, starttls=SMTP_STARTTLS,
+                 username=SMTP_USER, password=SMTP_PASSWORD, timeout=SMTP_TIMEOUT):
+        self.host, self.port, self.size = host, port, size
+        self.starttls, self.username, self.password, self.timeout = starttls, username, password, timeout
+        self.opened = 0
+        self._idle = asyncio.Queue()
+        for _ in range(size):
+            self._idle.put_nowait(None)
+
+    def _open(self):
+        client = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        if self.starttls:
+            client.starttls(context=ssl.create_default_context())
+        if self.username:
+            client.login(self.username, self.password or "")
+        self.opened += 1
+        return client
+
+    def _send(self, slot, message):
+        # slot 은 [연결] — 새로 연 연결이나 끊긴 연결(None)을 예외가 나도 호출한 쪽에 돌려주기 위한 칸입니다.
+        reused = slot[0] is not None
+        if not reused:
+            slot[0] = self._open()
+        try:
+            slot[0].send_message(message)
+        except smtplib.SMTPServerDisconnected:
+            _close(slot[0])
+            slot[0] = None
+            if not reused:
+                raise
+            # 쉬는 동안 서버가 닫은 연결 — 기다리지 않고 새 연결로 한 번 더 보냅니다.
+            slot[0] = self._open()
+            slot[0].send_message(message)
+        except OSError:
+            _close(slot[0])
+            slot[0] = None
+            raise
+
+    async def send(self, message):
+        slot = [await self._idle.get()]
+        try:
+            await asyncio.to_thread(self._send, slot, message)
+        finally:
+            self._idle.put_nowait(slot[0])
+
+    async def close(self):
+        clients = []
+        while not self._idle.empty():
+            clients.append(self._idle.get_nowait())
+        await asyncio.gather(*(asyncio.to_thread(_quit, client) for client in clients if client is not None))
+
+
+def _close(client):
+    try:
+        client.close()
+    except OSError:
+        pass
+
+
+def _quit(client):
+    try:
+        client.quit()
+    except (smtplib.SMTPException, OSError):
+        _close(client)
+
+
+def classify(error):
+    """재시도할 오류면 그대로, 영구 오류면 PermanentFailure 로 바꿔 돌려줍니다."""
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        codes = [code for code, _ in error.recipients.values()]
+        return PermanentFailure(str(error)) if all(code >= 500 for code in codes) else error
+    if isinstance(error, smtplib.SMTPResponseException) and error.smtp_code >= 500:
+        return PermanentFailure(f"{error.smtp_code} {error.smtp_error!r}")
+    return error
+
+
+def retry_delay(attempt, base=BASE_RETRY_DELAY, maximum=MAX_RETRY_DELAY):
+    return min(base * 2 ** (attempt - 1), maximum) * random.uniform(0.5, 1.0)
+
+
+async def send_notices(notices, pool, log, campaign, sender, contact, max_attempts=MAX_ATTEMPTS, base_delay=BASE_RETRY_DELAY):
+    """notices 를 풀로 보내고 건별 결과를 기록합니다. {"sent": n, "failed": n} 을 돌려줍니다."""
+    counts = {STATUS_SENT: 0, STATUS_FAILED: 0}
+
+    async def deliver(notice):
+        message = build_message(notice, sender, contact)
+        for attempt in range(1, max_attempts + 1):
+            try:
+                await pool.send(message)
+            except smtplib.SMTPAuthenticationError:
+                raise  # 설정 오류 — 전체 발송을 멈춥니다 (다시 실행하면 이어서 보냅니다)
+            except (smtplib.SMTPException, OSError) as e:
+                error = classify(e)
+                if isinstance(error, PermanentFailure) or attempt == max_attempts:
+                    log.record(campaign, notice.submission_id, STATUS_FAILED, attempt, error=str(error))
+                    counts[STATUS_FAILED] += 1
+                    logger.warning("%s 발송 실패 (%d회 시도): %s", notice.email, attempt, error)
+                    return
+                await asyncio.sleep(retry_delay(attempt, base_delay))
+            else:
+                log.record(campaign, notice.submission_id, STATUS_SENT, attempt, message_id=message["Message-ID"])
+                counts[STATUS_SENT] += 1
+                return
+
+    try:
+        await asyncio.gather(*(deliver(notice) for notice in notices))
+    finally:
+        await pool.close()
+    return counts
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="선정 결과 안내 메일 발송")
+    parser.add_argument("--round", type=int, required=True, help="회차")
+    parser.add_argument("--results", required=True, help="심사 결과 CSV (submission_id,result[,email,company_name,...])")
+    parser.add_argument("--campaign", help="발송 기록 이름 (기본값: round<회차>-result)")
+    parser.add_argument("--db", default=str(DEFAULT_DB_PATH), help="접수 DB 경로")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="동시에 열어 둘 SMTP 연결 수")
+    parser.add_argument("--max-attempts", type=int, default=MAX_ATTEMPTS)
+    parser.add_argument("--retry-delay", type=float, default=BASE_RETRY_DELAY, help="첫 재시도 대기(초), 이후 두 배씩")
+    parser.add_argument("--host", default=SMTP_HOST)
+    parser.add_argument("--port", type=int, default=SMTP_PORT)
+    parser.add_argument("--sender", default=SMTP_FROM, help="보내는 주소 (기본값: TOOJAK_SMTP_FROM)")
+    parser.add_argument("--dry-run", action="store_true", help="보내지 않고 첫 메일과 대상 수만 출력")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    schedule = read_schedule(EVENTS_FILE)
+    contact = read_contact(CONTACT_FILE)
+    connection = connect(args.db)
+    notices = build_notices(connection, args.round, read_results(args.results), read_templates(), schedule.edition(args.round), contact)
+    campaign = args.campaign or f"round{args.round}-result"
+    if args.dry_run:
+        if notices:
+            print(f"To: {notices[0].email}\nSubject: {notices[0].subject}\n\n{notices[0].body}\n")
+        print(f"대상 {len(notices)}건")
+        sys.exit(0)
+    if not args.sender:
+        parser.error("보내는 주소가 없습니다 (--sender 또는 TOOJAK_SMTP_FROM)")
+
+    log = SendLog(connection)
+    pending = log.plan(campaign, notices)
+    pool = SmtpPool(args.host, args.port, size=args.concurrency)
+    counts = asyncio.run(send_notices(pending, pool, log, campaign, args.sender, contact, args.max_attempts, args.retry_delay))
+    print(f"발송 {counts[STATUS_SENT]}건, 실패 {counts[STATUS_FAILED]}건, 이전 발송으로 건너뜀 {len(notices) - len(pending)}건, SMTP 연결 {pool.opened}개")
+    print(f"캠페인 {campaign}: {log.summary(campaign)}")
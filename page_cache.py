@@ -0,0 +1,87 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from css_pipeline import split_styles
+
+# --- 섹션 HTML 캐시 ---
+# 각 섹션의 HTML 은 요청과 무관하므로 프로세스당 한 번만 만들고, 이후 재실행에서는 만들어 둔 문자열을 그대로 사용합니다.
+# 캐시 키는 렌더 함수의 코드와 그 함수가 참조하는 전역 상수(날짜, GOOGLE_FORM_URL, 색상, 자산 URL 등)의 값이라,
+# app.py 의 내용이 바뀌었을 때만 다시 만들어집니다. <style> 블록은 css_pipeline 이 하나로 합칠 수 있도록 따로 보관합니다.
+# 회차별 페이지(hero@1, hero@2 …)처럼 이름이 늘어날 수 있으므로 max_entries 개까지만 두고 가장 오래 안 쓴 항목부터 버립니다.
+DEFAULT_MAX_ENTRIES = 64
+CONSTANT_TYPES = (str, int, float, bool, type(None), tuple, frozenset)
+
+
+@dataclass(frozen=True)
+class RenderedSection:
+    html: str    # <style> 블록을 뺀 마크업
+    css: tuple   # 섹션의 <style> 블록 내용
+    digest: str  # sha256 앞 16자리 — 내보내기/압축 단계의 캐시 키로도 사용
+
+
+def _global_names(code):
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if hasattr(const, "co_names"):
+            names |= _global_names(const)
+    return names
+
+
+def render_key(builder, args=()):
+    """렌더 함수의 코드와 참조 중인 전역 상수 값, 호출 인자로 이루어진 캐시 키."""
+    code = builder.__code__
+    namespace = builder.__globals__
+    constants = []
+    for name in sorted(_global_names(code)):
+        value = namespace.get(name)
+        if isinstance(value, CONSTANT_TYPES):
+            constants.append((name, value))
+    return (code, tuple(constants), tuple(args))
+
+
+class SectionCache:
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # 섹션 이름 -> (키, RenderedSection), 최근에 쓴 것이 뒤쪽
+        self._lock = threading.Lock()
+
+    def get(self, name, builder, *args):
+        return self.fetch(name, builder, *args)[0]
+
+    def fetch(self, name, builder, *args):
+        """(RenderedSection, 캐시 적중 여부)를 돌려줍니다."""
+        key = render_key(builder, args)
+        entry = self._entries.get(name)
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            try:
+                self._entries.move_to_end(name)
+            except KeyError:  # 다른 스레드가 방금 버린 항목
+                pass
+            return entry[1], True
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None and entry[0] == key:
+                self.hits += 1
+                return entry[1], True
+            markup = builder(*args)
+            html, css = split_styles(markup)
+            section = RenderedSection(html, tuple(css), hashlib.sha256(markup.encode()).hexdigest()[:16])
+            self._entries[name] = (key, section)
+            self._entries.move_to_end(name)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self.misses += 1
+            return section, False
+
+    def invalidate(self, *names):
+        with self._lock:
+            for name in names or list(self._entries):
+                self._entries.pop(name, None)
+
+
+SECTION_CACHE = SectionCache()
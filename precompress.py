@@ -0,0 +1,91 @@
+import argparse
+import gzip
+import os
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:  # brotli 가 없으면 gzip 변형만 만듭니다
+    brotli = None
+
+# --- 사전 압축 ---
+# 게시된 정적 파일(페이지 HTML, 합친 CSS, 신청서 양식, 로고, 폰트) 옆에 .br / .gz 변형을 한 번만 만들어 두고,
+# asset_server.py 가 Accept-Encoding 에 맞는 변형을 그대로 보냅니다. 요청마다 압축하지 않으므로 응답에 CPU 가 들지 않습니다.
+# nginx 로 dist/ 를 제공할 때는 gzip_static on; brotli_static on; 으로 같은 파일을 쓸 수 있습니다.
+# 이미 압축된 형식(PNG·WebP·AVIF·WOFF2 등)은 변형이 MIN_SAVING 이상 작아지지 않으면 만들지 않습니다.
+#   python precompress.py dist static
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))  # 선호 순서
+VARIANT_SUFFIXES = tuple(suffix for _, suffix in ENCODINGS)
+MIN_SAVING = 0.05  # 원본보다 5% 이상 작을 때만 변형을 둡니다
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+
+def compress(data, encoding):
+    if encoding == "br":
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)  # mtime=0: 같은 입력이면 같은 결과
+
+
+def available_encodings():
+    return [(encoding, suffix) for encoding, suffix in ENCODINGS if encoding != "br" or brotli is not None]
+
+
+def variant_path(path, suffix):
+    return path.with_name(path.name + suffix)
+
+
+def is_variant(path):
+    return path.name.endswith(VARIANT_SUFFIXES)
+
+
+def precompress(path):
+    """path 의 .br/.gz 변형을 만듭니다. 원본보다 새로운 변형이 이미 있으면 건너뜁니다. 만든 인코딩 목록을 돌려줍니다."""
+    from static_assets import write_atomic
+
+    path = Path(path)
+    if is_variant(path) or not path.is_file():
+        return []
+    source_mtime = path.stat().st_mtime_ns
+    data = None
+    written = []
+    for encoding, suffix in available_encodings():
+        target = variant_path(path, suffix)
+        if target.is_file() and target.stat().st_mtime_ns >= source_mtime:
+            continue
+        if data is None:
+            data = path.read_bytes()
+        compressed = compress(data, encoding)
+        if len(compressed) > len(data) * (1 - MIN_SAVING):
+            target.unlink(missing_ok=True)
+            continue
+        write_atomic(target, compressed)
+        os.utime(target, ns=(source_mtime, source_mtime))
+        written.append(encoding)
+    return written
+
+
+def precompress_tree(root):
+    """root 아래 모든 파일의 변형을 만들고 {인코딩: 파일 수} 를 돌려줍니다. 원본이 사라진 변형은 지웁니다."""
+    counts = {encoding: 0 for encoding, _ in ENCODINGS}
+    for path in sorted(Path(root).rglob("*")):
+        if not path.is_file() or path.name.startswith(".tmp-"):
+            continue
+        if is_variant(path):
+            if not path.with_suffix("").is_file():
+                path.unlink()
+            continue
+        for encoding in precompress(path):
+            counts[encoding] += 1
+    return counts
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="정적 파일의 brotli/gzip 변형을 미리 만듭니다.")
+    parser.add_argument("roots", nargs="+", help="대상 디렉터리 (예: dist static)")
+    args = parser.parse_args()
+    if brotli is None:
+        print("brotli 가 설치되어 있지 않아 gzip 변형만 만듭니다 (pip install brotli).")
+    for root in args.roots:
+        counts = precompress_tree(root)
+        print(f"{root}: " + ", ".join(f"{encoding} {count}개" for encoding, count in counts.items()))
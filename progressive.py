@@ -0,0 +1,53 @@
+import os
+from pathlib import Path
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+from admission import keep_admitted
+
+# --- 점진적 렌더링 ---
+# 첫 실행에서는 헤더·히어로(참가 신청 바로가기 포함)만 보내고, 그 아래 섹션은 fragment 하나에 모아 둡니다.
+# fragment 는 처음에 가벼운 자리 표시(60vh)와 그 아래 1px 감시 프레임(components/viewport_sentinel)만 그리며,
+# 사용자가 자리 표시 끝 ROOT_MARGIN_PX 안쪽까지 스크롤하거나, 페이지가 한가해지거나, 아직 그려지지 않은 섹션으로 가는
+# #앵커(헤더 메뉴·참가 신청 버튼)를 누르면 프레임이 값을 보내 fragment 만 다시 실행되어 나머지 섹션이 나옵니다.
+# 앵커로 불러온 경우 프레임이 섹션이 나타난 뒤 그 위치로 스크롤합니다.
+# 한 번 불러온 세션은 이후 재실행에서 바로 전체 섹션을 그립니다. TOOJAK_PROGRESSIVE=0 이면 예전처럼 한 번에 그립니다.
+PROGRESSIVE = os.environ.get("TOOJAK_PROGRESSIVE", "1") != "0"
+IDLE_TIMEOUT_MS = int(os.environ.get("TOOJAK_PROGRESSIVE_IDLE_MS", "3000"))
+ROOT_MARGIN_PX = 200  # 첫 화면에서 바로 불러오지 않도록 작게 둡니다 (자리 표시가 히어로 아래 60vh 를 차지)
+SENTINEL_DIR = Path(__file__).resolve().parent / "components" / "viewport_sentinel"
+LOADED_KEY = "below_the_fold_loaded"
+
+_viewport_sentinel = components.declare_component("viewport_sentinel", path=str(SENTINEL_DIR))
+
+PLACEHOLDER_HTML = """
+<div class="below-the-fold-placeholder" style="min-height: 60vh; display: flex; align-items: flex-start; justify-content: center; padding-top: 40px; color: #6c757d; font-family: 'Pretendard', sans-serif;">
+    행사 안내를 불러오는 중입니다…
+</div>
+"""
+
+
+def below_the_fold_reached():
+    """이 세션에서 아래쪽 섹션을 그려도 되면 True. 아직이면 감시 프레임과 자리 표시를 그리고 False."""
+    if st.session_state.get(LOADED_KEY):
+        return True
+    # 감시 프레임은 자리 표시 아래에 둡니다. 불러오는 실행에서도 같은 자리에 남아 앵커 위치로 스크롤할 수 있습니다.
+    placeholder = st.empty()
+    if _viewport_sentinel(idle_timeout_ms=IDLE_TIMEOUT_MS, root_margin_px=ROOT_MARGIN_PX, key="viewport_sentinel", default=False):
+        st.session_state[LOADED_KEY] = True
+        return True
+    placeholder.markdown(PLACEHOLDER_HTML, unsafe_allow_html=True)
+    return False
+
+
+def display_progressively(sections):
+    """sections 를 감시 프레임 신호 뒤에 그리는 fragment 를 실행합니다."""
+    @st.fragment
+    def display_below_the_fold():
+        keep_admitted()  # 폼·FAQ 조작은 이 fragment 만 다시 실행하므로 여기서도 입장 자리를 갱신합니다
+        if below_the_fold_reached():
+            for display_section in sections:
+                display_section()
+
+    display_below_the_fold()
@@ -0,0 +1,142 @@
+import logging
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# --- 섹션별 렌더링 계측 ---
+# main() 이 호출하는 섹션마다 걸린 시간(st.markdown 전송 포함), 보낸 HTML 크기, 섹션 캐시 적중 여부를 모아
+# Prometheus 텍스트 형식으로 내보냅니다. 환경 변수로 켤 때만 기록하며, 꺼져 있으면 app.py 는 계측 코드를 건너뜁니다.
+#   TOOJAK_METRICS_PORT=9108         → http://127.0.0.1:9108/metrics 로 제공 (TOOJAK_METRICS_HOST 로 바인딩 주소 변경)
+#   TOOJAK_METRICS_LOG_INTERVAL=60   → 60초마다 로그(logger "toojak.metrics")에 출력
+# 카운터는 Streamlit 서버 프로세스 단위로 누적됩니다.
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PREFIX = "toojak"
+
+logger = logging.getLogger("toojak.metrics")
+
+
+class Histogram:
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value):
+        self.count += 1
+        self.total += value
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+
+    def lines(self, name, labels):
+        lines = [f'{name}_bucket{{{labels},le="{bound}"}} {count}' for bound, count in zip(self.buckets, self.counts)]
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {self.count}')
+        lines.append(f"{name}_sum{{{labels}}} {self.total:.6f}")
+        lines.append(f"{name}_count{{{labels}}} {self.count}")
+        return lines
+
+
+class RenderMetrics:
+    def __init__(self):
+        self.enabled = False
+        self._sections = {}  # 섹션 이름 -> {"latency": Histogram, "bytes": 누적, "last_bytes": 최근, "hit": n, "miss": n}
+        self._page = Histogram()
+        self._lock = threading.Lock()
+        self._started = False
+
+    def observe_section(self, name, seconds, html_bytes, cache_hit=None):
+        with self._lock:
+            section = self._sections.get(name)
+            if section is None:
+                section = self._sections[name] = {"latency": Histogram(), "bytes": 0, "last_bytes": 0, "hit": 0, "miss": 0}
+            section["latency"].observe(seconds)
+            section["bytes"] += html_bytes
+            section["last_bytes"] = html_bytes
+            if cache_hit is not None:
+                section["hit" if cache_hit else "miss"] += 1
+
+    def observe_page(self, seconds):
+        with self._lock:
+            self._page.observe(seconds)
+
+    def prometheus_text(self):
+        with self._lock:
+            lines = [
+                f"# HELP {PREFIX}_page_render_seconds main() 전체 실행 시간",
+                f"# TYPE {PREFIX}_page_render_seconds histogram",
+                *self._page.lines(f"{PREFIX}_page_render_seconds", 'page="main"'),
+                f"# HELP {PREFIX}_section_render_seconds 섹션별 렌더링·전송 시간",
+                f"# TYPE {PREFIX}_section_render_seconds histogram",
+            ]
+            for name, section in self._sections.items():
+                lines.extend(section["latency"].lines(f"{PREFIX}_section_render_seconds", f'section="{name}"'))
+            lines += [
+                f"# HELP {PREFIX}_section_html_bytes_total 섹션별로 보낸 HTML 바이트 누적",
+                f"# TYPE {PREFIX}_section_html_bytes_total counter",
+                *(f'{PREFIX}_section_html_bytes_total{{section="{name}"}} {section["bytes"]}' for name, section in self._sections.items()),
+                f"# HELP {PREFIX}_section_html_bytes 섹션의 최근 HTML 크기",
+                f"# TYPE {PREFIX}_section_html_bytes gauge",
+                *(f'{PREFIX}_section_html_bytes{{section="{name}"}} {section["last_bytes"]}' for name, section in self._sections.items()),
+                f"# HELP {PREFIX}_section_cache_total 섹션 캐시 조회 결과",
+                f"# TYPE {PREFIX}_section_cache_total counter",
+            ]
+            for name, section in self._sections.items():
+                for result in ("hit", "miss"):
+                    lines.append(f'{PREFIX}_section_cache_total{{section="{name}",result="{result}"}} {section[result]}')
+        return "\n".join(lines) + "\n"
+
+    def start_from_env(self, environ=os.environ):
+        """환경 변수에 따라 계측을 켜고 엔드포인트/로그 출력을 시작합니다. 프로세스당 한 번만 동작합니다."""
+        if self._started:
+            return self.enabled
+        with self._lock:
+            if self._started:
+                return self.enabled
+            self._started = True
+            port = environ.get("TOOJAK_METRICS_PORT")
+            interval = environ.get("TOOJAK_METRICS_LOG_INTERVAL")
+            if port:
+                self.serve(environ.get("TOOJAK_METRICS_HOST", "127.0.0.1"), int(port))
+            if interval:
+                self.log_every(float(interval))
+            self.enabled = bool(port or interval)
+        return self.enabled
+
+    def serve(self, host, port):
+        metrics = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = metrics.prometheus_text().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        try:
+            server = ThreadingHTTPServer((host, port), MetricsHandler)
+        except OSError as e:  # 다른 프로세스가 이미 포트를 쓰고 있으면 로그만 남기고 계속합니다
+            logger.warning("메트릭 엔드포인트를 열 수 없습니다 (%s:%s): %s", host, port, e)
+            return None
+        threading.Thread(target=server.serve_forever, name="toojak-metrics", daemon=True).start()
+        logger.info("메트릭 엔드포인트: http://%s:%s/metrics", host, port)
+        return server
+
+    def log_every(self, interval):
+        def dump():
+            while True:
+                time.sleep(interval)
+                logger.info("섹션 렌더링 메트릭\n%s", self.prometheus_text())
+        threading.Thread(target=dump, name="toojak-metrics-log", daemon=True).start()
+
+
+RENDER_METRICS = RenderMetrics()
@@ -0,0 +1,349 @@
+import argparse
+import csv
+import json
+import os
+import sqlite3
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from content_store import CONTENT_DIR
+from events import EVENTS_FILE, KST, read_schedule
+from intake_store import DEFAULT_DB_PATH, connect
+
+# --- 심사 점수 집계·선정 ---
+# 회차 하나의 심사 점수를 [심사위원, 신청, 평가 항목] 3차원 배열(없는 점수는 NaN)로 들고 있다가,
+# 정규화 → 가중 합산 → 심사위원 편차 보정 → 신청별 평균 → 동점 처리 → 참가 유형별 상위 N 개 선정을
+# NumPy 배열 연산 한 번으로 계산합니다. 가중치를 바꾸거나 늦게 들어온 점수를 넣어도 배열 한 칸만 바뀌므로
+# 다시 순위를 매기는 데 심사위원 수십 명 × 신청 수백 건 기준 수 ms 면 됩니다.
+# - 정규화: 항목 점수 / 항목 만점 (0~1). 항목이 하나라도 빠진 심사표는 집계에서 제외합니다.
+# - 편차 보정(content/review.json 의 bias_correction):
+#     none   보정하지 않음
+#     mean   심사위원별 평균을 전체 평균에 맞춤 (후하게·박하게 주는 경향 제거)
+#     zscore 평균과 함께 점수 폭(표준편차)도 전체에 맞춤
+#   BIAS_MIN_SAMPLE 건 미만을 심사한 위원은 추정이 불안정하므로 보정하지 않습니다.
+# - 동점: tie_breakers 항목 평균 → 먼저 제출한 신청 순. 항목 평균은 편차 보정 없이 정규화한 원점수로 계산합니다
+#   (보정은 심사표 총점 단위로만 추정하므로). 보정 점수가 소수 넷째 자리까지 같을 때만 쓰입니다.
+# - 선정 인원: 회차의 selection(content/events.json) 또는 --select 로 참가 유형마다 지정해야 합니다. capacity 는
+#   선착순 접수 정원이라 선정 인원으로 쓰지 않습니다. 심사 수가 min_reviews 미만인 신청은 순위에서 제외합니다.
+# 점수는 심사 DB(data/reviews.sqlite3)에 (회차, 신청, 심사위원, 항목) 단위로 보관합니다.
+#   python scoring.py import --round 2 scores.csv      # reviewer,submission_id,<항목 키>... 형식
+#   python scoring.py rank --round 2 --weight theme_fit=25 --out results.csv   # notifier.py --results 로 사용
+REVIEW_CONFIG_FILE = CONTENT_DIR / "review.json"
+REVIEW_DB_PATH = Path(os.environ.get("TOOJAK_REVIEW_DB") or DEFAULT_DB_PATH.parent / "reviews.sqlite3")
+BIAS_CORRECTIONS = ("none", "mean", "zscore")
+BIAS_MIN_SAMPLE = 5
+SCORE_DECIMALS = 4  # 100점 환산 점수를 이 자리에서 반올림해 비교합니다 (부동소수 오차로 동점이 갈리지 않도록)
+RESULT_SELECTED, RESULT_NOT_SELECTED = "selected", "not_selected"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS review_scores (
+    round INTEGER NOT NULL,
+    submission_id TEXT NOT NULL,
+    reviewer TEXT NOT NULL,
+    criterion TEXT NOT NULL,
+    score REAL NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (round, submission_id, reviewer, criterion)
+);
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class Criterion:
+    key: str
+    label: str
+    max_score: float
+    weight: float
+
+
+@dataclass(frozen=True, slots=True)
+class ReviewConfig:
+    criteria: tuple
+    tie_breakers: tuple = ()
+    bias_correction: str = "zscore"
+    min_reviews: int = 1
+
+    @property
+    def keys(self):
+        return tuple(criterion.key for criterion in self.criteria)
+
+
+def read_review_config(path=REVIEW_CONFIG_FILE):
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    config = ReviewConfig(
+        criteria=tuple(Criterion(item["key"], item["label"], float(item["max_score"]), float(item["weight"])) for item in data["criteria"]),
+        tie_breakers=tuple(data.get("tie_breakers", ())),
+        bias_correction=data.get("bias_correction", "zscore"),
+        min_reviews=int(data.get("min_reviews", 1)),
+    )
+    unknown = set(config.tie_breakers) - set(config.keys)
+    if unknown:
+        raise ValueError(f"tie_breakers 에 없는 항목: {', '.join(sorted(unknown))}")
+    if config.bias_correction not in BIAS_CORRECTIONS:
+        raise ValueError(f"bias_correction 은 {', '.join(BIAS_CORRECTIONS)} 중 하나여야 합니다")
+    return config
+
+
+@dataclass(frozen=True)
+class Ranking:
+    """rank_scores() 결과. 배열은 모두 신청 순서(ScoreSheet.submission_ids)를 따릅니다."""
+    score: np.ndarray        # 100점 환산 최종 점수, 집계할 심사표가 없으면 NaN
+    reviews: np.ndarray      # 집계된 심사표 수
+    eligible: np.ndarray     # 심사 수가 min_reviews 이상
+    rank: np.ndarray         # 참가 유형 안의 순위(1부터), 제외된 신청은 0
+    selected: np.ndarray
+    order: np.ndarray        # 참가 유형 → 순위 순으로 정렬한 신청 인덱스
+
+
+def rank_scores(scores, max_scores, weights, type_codes, arrival, quotas,
+                tie_breakers=(), bias_correction="zscore", min_reviews=1):
+    """scores[심사위원, 신청, 항목] 배열로 순위를 매깁니다.
+
+    type_codes 는 신청별 참가 유형 번호, arrival 은 제출 순서, quotas 는 유형 번호별 선정 인원,
+    tie_breakers 는 동점 시 비교할 항목 인덱스입니다 (보정하지 않은 항목 평균으로 비교).
+    """
+    reviewer_count, applicant_count, _ = scores.shape
+    normalized = scores / max_scores                     # [R, A, C], 0~1
+    totals = normalized @ (weights / weights.sum())      # [R, A], 항목이 빠진 심사표는 NaN
+    rated = ~np.isnan(totals)
+    filled = np.where(rated, totals, 0.0)
+
+    if bias_correction != "none" and rated.any():
+        counts = rated.sum(axis=1)
+        means = filled.sum(axis=1) / np.maximum(counts, 1)
+        centered = np.where(rated, totals - means[:, None], 0.0)
+        overall_mean = filled.sum() / rated.sum()
+        scale = np.ones(reviewer_count)
+        if bias_correction == "zscore":
+            spreads = np.sqrt((centered ** 2).sum(axis=1) / np.maximum(counts, 1))
+            overall_spread = np.sqrt(((filled - overall_mean) ** 2 * rated).sum() / rated.sum())
+            scale = np.divide(overall_spread, spreads, out=scale, where=spreads > 1e-9)
+        corrected = overall_mean + centered * scale[:, None]
+        stable = counts >= BIAS_MIN_SAMPLE
+        filled = np.where(rated & stable[:, None], corrected, filled)
+
+    reviews = rated.sum(axis=0)
+    score = np.where(reviews > 0, filled.sum(axis=0) / np.maximum(reviews, 1) * 100, np.nan)
+    eligible = reviews >= max(min_reviews, 1)
+
+    # 정렬 키: 참가 유형 → 제외 여부 → 점수 ↓ → 동점 항목 평균 ↓ → 제출 순. np.lexsort 는 마지막 키가 우선입니다.
+    criterion_means = np.where(rated[..., None], normalized, 0.0).sum(axis=0) / np.maximum(reviews, 1)[:, None]
+    keys = [arrival]
+    keys += [-np.round(criterion_means[:, index], SCORE_DECIMALS + 2) for index in reversed(tie_breakers)]
+    keys += [-np.where(eligible, np.round(score, SCORE_DECIMALS), -np.inf), ~eligible, type_codes]
+    order = np.lexsort(keys)
+
+    sorted_types = type_codes[order]
+    positions = np.arange(applicant_count) - np.searchsorted(sorted_types, sorted_types)
+    rank = np.zeros(applicant_count, dtype=int)
+    rank[order] = positions + 1
+    rank[~eligible] = 0
+    selected = eligible & (rank <= quotas[type_codes])
+    return Ranking(score, reviews, eligible, rank, selected, order)
+
+
+class ReviewStore:
+    """심사 점수를 SQLite 에 보관합니다."""
+
+    def __init__(self, db_path=REVIEW_DB_PATH):
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(SCHEMA)
+
+    def scores(self, round_number):
+        return self._connection.execute(
+            "SELECT submission_id, reviewer, criterion, score FROM review_scores WHERE round = ?", (round_number,)
+        )
+
+    def put_many(self, round_number, entries):
+        """entries: (submission_id, reviewer, criterion, score) 목록. 같은 칸은 새 점수로 바꿉니다."""
+        updated_at = datetime.now(KST).isoformat(timespec="seconds")
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO review_scores (round, submission_id, reviewer, criterion, score, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(round_number, *entry, updated_at) for entry in entries],
+            )
+
+    def close(self):
+        self._connection.close()
+
+
+class ScoreSheet:
+    """회차 하나의 신청 목록과 점수 배열. 새 심사위원이 들어오면 배열을 두 배씩 늘립니다."""
+
+    def __init__(self, config, applicants):
+        # applicants: (submission_id, participation_type, company_name) 목록, 제출 순
+        self.config = config
+        self.submission_ids = tuple(submission_id for submission_id, _, _ in applicants)
+        self.company_names = tuple(company_name for _, _, company_name in applicants)
+        self.participation_types = tuple(sorted({participation_type for _, participation_type, _ in applicants}))
+        self.type_codes = np.array([self.participation_types.index(item) for _, item, _ in applicants], dtype=int)
+        self.arrival = np.arange(len(applicants))
+        self.reviewers = []
+        self._applicant_index = {submission_id: index for index, submission_id in enumerate(self.submission_ids)}
+        self._criterion_index = {key: index for index, key in enumerate(config.keys)}
+        self._reviewer_index = {}
+        self._max_scores = np.array([criterion.max_score for criterion in config.criteria])
+        self._scores = np.full((4, len(applicants), len(config.criteria)), np.nan)
+
+    @classmethod
+    def load(cls, round_number, config, intake_db=DEFAULT_DB_PATH, store=None):
+        connection = connect(intake_db)
+        try:
+            applicants = connection.execute(
+                "SELECT submission_id, participation_type, company_name FROM applications WHERE round = ? ORDER BY submitted_at, id",
+                (round_number,),
+            ).fetchall()
+        finally:
+            connection.close()
+        sheet = cls(config, applicants)
+        if store is not None:
+            sheet.set_many(store.scores(round_number), strict=False)
+        return sheet
+
+    @property
+    def scores(self):
+        return self._scores[:len(self.reviewers)]
+
+    def _reviewer(self, reviewer):
+        index = self._reviewer_index.get(reviewer)
+        if index is None:
+            index = self._reviewer_index[reviewer] = len(self.reviewers)
+            self.reviewers.append(reviewer)
+            if index == len(self._scores):
+                self._scores = np.concatenate([self._scores, np.full_like(self._scores, np.nan)])
+        return index
+
+    def set_many(self, entries, strict=True):
+        """(submission_id, reviewer, criterion, score) 를 배열에 넣고 넣은 수를 돌려줍니다.
+
+        strict 이면 모르는 신청·항목이나 범위를 벗어난 점수에 ValueError, 아니면 건너뜁니다.
+        score 가 None 이면 그 칸을 비웁니다.
+        """
+        applied = 0
+        for submission_id, reviewer, criterion, score in entries:
+            applicant = self._applicant_index.get(submission_id)
+            column = self._criterion_index.get(criterion)
+            problem = None
+            if applicant is None:
+                problem = f"이 회차에 없는 접수 번호: {submission_id}"
+            elif column is None:
+                problem = f"평가 항목이 아닙니다: {criterion}"
+            elif score is not None and not 0 <= float(score) <= self._max_scores[column]:
+                problem = f"{criterion} 점수는 0~{self._max_scores[column]:g} 이어야 합니다: {score}"
+            if problem:
+                if strict:
+                    raise ValueError(problem)
+                continue
+            row = self._reviewer(reviewer)  # 배열을 늘릴 수 있으므로 먼저 구합니다
+            self._scores[row, applicant, column] = np.nan if score is None else float(score)
+            applied += 1
+        return applied
+
+    def rank(self, weights=None, bias_correction=None, quotas=None):
+        """weights: {항목 키: 가중치} (지정한 항목만 바꿈), quotas: {참가 유형: 선정 인원}."""
+        weight_map = {criterion.key: criterion.weight for criterion in self.config.criteria} | (weights or {})
+        weight_vector = np.array([float(weight_map[key]) for key in self.config.keys])
+        if (weight_vector < 0).any() or weight_vector.sum() <= 0:
+            raise ValueError("가중치는 0 이상이고 합이 0 보다 커야 합니다")
+        quota_vector = np.array([int((quotas or {}).get(name, 0)) for name in self.participation_types], dtype=int)
+        return rank_scores(
+            self.scores, self._max_scores, weight_vector, self.type_codes, self.arrival, quota_vector,
+            tie_breakers=tuple(self._criterion_index[key] for key in self.config.tie_breakers),
+            bias_correction=bias_correction or self.config.bias_correction,
+            min_reviews=self.config.min_reviews,
+        )
+
+    def rows(self, ranking):
+        """참가 유형 → 순위 순으로 결과 행(dict)을 내보냅니다."""
+        for index in ranking.order:
+            yield {
+                "submission_id": self.submission_ids[index],
+                "participation_type": self.participation_types[self.type_codes[index]],
+                "company_name": self.company_names[index],
+                "rank": int(ranking.rank[index]) or "",
+                "score": "" if np.isnan(ranking.score[index]) else f"{ranking.score[index]:.2f}",
+                "reviews": int(ranking.reviews[index]),
+                "result": (RESULT_SELECTED if ranking.selected[index] else RESULT_NOT_SELECTED) if ranking.eligible[index] else "",
+            }
+
+
+def read_score_file(path, config):
+    """reviewer,submission_id,<항목 키>... CSV 를 (submission_id, reviewer, criterion, score) 로 풉니다. 빈 칸은 건너뜁니다."""
+    with open(path, newline="", encoding="utf-8-sig") as score_file:
+        for row in csv.DictReader(score_file):
+            reviewer, submission_id = (row.get("reviewer") or "").strip(), (row.get("submission_id") or "").strip().lower()
+            if not reviewer or not submission_id:
+                continue
+            for key in config.keys:
+                value = (row.get(key) or "").strip()
+                if value:
+                    yield submission_id, reviewer, key, float(value)
+
+
+def parse_pairs(items, convert):
+    pairs = {}
+    for item in items or ():
+        name, separator, value = item.partition("=")
+        if not separator:
+            raise argparse.ArgumentTypeError(f"이름=값 형식이 아닙니다: {item}")
+        pairs[name.strip()] = convert(value)
+    return pairs
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="심사 점수를 모아 참가 유형별 선정 순위를 계산합니다.")
+    parser.add_argument("command", choices=("import", "rank"))
+    parser.add_argument("paths", nargs="*", help="import: 점수 CSV 파일")
+    parser.add_argument("--round", type=int, required=True)
+    parser.add_argument("--db", default=str(DEFAULT_DB_PATH), help="접수 DB")
+    parser.add_argument("--review-db", default=str(REVIEW_DB_PATH))
+    parser.add_argument("--weight", action="append", metavar="KEY=WEIGHT", help="항목 가중치 변경 (여러 번 지정)")
+    parser.add_argument("--bias", choices=BIAS_CORRECTIONS, help="심사위원 편차 보정 방식")
+    parser.add_argument("--select", action="append", metavar="TYPE=N",
+                        help="참가 유형별 선정 인원 (기본값: events.json 의 회차 selection, 둘 다 없으면 오류)")
+    parser.add_argument("--out", help="순위 CSV (notifier.py --results 로 사용, '-' 는 표준 출력)")
+    args = parser.parse_intermixed_args()
+
+    config = read_review_config()
+    store = ReviewStore(args.review_db)
+    sheet = ScoreSheet.load(args.round, config, args.db, store if args.command == "rank" else None)
+    if args.command == "import":
+        for path in args.paths:
+            entries = list(read_score_file(path, config))
+            sheet.set_many(entries)  # 저장하기 전에 전부 검사합니다
+            store.put_many(args.round, entries)
+            print(f"{path}: 점수 {len(entries)}개 저장")
+        parser.exit(0)
+
+    quotas = dict(read_schedule(EVENTS_FILE).edition(args.round).selection) | parse_pairs(args.select, int)
+    missing = [participation_type for participation_type in sheet.participation_types if participation_type not in quotas]
+    if missing:
+        parser.error(f"선정 인원이 정해지지 않은 참가 유형: {', '.join(missing)} "
+                     "(--select 유형=인원 또는 content/events.json 의 selection 에 지정하세요)")
+    ranking = sheet.rank(parse_pairs(args.weight, float), args.bias, quotas)
+    rows = list(sheet.rows(ranking))
+    if args.out:
+        output = sys.stdout if args.out == "-" else open(args.out, "w", newline="", encoding="utf-8-sig")
+        try:
+            writer = csv.DictWriter(output, list(rows[0]) if rows else ["submission_id", "result"])
+            writer.writeheader()
+            writer.writerows(rows)
+        finally:
+            if output is not sys.stdout:
+                output.close()
+    if args.out != "-":
+        for participation_type in sheet.participation_types:
+            typed = [row for row in rows if row["participation_type"] == participation_type]
+            chosen = [row for row in typed if row["result"] == RESULT_SELECTED]
+            pending = sum(1 for row in typed if not row["result"])
+            print(f"[{participation_type}] 신청 {len(typed)}건 · 선정 {len(chosen)}/{quotas.get(participation_type, 0)}"
+                  + (f" · 심사 미완료 {pending}건" if pending else ""))
+            for row in chosen:
+                print(f"  {row['rank']:>3}. {row['company_name']} ({row['submission_id'][:12].upper()}) {row['score']}점 · 심사 {row['reviews']}")
@@ -0,0 +1,78 @@
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from urllib.parse import quote
+
+from asset_cache import ASSET_CACHE
+from precompress import precompress
+
+# --- 정적 자산 게시 ---
+# 로고·신청서 파일을 내용 해시가 붙은 파일명(예: mohw_logo.3f2a9c1b04de.png)으로 static/ 에 복사합니다.
+# 파일명이 내용과 함께 바뀌므로 브라우저/CDN 이 기간 제한 없이 캐시해도 안전하며,
+# static/ 은 Streamlit 정적 서빙(app/static/) 또는 asset_server.py 가 그대로 제공합니다.
+# TOOJAK_STATIC_DIR 로 게시 위치를 바꿀 수 있습니다 (export_static.py 가 내보내기 디렉터리로 지정).
+# 게시할 때 .br/.gz 변형도 함께 만들어 둡니다 (precompress.py).
+STATIC_DIR = Path(os.environ.get("TOOJAK_STATIC_DIR") or Path(__file__).resolve().parent / "static")
+HASH_LENGTH = 12
+
+# mkstemp 은 0600 으로 만들므로, 정적 서버·CDN 이 읽을 수 있게 고정 권한으로 바꿔 둡니다.
+# (umask 는 프로세스 전체 설정이라 서버 스레드가 도는 중에 바꿔 읽지 않습니다.)
+FILE_MODE = 0o644
+
+
+def content_hash(file_path):
+    """파일 내용의 sha256 (mtime/size 가 같으면 캐시된 값을 사용)."""
+    return ASSET_CACHE.get(file_path, "sha256", lambda path: hashlib.sha256(path.read_bytes()).hexdigest())
+
+
+def hashed_name(file_path):
+    path = Path(file_path)
+    digest = content_hash(path)
+    if digest is None:
+        return None
+    return f"{path.stem}.{digest[:HASH_LENGTH]}{path.suffix.lower()}"
+
+
+def write_atomic(target, data):
+    """같은 디렉터리의 임시 파일에 쓴 뒤 교체해, 서빙 중인 파일이 반쯤 쓰인 상태로 보이지 않게 합니다."""
+    target = Path(target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=target.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(data)
+            os.fchmod(tmp_file.fileno(), FILE_MODE)
+        os.replace(tmp_path, target)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def publish(file_path, static_dir=STATIC_DIR):
+    """파일을 static_dir 에 해시 파일명으로 게시하고 그 파일명을 돌려줍니다. 원본이 없으면 None."""
+    def copy(path):
+        name = hashed_name(path)
+        target = Path(static_dir) / name
+        if not target.is_file() or target.stat().st_size != path.stat().st_size:
+            write_atomic(target, path.read_bytes())
+        precompress(target)
+        return name
+    return ASSET_CACHE.get(file_path, ("published", str(static_dir)), copy)
+
+
+def published_url(file_path, base_url, static_dir=STATIC_DIR):
+    name = publish(file_path, static_dir)
+    if name is None:
+        return None
+    return base_url + quote(name)
+
+
+def publish_bytes(data, stem, suffix, static_dir=STATIC_DIR):
+    """빌드 단계에서 만든 결과물(CSS 등)을 해시 파일명으로 게시하고 그 파일명을 돌려줍니다."""
+    name = f"{stem}.{hashlib.sha256(data).hexdigest()[:HASH_LENGTH]}{suffix}"
+    target = Path(static_dir) / name
+    if not target.is_file():
+        write_atomic(target, data)
+    precompress(target)
+    return name
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# 모듈이 저장소 최상위에 나란히 있으므로 테스트에서 바로 가져올 수 있게 합니다.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,114 @@
+import threading
+import time
+from datetime import date
+
+import pytest
+
+import capacity
+from capacity import ALREADY_APPLIED, RESERVED, SEATS_FULL, CapacityTracker
+from events import Event
+from intake_store import normalize_business_number
+
+# --- capacity.py 선착순 정원 테스트 ---
+# 임시 DB 에 정원을 두고 자리 확보·마감·중복 신청·취소·오래된 예약 회수를 확인합니다.
+# 여러 트래커(서버 프로세스마다 하나)가 같은 DB 를 쓰는 경우도 스레드로 흉내 냅니다.
+IR, BOOTH = "IR 발표", "홍보테이블 운영"
+
+
+def event(capacity_map, round_number=2):
+    return Event(round=round_number, theme="테스트", date=date(2025, 8, 4), venue="대전", details="",
+                 capacity=tuple(capacity_map.items()))
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "intake.sqlite3"
+
+
+@pytest.fixture
+def tracker(db_path):
+    tracker = CapacityTracker(db_path, snapshot_ttl=0)
+    tracker.sync_limits([event({IR: 2})])
+    return tracker
+
+
+def business(index):
+    return f"123-45-{index:05d}"
+
+
+def test_reserve_until_full(tracker):
+    assert tracker.reserve(2, IR, "S0001", business(1)) == RESERVED
+    assert tracker.reserve(2, IR, "S0002", business(2)) == RESERVED
+    assert tracker.reserve(2, IR, "S0003", business(3)) == SEATS_FULL
+    assert tracker.remaining([event({IR: 2})]) == (((IR, 0, 2),),)
+    # 정원이 없는 유형은 막지 않습니다.
+    assert tracker.reserve(2, BOOTH, "S0004", business(4)) == RESERVED
+
+
+def test_same_business_number_once_per_round(tracker):
+    assert tracker.reserve(2, IR, "S0001", "123-45-00001") == RESERVED
+    assert tracker.reserve(2, BOOTH, "S0002", "1234500001") == ALREADY_APPLIED
+    assert tracker.reserve(3, IR, "S0003", "1234500001") == RESERVED
+    # 같은 접수 번호로 다시 부르면(재실행) 자리를 한 번 더 잡지 않습니다.
+    assert tracker.reserve(2, IR, "S0001", "123-45-00001") == RESERVED
+    assert tracker.remaining([event({IR: 2})]) == (((IR, 1, 2),),)
+
+
+def test_release_is_idempotent(tracker):
+    tracker.reserve(2, IR, "S0001", business(1))
+    tracker.reserve(2, IR, "S0002", business(2))
+    assert tracker.release("S0001") is True
+    assert tracker.release("S0001") is False
+    assert tracker.remaining([event({IR: 2})]) == (((IR, 1, 2),),)
+    assert tracker.reserve(2, IR, "S0003", business(1)) == RESERVED
+    assert tracker.reserve(2, IR, "S0004", business(4)) == SEATS_FULL
+
+
+def test_stale_reservations_are_reclaimed(tracker):
+    tracker.reserve(2, IR, "S0001", business(1))
+    tracker.reserve(2, IR, "S0002", business(2))
+    connection = tracker._connection()
+    connection.execute(
+        "INSERT INTO applications (submission_id, round, participation_type, company_name, business_number, representative, "
+        "contact_name, email, phone, privacy_consent, submitted_at) VALUES ('S0002', 2, ?, '기업', ?, '대표', '담당', "
+        "'a@example.com', '010', 1, '2025-07-01T00:00:00')",
+        (IR, normalize_business_number(business(2))),
+    )
+    old = time.time() - capacity.STALE_RESERVATION_SECONDS - 1
+    connection.execute("UPDATE reservations SET reserved_at = ?", (old,))
+
+    # 접수 기록이 없는 S0001 만 회수되고, 접수된 S0002 는 남습니다.
+    assert tracker.reserve(2, IR, "S0003", business(3)) == RESERVED
+    assert tracker.reserve(2, IR, "S0004", business(4)) == SEATS_FULL
+    remaining = {row[0] for row in connection.execute("SELECT submission_id FROM reservations")}
+    assert remaining == {"S0002", "S0003"}
+
+    connection.execute("UPDATE reservations SET reserved_at = ? WHERE submission_id = 'S0003'", (old,))
+    assert tracker.reconcile() == 1
+    assert tracker.remaining([event({IR: 2})]) == (((IR, 1, 2),),)
+
+
+def test_removed_limits_stop_applying(tracker):
+    tracker.reserve(2, IR, "S0001", business(1))
+    tracker.reserve(2, IR, "S0002", business(2))
+    tracker.sync_limits([event({})])
+    assert tracker.reserve(2, IR, "S0003", business(3)) == RESERVED
+
+
+def test_concurrent_trackers_never_oversell(db_path):
+    CapacityTracker(db_path).sync_limits([event({IR: 5})])
+    results = []
+
+    def apply(worker):
+        # 서버 프로세스마다 트래커가 따로 있는 상황입니다.
+        tracker = CapacityTracker(db_path)
+        for index in range(10):
+            results.append(tracker.reserve(2, IR, f"S{worker}-{index}", business(worker * 100 + index)))
+
+    threads = [threading.Thread(target=apply, args=(worker,)) for worker in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results.count(RESERVED) == 5
+    assert results.count(SEATS_FULL) == 35
@@ -0,0 +1,191 @@
+import asyncio
+import email
+import socketserver
+import sqlite3
+import threading
+
+import pytest
+
+from content_store import Contact
+from notifier import STATUS_FAILED, STATUS_SENT, Notice, SendLog, SmtpPool, send_notices
+
+# --- notifier.py 발송 경로 테스트 ---
+# 표준 라이브러리 socketserver 로 만든 SMTP 서버를 로컬 포트에 띄워, 연결 재사용·재시도·영구 실패·발송 기록을
+# 실제 smtplib 대화로 확인합니다. 수신자 주소로 서버 동작을 고릅니다.
+#   bad@...    550 (영구 거부)
+#   flaky@...  처음 FLAKY_FAILURES 번은 451 (일시 오류), 그다음부터 수락
+SENDER = "noreply@example.com"
+CONTACT = Contact(operator_name="운영 사무국", email="contact@example.com", phone="02-000-0000")
+FLAKY_FAILURES = 2
+
+
+class FakeSmtpHandler(socketserver.StreamRequestHandler):
+    def reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        server = self.server
+        with server.lock:
+            server.connections += 1
+        self.reply("220 fake.local ESMTP")
+        recipients, delivered_here = [], 0
+        while line := self.rfile.readline():
+            command = line.decode().strip()
+            verb = command[:4].upper()
+            if verb in ("EHLO", "HELO"):
+                self.reply("250-fake.local\r\n250 8BITMIME")
+            elif verb == "MAIL":
+                recipients = []
+                self.reply("250 ok")
+            elif verb == "RCPT":
+                address = command.partition(":")[2].strip().strip("<>")
+                code = server.recipient_code(address)
+                if code == 250:
+                    recipients.append(address)
+                self.reply(f"{code} {'ok' if code == 250 else 'rejected'}")
+            elif verb == "DATA":
+                self.reply("354 end with <CRLF>.<CRLF>")
+                lines = []
+                while (line := self.rfile.readline()) not in (b".\r\n", b""):
+                    lines.append(line)
+                message = email.message_from_bytes(b"".join(lines))
+                with server.lock:
+                    server.delivered.extend((address, message["Message-ID"]) for address in recipients)
+                self.reply("250 queued")
+                delivered_here += 1
+                if server.close_after and delivered_here >= server.close_after:
+                    return  # 인사 없이 연결을 닫습니다 (쉬는 연결을 서버가 끊은 상황)
+            elif verb in ("RSET", "NOOP"):
+                self.reply("250 ok")
+            elif verb == "QUIT":
+                self.reply("221 bye")
+                return
+            else:
+                self.reply("502 not implemented")
+
+
+class FakeSmtpServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, close_after=0):
+        super().__init__(("127.0.0.1", 0), FakeSmtpHandler)
+        self.close_after = close_after
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.delivered = []
+        self._flaky = {}
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    def recipient_code(self, address):
+        if address.startswith("bad"):
+            return 550
+        if address.startswith("flaky"):
+            with self.lock:
+                self._flaky[address] = self._flaky.get(address, 0) + 1
+                return 451 if self._flaky[address] <= FLAKY_FAILURES else 250
+        return 250
+
+
+@pytest.fixture
+def smtp_server(request):
+    server = FakeSmtpServer(**getattr(request, "param", {}))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def send_log(tmp_path):
+    connection = sqlite3.connect(tmp_path / "notifications.sqlite3")
+    yield SendLog(connection)
+    connection.close()
+
+
+def notices_for(addresses):
+    return [Notice(f"S{index:04d}", "selected", address, f"제목 {index}", "본문") for index, address in enumerate(addresses)]
+
+
+def run(notices, server, log, campaign="test", size=2, max_attempts=4):
+    pool = SmtpPool("127.0.0.1", server.port, size=size, starttls=False, username=None, password=None, timeout=5)
+    counts = asyncio.run(send_notices(notices, pool, log, campaign, SENDER, CONTACT, max_attempts, base_delay=0.001))
+    return counts, pool
+
+
+def statuses(log, campaign="test"):
+    rows = log._connection.execute(
+        "SELECT submission_id, status, attempts FROM notifications WHERE campaign = ? ORDER BY submission_id", (campaign,)
+    )
+    return {submission_id: (status, attempts) for submission_id, status, attempts in rows}
+
+
+def test_pool_reuses_connections(smtp_server, send_log):
+    notices = notices_for(f"user{index}@example.com" for index in range(20))
+    counts, pool = run(send_log.plan("test", notices), smtp_server, send_log, size=3)
+
+    assert counts == {STATUS_SENT: 20, STATUS_FAILED: 0}
+    assert pool.opened == smtp_server.connections <= 3
+    assert sorted(address for address, _ in smtp_server.delivered) == sorted(notice.email for notice in notices)
+    assert set(statuses(send_log).values()) == {(STATUS_SENT, 1)}
+
+
+def test_transient_errors_retry_and_permanent_errors_fail_once(smtp_server, send_log):
+    notices = notices_for(["flaky@example.com", "bad@example.com", "ok@example.com"])
+    counts, _ = run(send_log.plan("test", notices), smtp_server, send_log)
+
+    assert counts == {STATUS_SENT: 2, STATUS_FAILED: 1}
+    assert statuses(send_log) == {
+        "S0000": (STATUS_SENT, FLAKY_FAILURES + 1),
+        "S0001": (STATUS_FAILED, 1),
+        "S0002": (STATUS_SENT, 1),
+    }
+    assert [address for address, _ in smtp_server.delivered].count("flaky@example.com") == 1
+
+
+def test_transient_errors_give_up_after_max_attempts(smtp_server, send_log):
+    notices = notices_for(["flaky@example.com"])
+    counts, _ = run(send_log.plan("test", notices), smtp_server, send_log, max_attempts=FLAKY_FAILURES)
+
+    assert counts == {STATUS_SENT: 0, STATUS_FAILED: 1}
+    assert statuses(send_log) == {"S0000": (STATUS_FAILED, FLAKY_FAILURES)}
+    assert smtp_server.delivered == []
+
+
+@pytest.mark.parametrize("smtp_server", [{"close_after": 1}], indirect=True)
+def test_reopens_connection_closed_by_server(smtp_server, send_log):
+    # 서버가 메일마다 연결을 닫아도 재시도로 세지 않고 새 연결로 바로 보냅니다.
+    notices = notices_for(f"user{index}@example.com" for index in range(6))
+    counts, pool = run(send_log.plan("test", notices), smtp_server, send_log, size=2)
+
+    assert counts == {STATUS_SENT: 6, STATUS_FAILED: 0}
+    assert len(smtp_server.delivered) == 6
+    assert pool.opened == smtp_server.connections == 6
+    assert set(statuses(send_log).values()) == {(STATUS_SENT, 1)}
+
+
+def test_send_log_resends_only_unsent_notices(smtp_server, send_log):
+    notices = notices_for(["ok@example.com", "bad@example.com", "flaky@example.com"])
+    run(send_log.plan("test", notices), smtp_server, send_log, max_attempts=1)
+    assert statuses(send_log) == {
+        "S0000": (STATUS_SENT, 1), "S0001": (STATUS_FAILED, 1), "S0002": (STATUS_FAILED, 1),
+    }
+
+    # 같은 캠페인으로 다시 실행하면 보낸 건은 건너뛰고, 실패한 건만 다시 보냅니다.
+    pending = send_log.plan("test", notices)
+    assert [notice.submission_id for notice in pending] == ["S0001", "S0002"]
+    counts, _ = run(pending, smtp_server, send_log)
+    assert counts == {STATUS_SENT: 1, STATUS_FAILED: 1}
+    assert statuses(send_log) == {
+        "S0000": (STATUS_SENT, 1), "S0001": (STATUS_FAILED, 2), "S0002": (STATUS_SENT, 1 + FLAKY_FAILURES),
+    }
+    assert [address for address, _ in smtp_server.delivered].count("ok@example.com") == 1
+
+    # 모두 끝난 뒤에는 보낼 것이 없고, 다른 캠페인 이름은 따로 기록합니다.
+    assert [notice.submission_id for notice in send_log.plan("test", notices)] == ["S0001"]
+    assert len(send_log.plan("other", notices)) == 3
+    assert send_log.summary("test") == {STATUS_SENT: 2, STATUS_FAILED: 1}
@@ -0,0 +1,172 @@
+import argparse
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+# --- 제출 서류 업로드 저장 ---
+# 업로드된 파일을 1MB 단위로 읽어 디스크의 임시 파일에 쓰면서 sha256 을 함께 계산하고, 끝나면 내용 해시 경로
+# (objects/ab/abcdef...)로 옮깁니다. 파일 전체를 메모리에 다시 담지 않으며, 같은 내용은 한 번만 저장됩니다.
+# - 파일당 MAX_FILE_BYTES, 세션당 MAX_SESSION_BYTES 를 넘으면 쓰는 도중 중단하고 임시 파일을 지웁니다.
+#   세션 사용량은 지금 폼에 첨부된 파일만 셉니다. 같은 서류를 다시 올리거나 제출이 거절되면 discard() 로 빼 줍니다.
+# - 중단된 업로드의 임시 파일은 다음 시작 시 cleanup_stale_temp() 가 정리합니다.
+# - 같은 내용을 여러 신청이 함께 쓰므로 거절된 파일을 바로 지우지 않고, sweep_unreferenced() 가 접수 기록
+#   (attachments)에 없고 STALE_OBJECT_SECONDS 동안 다시 올라오지 않은 objects/ 파일을 지웁니다.
+# 저장 위치는 TOOJAK_UPLOAD_DIR (기본값: data/uploads) 입니다.
+# Streamlit 은 업로드를 server.maxUploadSize(MB) 까지만 받으므로 .streamlit/config.toml 의 값과 MAX_FILE_BYTES 를 맞춥니다.
+BASE_DIR = Path(__file__).resolve().parent
+UPLOAD_DIR = Path(os.environ.get("TOOJAK_UPLOAD_DIR") or BASE_DIR / "data" / "uploads")
+CHUNK_SIZE = 1024 * 1024
+MAX_FILE_BYTES = 50 * 1024 * 1024
+MAX_SESSION_BYTES = 120 * 1024 * 1024
+STALE_TEMP_SECONDS = 60 * 60
+STALE_OBJECT_SECONDS = 24 * 60 * 60  # 작성 중인 폼과 아직 기록되지 않은 접수 큐가 쓰는 파일을 지우지 않도록 넉넉히 둡니다
+
+# 서류 종류 -> (표시 이름, 허용 확장자)
+DOCUMENT_KINDS = {
+    "application_form": ("참가신청서 및 개인정보 동의서", ("hwp", "hwpx", "pdf")),
+    "ir_deck": ("기업 IR 자료 (PDF)", ("pdf",)),
+    "business_registration": ("사업자등록증 사본", ("pdf", "jpg", "jpeg", "png")),
+}
+
+
+class UploadRejected(Exception):
+    """업로드가 크기 제한이나 형식 조건을 만족하지 않습니다."""
+
+
+@dataclass(frozen=True)
+class StoredFile:
+    kind: str
+    file_name: str
+    sha256: str
+    size: int
+    path: Path
+
+
+def object_path(sha256, upload_dir=UPLOAD_DIR):
+    return Path(upload_dir) / "objects" / sha256[:2] / sha256
+
+
+def spool(source, max_bytes=MAX_FILE_BYTES, upload_dir=UPLOAD_DIR):
+    """파일 객체를 조각 단위로 디스크에 옮기며 해시를 계산합니다. (sha256, 크기, 경로)를 돌려줍니다."""
+    tmp_dir = Path(upload_dir) / "tmp"
+    tmp_dir.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=tmp_dir, prefix="upload-")
+    digest, size = hashlib.sha256(), 0
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            while chunk := source.read(CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadRejected(f"파일 크기가 제한({max_bytes // (1024 * 1024)}MB)을 넘습니다")
+                digest.update(chunk)
+                tmp_file.write(chunk)
+        sha256 = digest.hexdigest()
+        target = object_path(sha256, upload_dir)
+        if target.is_file() and target.stat().st_size == size:
+            os.utime(target)  # 다시 쓰이는 파일이므로 sweep 대상에서 빠지도록 시각을 갱신합니다
+            return sha256, size, target  # 이미 저장된 내용 — 임시 파일은 finally 에서 지웁니다
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(tmp_path, target)
+        return sha256, size, target
+    finally:
+        Path(tmp_path).unlink(missing_ok=True)
+
+
+def cleanup_stale_temp(upload_dir=UPLOAD_DIR, max_age=STALE_TEMP_SECONDS):
+    """비정상 종료로 남은 오래된 임시 파일을 지웁니다."""
+    cutoff = time.time() - max_age
+    removed = 0
+    for path in (Path(upload_dir) / "tmp").glob("upload-*"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+                removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+def sweep_unreferenced(db_path=None, upload_dir=UPLOAD_DIR, max_age=STALE_OBJECT_SECONDS):
+    """접수 기록에 없는 오래된 objects/ 파일을 지우고 지운 (파일 수, 바이트)를 돌려줍니다."""
+    from intake_store import DEFAULT_DB_PATH, connect
+
+    connection = connect(db_path or DEFAULT_DB_PATH)
+    try:
+        referenced = {sha256 for (sha256,) in connection.execute("SELECT DISTINCT sha256 FROM attachments")}
+    finally:
+        connection.close()
+    cutoff = time.time() - max_age
+    removed, removed_bytes = 0, 0
+    for path in (Path(upload_dir) / "objects").glob("*/*"):
+        if path.name in referenced:
+            continue
+        try:
+            stat = path.stat()
+            if stat.st_mtime < cutoff:
+                path.unlink()
+                removed, removed_bytes = removed + 1, removed_bytes + stat.st_size
+        except OSError:
+            pass
+    return removed, removed_bytes
+
+
+class UploadSession:
+    """한 세션의 폼에 첨부된 서류(종류마다 하나)와 사용량. 같은 내용은 세션 사용량에 한 번만 계산합니다."""
+
+    def __init__(self, max_bytes=MAX_SESSION_BYTES, max_file_bytes=MAX_FILE_BYTES, upload_dir=UPLOAD_DIR):
+        self.max_bytes = max_bytes
+        self.max_file_bytes = max_file_bytes
+        self.upload_dir = upload_dir
+        self._attached = {}  # 서류 종류 -> StoredFile
+        self._lock = threading.Lock()
+
+    @property
+    def used_bytes(self):
+        return sum({stored.sha256: stored.size for stored in self._attached.values()}.values())
+
+    def store(self, kind, uploaded_file):
+        """st.file_uploader 의 UploadedFile(또는 name 속성이 있는 파일 객체)을 저장합니다.
+        같은 종류의 서류가 이미 첨부되어 있으면 새 파일로 바꿉니다 (거절되어도 이전 파일은 빠집니다)."""
+        label, extensions = DOCUMENT_KINDS[kind]
+        file_name = Path(uploaded_file.name).name
+        with self._lock:
+            self._attached.pop(kind, None)
+            if file_name.rsplit(".", 1)[-1].lower() not in extensions:
+                raise UploadRejected(f"{label}: {', '.join(extensions)} 파일만 올릴 수 있습니다")
+            remaining = self.max_bytes - self.used_bytes
+            declared = getattr(uploaded_file, "size", None)
+            limit = min(self.max_file_bytes, remaining)
+            if declared is not None and declared > limit:
+                raise UploadRejected(f"{label}: {self._limit_message(limit)}")
+            uploaded_file.seek(0)
+            try:
+                sha256, size, path = spool(uploaded_file, limit, self.upload_dir)
+            except UploadRejected:
+                raise UploadRejected(f"{label}: {self._limit_message(limit)}") from None
+            stored = self._attached[kind] = StoredFile(kind, file_name, sha256, size, path)
+        return stored
+
+    def discard(self, kind=None):
+        """첨부를 세션 사용량에서 뺍니다 (kind 가 없으면 전부). 파일은 sweep_unreferenced() 가 정리합니다."""
+        with self._lock:
+            if kind is None:
+                self._attached.clear()
+            else:
+                self._attached.pop(kind, None)
+
+    def _limit_message(self, limit):
+        if limit < self.max_file_bytes:
+            return f"세션당 업로드 한도({self.max_bytes // (1024 * 1024)}MB)를 넘습니다"
+        return f"파일 크기가 제한({self.max_file_bytes // (1024 * 1024)}MB)을 넘습니다"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="접수 기록에 없는 오래된 업로드 파일을 지웁니다.")
+    parser.add_argument("--max-age-hours", type=float, default=STALE_OBJECT_SECONDS / 3600)
+    args = parser.parse_args()
+    removed, removed_bytes = sweep_unreferenced(max_age=args.max_age_hours * 3600)
+    print(f"{removed}개 파일 ({removed_bytes / 1024 / 1024:.1f}MB)을 지웠습니다.")